@@ -0,0 +1,226 @@
+"""Local stand-in for https://api.sleeper.app/v1 serving synthetic, realistically shaped payloads.
+
+Latency, jitter and an error rate (500/429) are injected per request so the
+client's retry, rate-limit and cache paths are exercised as they would be live.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass, field
+
+from aiohttp import web
+
+NFL_TEAMS = (
+    "ARI ATL BAL BUF CAR CHI CIN CLE DAL DEN DET GB HOU IND JAX KC "
+    "LAC LAR LV MIA MIN NE NO NYG NYJ PHI PIT SEA SF TB TEN WAS"
+).split()
+POSITIONS = ("QB", "RB", "WR", "TE", "K")
+POSITION_WEIGHTS = (0.12, 0.25, 0.35, 0.18, 0.10)
+FIRST = (
+    "Aaron Brandon Caleb Derrick Elijah Frank Garrett Hunter Isaiah Jalen"
+    " Kyle Lamar Marcus Nick Omar Patrick Quinn Russell Sam Tyreek"
+).split()
+LAST = (
+    "Allen Brown Carter Davis Evans Fields Green Hill Irving Jackson"
+    " Kelce Lewis Moore Nelson Owens Parker Reed Smith Taylor Walker"
+).split()
+ROSTER_POSITIONS = ["QB", "RB", "RB", "WR", "WR", "TE", "FLEX", "K", "DEF"] + ["BN"] * 7
+
+
+def make_players(n: int, rng: random.Random) -> dict[str, dict]:
+    """Roughly Sleeper-sized player records (the real payload is ~11k players, several MB)."""
+    players: dict[str, dict] = {}
+    for team in NFL_TEAMS:
+        players[team] = {
+            "player_id": team, "first_name": team, "last_name": "Defense", "position": "DEF",
+            "fantasy_positions": ["DEF"], "team": team, "active": True, "sport": "nfl",
+        }
+    for i in range(max(0, n - len(players))):
+        pid = str(1000 + i)
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        pos = rng.choices(POSITIONS, POSITION_WEIGHTS)[0]
+        rostered = i < n // 3
+        players[pid] = {
+            "player_id": pid, "first_name": first, "last_name": last,
+            "full_name": f"{first} {last}", "search_full_name": f"{first}{last}".lower(),
+            "position": pos, "fantasy_positions": [pos],
+            "team": rng.choice(NFL_TEAMS) if rostered else None,
+            "status": "Active" if rostered else "Inactive",
+            "injury_status": rng.choice([None] * 8 + ["Questionable", "Out"]), "active": rostered,
+            "age": rng.randint(21, 36), "years_exp": rng.randint(0, 14),
+            "search_rank": i + 1 if rostered else 9999999,
+            "college": rng.choice(["Alabama", "Ohio State", "Georgia", "LSU", "USC"]),
+            "height": str(rng.randint(68, 78)), "weight": str(rng.randint(180, 320)),
+            "number": rng.randint(1, 99), "depth_chart_order": rng.randint(1, 4), "sport": "nfl",
+            "espn_id": rng.randint(10**6, 10**7), "yahoo_id": rng.randint(10**4, 10**5),
+            "hashtag": f"#{first}{last}-NFL-{pos}".lower(),
+            "metadata": {"channel_id": str(rng.getrandbits(60))},
+        }
+    return players
+
+
+def _make_transaction(
+    rng: random.Random, week: int, k: int, teams: int, pool: list[str], current_week: int
+) -> dict:
+    rid = rng.randint(1, teams)
+    return {
+        "transaction_id": f"{week}{k:04d}", "type": rng.choice(["waiver", "free_agent"]),
+        "status": "complete", "leg": week, "roster_ids": [rid],
+        "adds": {rng.choice(pool): rid}, "drops": {rng.choice(pool): rid}, "draft_picks": [],
+        "waiver_budget": [], "settings": {"waiver_bid": rng.randint(0, 40)},
+        "created": int((time.time() - (current_week - week) * 7 * 86400) * 1000),
+    }
+
+
+@dataclass
+class FakeLeague:
+    league_id: str
+    season: str
+    current_week: int
+    league: dict
+    users: list
+    rosters: list
+    matchups: dict[int, list] = field(default_factory=dict)
+    transactions: dict[int, list] = field(default_factory=dict)
+
+
+def make_league(players: dict[str, dict], teams: int = 12, current_week: int = 8, seed: int = 0,
+                league_id: str = "1000000000000000001", season: str = "2025") -> FakeLeague:
+    rng = random.Random(seed)
+    pool = [pid for pid, p in players.items() if p.get("team")]
+    rng.shuffle(pool)
+    per_team = len(ROSTER_POSITIONS)
+    users = [
+        {"user_id": str(500 + i), "display_name": f"{rng.choice(FIRST)}{rng.choice(LAST)}{i}",
+         "metadata": {"team_name": f"Team {i + 1}"}, "avatar": None}
+        for i in range(teams)
+    ]
+    rosters = []
+    for i in range(teams):
+        owned = pool[i * per_team:(i + 1) * per_team]
+        rosters.append({
+            "roster_id": i + 1, "owner_id": users[i]["user_id"], "league_id": league_id,
+            "players": owned, "starters": owned[:9], "reserve": [], "taxi": None,
+            "settings": {"wins": 0, "losses": 0, "ties": 0, "fpts": 0, "fpts_decimal": 0,
+                         "fpts_against": 0, "fpts_against_decimal": 0, "waiver_position": i + 1},
+        })
+
+    fl = FakeLeague(league_id, season, current_week, {}, users, rosters)
+    totals = {r["roster_id"]: [0.0, 0.0] for r in rosters}
+    for week in range(1, current_week + 1):
+        order = [r["roster_id"] for r in rosters]
+        rng.shuffle(order)
+        entries = []
+        for m, (a, b) in enumerate(zip(order[::2], order[1::2], strict=False), start=1):
+            pa = round(rng.gauss(115, 22) * (1 if week < current_week else rng.random()), 2)
+            pb = round(rng.gauss(115, 22) * (1 if week < current_week else rng.random()), 2)
+            for rid, pts, opp in ((a, pa, pb), (b, pb, pa)):
+                r = rosters[rid - 1]
+                starters = r["starters"]
+                entries.append({
+                    "roster_id": rid, "matchup_id": m, "points": pts, "custom_points": None,
+                    "starters": starters, "players": r["players"],
+                    "starters_points": [round(pts / len(starters), 2)] * len(starters),
+                    "players_points": {pid: round(rng.random() * 25, 2) for pid in r["players"]},
+                })
+                if week < current_week:
+                    s = r["settings"]
+                    s["wins" if pts > opp else "losses" if pts < opp else "ties"] += 1
+                    totals[rid][0] += pts
+                    totals[rid][1] += opp
+        fl.matchups[week] = entries
+        fl.transactions[week] = [_make_transaction(rng, week, k, teams, pool, current_week)
+                                 for k in range(rng.randint(3, 10))]
+    for r in rosters:
+        pf, pa = totals[r["roster_id"]]
+        r["settings"].update(fpts=int(pf), fpts_decimal=round(pf % 1 * 100), fpts_against=int(pa),
+                             fpts_against_decimal=round(pa % 1 * 100))
+    fl.league = {
+        "league_id": league_id, "name": "Benchmark League", "season": season, "status": "in_season",
+        "total_rosters": teams, "roster_positions": ROSTER_POSITIONS,
+        "settings": {"playoff_week_start": 15, "playoff_teams": 6, "num_teams": teams},
+        "scoring_settings": {"pass_td": 4, "rec": 1, "rush_yd": 0.1},
+    }
+    return fl
+
+
+class FakeSleeper:
+    """aiohttp app serving one FakeLeague plus /players/nfl and /state/nfl."""
+
+    def __init__(self, league: FakeLeague, players: dict[str, dict], latency_ms: float = 0,
+                 jitter_ms: float = 0, error_rate: float = 0.0, seed: int = 0):
+        self.league = league
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.players_body = json.dumps(players).encode()
+        self.players_etag = '"' + hashlib.sha1(self.players_body).hexdigest() + '"'
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        self.requests += 1
+        delay = self.latency + self.rng.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.errors += 1
+            status = self.rng.choice((500, 502, 429))
+            return web.json_response(
+                {"error": "injected"}, status=status, headers={"Retry-After": "0"}
+            )
+        return await handler(request)
+
+    def _app(self) -> web.Application:
+        fl = self.league
+        lid = fl.league_id
+
+        def json_of(value):
+            async def handle(_request):
+                return web.json_response(value)
+            return handle
+
+        def weekly(table: dict[int, list]):
+            async def handle(request):
+                return web.json_response(table.get(int(request.match_info["week"]), []))
+            return handle
+
+        async def players(request):
+            if request.headers.get("If-None-Match") == self.players_etag:
+                return web.Response(status=304)
+            return web.Response(body=self.players_body, content_type="application/json",
+                                headers={"ETag": self.players_etag})
+
+        state = {"season": fl.season, "week": fl.current_week, "display_week": fl.current_week,
+                 "season_type": "regular", "leg": fl.current_week}
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_get("/v1/state/nfl", json_of(state))
+        app.router.add_get(f"/v1/league/{lid}", json_of(fl.league))
+        app.router.add_get(f"/v1/league/{lid}/users", json_of(fl.users))
+        app.router.add_get(f"/v1/league/{lid}/rosters", json_of(fl.rosters))
+        app.router.add_get(f"/v1/league/{lid}/matchups/{{week}}", weekly(fl.matchups))
+        app.router.add_get(f"/v1/league/{lid}/transactions/{{week}}", weekly(fl.transactions))
+        app.router.add_get("/v1/players/nfl", players)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound}/v1"
+        return self.base_url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
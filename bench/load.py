@@ -0,0 +1,273 @@
+"""Concurrent-interaction load test for the slash-command handlers, with no Discord connection.
+
+    python -m bench.load --interactions 400 --ramp 2
+    python -m bench.load --commands standings --latency 120 --error-rate 0.02
+
+Fake interactions are fed straight into the bot.tree command callbacks while
+the fake Sleeper server answers upstream calls. The report gives p50/p95/p99
+time to defer (Discord's 3 s deadline) and to the first followup, plus event
+loop lag. It also lists callbacks that held the loop longer than --slow-ms
+(asyncio debug mode), which is how blocking work shows up.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from loguru import logger  # noqa: E402
+
+from bench.run import add_server_args, start_fake_sleeper  # noqa: E402
+
+DEFER_DEADLINE = 3.0  # Discord invalidates an interaction not acknowledged within 3 s
+COMMANDS = ("schedule", "results", "standings", "league")
+
+
+@dataclass
+class Trace:
+    command: str
+    started: float = 0.0
+    deferred: float | None = None
+    followed: float | None = None
+    error: str | None = None
+
+
+class FakeResponse:
+    def __init__(self, trace: Trace):
+        self._trace = trace
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    def _ack(self) -> None:
+        if self._done:
+            raise RuntimeError("interaction already responded to")
+        self._done = True
+        self._trace.deferred = time.perf_counter()
+
+    async def defer(self, *, thinking: bool = False, ephemeral: bool = False) -> None:
+        self._ack()
+
+    async def send_message(self, *args, **kwargs) -> None:
+        self._ack()
+        self._trace.followed = self._trace.deferred
+
+
+class FakeFollowup:
+    def __init__(self, trace: Trace):
+        self._trace = trace
+
+    async def send(self, *args, **kwargs):
+        if self._trace.followed is None:
+            self._trace.followed = time.perf_counter()
+        return SimpleNamespace(id=0, jump_url="")
+
+
+class FakeInteraction:
+    """The slice of discord.Interaction the command callbacks touch."""
+
+    def __init__(self, trace: Trace, guild_id: int, user_id: int):
+        self.guild_id = guild_id
+        self.guild = SimpleNamespace(
+            id=guild_id, name=f"Guild {guild_id}",
+            get_channel=lambda _id: None, get_role=lambda _id: None,
+        )
+        self.user = SimpleNamespace(id=user_id)
+        self.response = FakeResponse(trace)
+        self.followup = FakeFollowup(trace)
+
+
+class LagMonitor:
+    """Samples how late a short periodic sleep wakes up: the event loop's scheduling lag."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            t0 = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - t0 - self.interval))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class SlowCallbacks(logging.Handler):
+    """Collects asyncio debug-mode 'Executing <…> took N seconds' warnings."""
+
+    _PATTERN = re.compile(r"Executing (.+?) took ([\d.]+) seconds")
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        self.hits: dict[str, list[float]] = defaultdict(list)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        m = self._PATTERN.search(record.getMessage())
+        if m:
+            where = re.sub(r" at 0x[0-9a-f]+|<Task pending name='[^']+'", "", m.group(1))
+            self.hits[where[:160]].append(float(m.group(2)))
+
+
+@dataclass
+class LoadResult:
+    traces: list[Trace] = field(default_factory=list)
+    lag: list[float] = field(default_factory=list)
+    slow: dict[str, list[float]] = field(default_factory=dict)
+    wall: float = 0.0
+
+
+def _pct(values: list[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def drive(args: argparse.Namespace) -> LoadResult:
+    server = await start_fake_sleeper(args)
+
+    import bot
+    from client import close_client
+    from config import BotConfig
+
+    lid = server.league.league_id
+    for gid in range(1, args.guilds + 1):
+        bot.CONFIGS[gid] = BotConfig(league_id=lid)
+
+    loop = asyncio.get_running_loop()
+    loop.set_debug(True)
+    loop.slow_callback_duration = args.slow_ms / 1000
+    slow = SlowCallbacks()
+    logging.getLogger("asyncio").addHandler(slow)
+
+    rng = random.Random(args.seed)
+    commands = [c.strip() for c in args.commands.split(",") if c.strip()]
+    callbacks = {name: bot.bot.tree.get_command(name).callback for name in commands}
+    result = LoadResult()
+    monitor = LagMonitor()
+
+    async def one(i: int) -> None:
+        await asyncio.sleep(rng.uniform(0, args.ramp))
+        name = commands[i % len(commands)]
+        trace = Trace(name)
+        result.traces.append(trace)
+        interaction = FakeInteraction(trace, guild_id=1 + i % args.guilds, user_id=10_000 + i)
+        trace.started = time.perf_counter()
+        try:
+            await callbacks[name](interaction)
+        except Exception as ex:  # a failing handler is a finding, not a harness crash
+            trace.error = f"{type(ex).__name__}: {ex}"
+
+    monitor.start()
+    t0 = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i) for i in range(args.interactions)))
+    finally:
+        result.wall = time.perf_counter() - t0
+        await monitor.stop()
+        logging.getLogger("asyncio").removeHandler(slow)
+        await close_client()
+        await server.stop()
+    result.lag = monitor.samples
+    result.slow = dict(slow.hits)
+    return result
+
+
+def format_report(result: LoadResult, args: argparse.Namespace) -> str:
+    def ms(v: float) -> str:
+        return f"{v * 1000:9.1f}"
+
+    header = (
+        f"{'command':<12}{'n':>6}{'err':>5}"
+        f"{'defer p50':>11}{'p95':>9}{'p99':>9}{'follow p50':>12}{'p95':>9}{'p99':>9}"
+    )
+    lines = [
+        f"Load: {args.interactions} interactions over {args.ramp}s across {args.guilds} guild(s); "
+        f"Sleeper latency {args.latency}ms ±{args.jitter}ms, error rate {args.error_rate:.1%}",
+        f"wall {result.wall:.2f}s",
+        "",
+        header,
+    ]
+    groups: dict[str, list[Trace]] = defaultdict(list)
+    for t in result.traces:
+        groups[t.command].append(t)
+    groups["ALL"] = list(result.traces)
+    for name, traces in groups.items():
+        defer = [t.deferred - t.started for t in traces if t.deferred is not None]
+        follow = [t.followed - t.started for t in traces if t.followed is not None]
+        errors = sum(1 for t in traces if t.error)
+        lines.append(
+            f"{name:<12}{len(traces):>6}{errors:>5}"
+            f"{ms(_pct(defer, .5)):>11}{ms(_pct(defer, .95))}{ms(_pct(defer, .99))}"
+            f"{ms(_pct(follow, .5)):>12}{ms(_pct(follow, .95))}{ms(_pct(follow, .99))}"
+        )
+    late = sum(
+        1 for t in result.traces if t.deferred is None or t.deferred - t.started > DEFER_DEADLINE
+    )
+    lines += [
+        "",
+        f"defer deadline ({DEFER_DEADLINE:.0f}s) missed: {late}",
+        f"event-loop lag ms: p50 {_pct(result.lag, .5) * 1000:.1f}  "
+        f"p99 {_pct(result.lag, .99) * 1000:.1f}  "
+        f"max {max(result.lag, default=0) * 1000:.1f}  ({len(result.lag)} samples)",
+    ]
+    errors = Counter(t.error for t in result.traces if t.error)
+    if errors:
+        lines += ["", "errors:"] + [f"  {n}× {e}" for e, n in errors.most_common(5)]
+    if result.slow:
+        lines += ["", f"callbacks blocking the loop > {args.slow_ms:g}ms:"]
+        worst = sorted(result.slow.items(), key=lambda kv: -max(kv[1]))[:10]
+        lines += [f"  {len(v)}× max {max(v) * 1000:.0f}ms  {where}" for where, v in worst]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    add_server_args(parser)
+    parser.add_argument("--interactions", type=int, default=400)
+    parser.add_argument("--ramp", type=float, default=2.0,
+                        help="spread arrivals over this many seconds")
+    parser.add_argument("--guilds", type=int, default=20, help="guilds sharing the fake league")
+    parser.add_argument("--commands", default=",".join(COMMANDS),
+                        help="comma-separated command names")
+    parser.add_argument("--slow-ms", type=float, default=50,
+                        help="report callbacks holding the loop longer")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args(argv)
+    output = os.path.abspath(args.output) if args.output else None
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+
+    report = format_report(asyncio.run(drive(args)), args)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(report)
+    print(report, end="")
+
+
+if __name__ == "__main__":
+    main()
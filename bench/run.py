@@ -0,0 +1,279 @@
+"""Offline benchmarks against the local fake Sleeper server.
+
+    python -m bench.run                      # defaults: 30ms latency, no errors
+    python -m bench.run --latency 80 --jitter 40 --error-rate 0.02 --iterations 50
+
+Writes a readable table to bench_output.txt and appends a JSON record to
+bench_results.jsonl; each run is compared with the last one that used the same
+parameters so regressions show up as percentage deltas.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from loguru import logger  # noqa: E402
+
+from bench.fake_sleeper import FakeSleeper, make_league, make_players  # noqa: E402
+
+
+def _summary(samples: list[float], elapsed: float) -> dict:
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "n": len(samples),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 3),
+        "p50_ms": round(pick(0.50) * 1000, 3),
+        "p95_ms": round(pick(0.95) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "ops_per_s": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+async def _measure(fn: Callable[[], Awaitable[object]], iterations: int,
+                   before: Callable[[], None] | None = None) -> dict:
+    """Run fn sequentially; `before` (untimed) resets state between iterations."""
+    samples = []
+    total = 0.0
+    for _ in range(iterations):
+        if before is not None:
+            before()
+        t0 = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - t0)
+        total += samples[-1]
+    return _summary(samples, total)
+
+
+async def _measure_concurrent(fn: Callable[[], Awaitable[object]], concurrency: int,
+                              before: Callable[[], None] | None = None) -> dict:
+    if before is not None:
+        before()
+    samples: list[float] = []
+
+    async def one():
+        t0 = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(concurrency)))
+    return _summary(samples, time.perf_counter() - t0)
+
+
+def add_server_args(parser: argparse.ArgumentParser) -> None:
+    """Options shared by every harness that runs against the fake server."""
+    parser.add_argument("--latency", type=float, default=30,
+                        help="fake Sleeper latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=10,
+                        help="extra random latency, 0..jitter (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="fraction of requests answered 5xx/429")
+    parser.add_argument("--players", type=int, default=11000, help="size of /players/nfl")
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--week", type=int, default=8, help="current NFL week of the fake season")
+    parser.add_argument("--rate-limit", action="store_true",
+                        help="keep the client-side Sleeper rate limit")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--log-level", default="WARNING", help="bot log level while benchmarking")
+
+
+async def start_fake_sleeper(args: argparse.Namespace) -> FakeSleeper:
+    """Start the fake server and point the bot at it, with on-disk state in a temp dir.
+
+    Must run before the bot modules are imported: they read their settings at import.
+    """
+    rng = random.Random(args.seed)
+    players = make_players(args.players, rng)
+    league = make_league(players, teams=args.teams, current_week=args.week, seed=args.seed)
+    server = FakeSleeper(league, players, args.latency, args.jitter, args.error_rate, args.seed)
+    os.environ["SLEEPER_BASE_URL"] = await server.start()
+    os.environ.setdefault("METRICS_PORT", "0")
+    if not args.rate_limit:
+        os.environ.setdefault("SLEEPER_RATE_PER_MINUTE", "6000000")
+        os.environ.setdefault("SLEEPER_RATE_BURST", "10000")
+    os.chdir(tempfile.mkdtemp(prefix="sleeper-bench-"))
+    return server
+
+
+async def run(args: argparse.Namespace) -> dict:
+    server = await start_fake_sleeper(args)
+    league = server.league
+
+    import bot
+    import history
+    import sleeper
+    from client import close_client
+    from standings import compute_standings
+
+    lid = league.league_id
+    results: dict[str, dict] = {}
+    try:
+        async def preview():
+            bot.build_week_preview_embed(await bot.load_week_context(lid))
+
+        async def results_embed():
+            bot.build_week_results_embed(await bot.load_week_context(lid, week_offset=-1))
+
+        def cold():
+            """Empty the Sleeper response cache and the season-history store (memo and disk)."""
+            sleeper._cache.clear()
+            if history._store is not None:
+                history._store.close()
+                history._store = None
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(history._HISTORY_DB_PATH + suffix):
+                    os.remove(history._HISTORY_DB_PATH + suffix)
+
+        n = args.iterations
+        results["preview_cold"] = await _measure(preview, n, before=cold)
+        results["preview_warm"] = await _measure(preview, n)
+        results["preview_burst"] = await _measure_concurrent(preview, args.concurrency, before=cold)
+        results["results_cold"] = await _measure(results_embed, n, before=cold)
+        results["results_warm"] = await _measure(results_embed, n)
+
+        _, users, rosters, season = await bot._regular_season(lid)
+        names = bot._name_map(users, rosters)
+
+        async def standings_sort():
+            compute_standings(rosters, names, season)
+
+        async def standings_e2e():
+            _, u, r, s = await bot._regular_season(lid)
+            compute_standings(r, bot._name_map(u, r), s)
+
+        results["standings_sort"] = await _measure(standings_sort, n * 10)
+        results["standings_e2e_cold"] = await _measure(standings_e2e, n, before=cold)
+
+        def drop_players():
+            if sleeper._players is not None:
+                sleeper._players.close()
+                sleeper._players = None
+            for path in (sleeper._PLAYERS_DB_PATH, sleeper._PLAYERS_DB_PATH + "-wal"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        ids = [pid for r in rosters for pid in r.players]
+
+        async def players_lookup():
+            store = await sleeper.get_players()
+            store.get_many(ids)
+
+        results["players_cold"] = await _measure(
+            sleeper.get_players, max(1, args.players_iterations), before=drop_players
+        )
+        results["players_warm"] = await _measure(players_lookup, n)
+    finally:
+        await close_client()
+        await server.stop()
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "params": {
+            "latency_ms": args.latency, "jitter_ms": args.jitter, "error_rate": args.error_rate,
+            "players": args.players, "teams": args.teams, "week": args.week,
+            "iterations": args.iterations, "concurrency": args.concurrency,
+            "rate_limit": args.rate_limit,
+        },
+        "server": {"requests": server.requests, "injected_errors": server.errors},
+        "results": results,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        )
+        return out.stdout.strip()
+    except OSError:
+        return ""
+
+
+def _previous(history_path: str, params: dict) -> dict | None:
+    if not os.path.exists(history_path):
+        return None
+    last = None
+    with open(history_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("params") == params:
+                last = record
+    return last
+
+
+def format_report(record: dict, previous: dict | None) -> str:
+    p = record["params"]
+    lines = [
+        f"Sleeper bot benchmark — {record['timestamp']} (commit {record['commit'] or '?'})",
+        f"latency {p['latency_ms']}ms ±{p['jitter_ms']}ms, error rate {p['error_rate']:.1%}, "
+        f"{p['players']} players, {p['teams']} teams, week {p['week']}, "
+        f"{p['iterations']} iterations, burst {p['concurrency']}",
+        f"server: {record['server']['requests']} requests, "
+        f"{record['server']['injected_errors']} injected errors",
+        "",
+        f"{'scenario':<22}{'n':>6}{'mean ms':>11}{'p50 ms':>11}{'p95 ms':>11}"
+        f"{'ops/s':>10}{'Δ p50':>10}",
+    ]
+    before = (previous or {}).get("results", {})
+    for name, r in record["results"].items():
+        delta = ""
+        old = before.get(name)
+        if old and old.get("p50_ms"):
+            delta = f"{(r['p50_ms'] - old['p50_ms']) / old['p50_ms']:+.1%}"
+        lines.append(f"{name:<22}{r['n']:>6}{r['mean_ms']:>11.2f}{r['p50_ms']:>11.2f}"
+                     f"{r['p95_ms']:>11.2f}{r['ops_per_s']:>10.1f}{delta:>10}")
+    if previous:
+        commit = previous.get("commit") or "?"
+        lines += ["", f"Δ compared with {previous['timestamp']} (commit {commit})"]
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    add_server_args(parser)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--players-iterations", type=int, default=3, help="cold /players/nfl loads")
+    parser.add_argument("--concurrency", type=int, default=50,
+                        help="parallel previews in the burst scenario")
+    parser.add_argument("--output", default=os.path.join(ROOT, "bench_output.txt"))
+    parser.add_argument("--history", default=os.path.join(ROOT, "bench_results.jsonl"))
+    args = parser.parse_args(argv)
+    output, history_path = os.path.abspath(args.output), os.path.abspath(args.history)
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+
+    record = asyncio.run(run(args))
+    report = format_report(record, _previous(history_path, record["params"]))
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(report)
+    with open(history_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    print(report, end="")
+
+
+if __name__ == "__main__":
+    main()
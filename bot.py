@@ -1,69 +1,207 @@
-﻿import os
+﻿import asyncio
+import hashlib
+import json
+import os
+import time
 from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 import discord
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, EVENT_JOB_SUBMITTED
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from discord import app_commands
 from discord.ext import commands
 from dotenv import load_dotenv
 from loguru import logger
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
 
+import metrics
+from client import UpstreamUnavailable, close_client, start_client
+from config import BotConfig, load_configs, save_configs
+from embeds import (
+    ERROR,
+    INFO,
+    PRIMARY,
+    SUCCESS,
+    WARN,
+    add_kv,
+    add_lines,
+    batch_embeds,
+    card,
+    paginate,
+    send_pages,
+)
+from fanout import Delivery, DeliveryResult, get_queue
+from history import backfill, get_week_matchups, season_matchups, snapshot_rosters
+from history import get_store as get_history_store
+from metrics import finish_command, lap, observe, start_command, summarize
+from models import Matchup, Roster, User
+from player_index import get_index, rebuild_index
+from playoffs import odds_lines, playoff_odds, shutdown_pool
+from power import power_lines, power_rankings
+from rosters import group_roster, roster_fingerprint, roster_player_ids
 from sleeper import (
+    cache_stats,
     get_league,
-    get_standings,
-    get_users,
-    get_matchups,
     get_nfl_state,
-    get_transactions,
     get_players,
+    get_standings,
+    get_users,
+    on_players_refresh,
     player_label,
+    players_loaded,
+    shutdown_players_pool,
+    warm,
+)
+from standings import cached_standings, compute_standings, standings_lines
+from transactions import (
+    format_transaction,
+    mark_posted,
+    new_transactions,
+    recent_transactions,
+    transaction_player_ids,
 )
-from embeds import card, add_kv, PRIMARY, SUCCESS, WARN, ERROR, INFO
-from config import load_config, save_config, BotConfig
 
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 ENV_LEAGUE_ID = os.getenv("SLEEPER_LEAGUE_ID")
 GUILD_ID = int(os.getenv("DISCORD_GUILD_ID", "0") or 0)
-COMMISSIONER_IDS = {int(x.strip()) for x in (os.getenv("COMMISSIONER_IDS") or "").split(",") if x.strip().isdigit()}
+COMMISSIONER_IDS = {
+    int(x.strip()) for x in (os.getenv("COMMISSIONER_IDS") or "").split(",") if x.strip().isdigit()
+}
 
-CFG: BotConfig = load_config()
+CONFIGS: dict[int, BotConfig] = load_configs()  # guild_id -> config
+# A legacy single-guild config.json loads under 0: it belongs to DISCORD_GUILD_ID when set,
+# otherwise to the only guild the bot has joined (adopted in on_ready, see _adopt_legacy_config)
+_LEGACY_CONFIG: BotConfig | None = CONFIGS.pop(0, None)
+if _LEGACY_CONFIG is not None and GUILD_ID:
+    CONFIGS[GUILD_ID], _LEGACY_CONFIG = _LEGACY_CONFIG, None
 TZ = ZoneInfo("America/New_York")
+_STARTED = time.monotonic()
+_SYNC_STATE_PATH = "command_sync.json"  # last synced command-tree fingerprint per scope
 
 intents = discord.Intents.none()
 intents.guilds = True
 
+class InstrumentedTree(app_commands.CommandTree):
+    """Starts a latency trace for every slash command (see metrics.lap)."""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.type is discord.InteractionType.application_command:
+            command = interaction.command
+            name = command.qualified_name if command else str((interaction.data or {}).get("name"))
+            start_command(name)
+        return True
+
+@dataclass
+class PreparedPost:
+    """A scheduled announcement rendered ahead of its cron time."""
+    league_id: str
+    week: int
+    embeds: list[discord.Embed]
+    rendered_at: datetime
+
 class SleeperDiscordBot(commands.Bot):
     def __init__(self):
-        super().__init__(command_prefix="!", intents=intents)
+        super().__init__(command_prefix="!", intents=intents, tree_cls=InstrumentedTree)
         self.synced = False
         self.scheduler: AsyncIOScheduler | None = None
+        self.last_warm: datetime | None = None
+        self.last_live: dict[int, datetime] = {}
+        self.live_hash: dict[int, str] = {}
+        self.last_txn: dict[int, datetime] = {}
+        self.txn_interval: dict[int, int] = {}
+        self.prepared: dict[tuple[int, str], PreparedPost] = {}
+        self.job_started: dict[tuple[str, datetime], float] = {}
 
     async def setup_hook(self):
-        # Sync commands
+        # Shared Sleeper HTTP client (pooled keep-alive connections)
+        await start_client()
+        await metrics.start_server()
+
+        # Sync commands (skipped when the command tree is unchanged since the last sync)
         if not self.synced:
             if GUILD_ID:
-                guild = discord.Object(id=GUILD_ID)
-                self.tree.copy_global_to(guild=guild)
-                await self.tree.sync(guild=guild)
-                logger.info(f"Slash commands synced to guild {GUILD_ID}.")
-            else:
-                await self.tree.sync()
-                logger.info("Slash commands synced globally.")
+                self.tree.copy_global_to(guild=discord.Object(id=GUILD_ID))
+            await sync_commands()
             self.synced = True
 
         # Scheduler
         if self.scheduler is None:
             self.scheduler = AsyncIOScheduler(timezone=TZ)
+            self.scheduler.add_listener(
+                _job_listener, EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR
+            )
             self.scheduler.start()
             logger.info("Scheduler started.")
-            _register_preview_job(self.scheduler)
-            _register_results_job(self.scheduler)
+            for gid in CONFIGS:
+                _register_guild_jobs(self.scheduler, gid)
+                _catch_up_announcements(self.scheduler, gid)
+            _register_warm_job(self.scheduler)
+
+    async def close(self):
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+        await close_client()
+        await metrics.stop_server()
+        shutdown_pool()
+        shutdown_players_pool()
+        await super().close()
 
 bot = SleeperDiscordBot()
+on_players_refresh(rebuild_index)
+
+def _tree_fingerprint(guild: discord.abc.Snowflake | None) -> str:
+    """Stable hash of what Discord would receive for this scope (names, options, descriptions)."""
+    commands = sorted(
+        (c.to_dict(bot.tree) for c in bot.tree.get_commands(guild=guild)), key=lambda c: c["name"]
+    )
+    payload = {
+        "application_id": bot.application_id,
+        "guild": guild.id if guild else None,
+        "commands": commands,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+def _load_sync_state() -> dict[str, str]:
+    try:
+        with open(_SYNC_STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_sync_state(state: dict[str, str]) -> None:
+    tmp = _SYNC_STATE_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp, _SYNC_STATE_PATH)
+
+async def sync_commands(force: bool = False) -> int | None:
+    """Sync the command tree unless its fingerprint matches the last sync.
+
+    Returns the number of commands synced, or None when the sync was skipped.
+    """
+    guild = discord.Object(id=GUILD_ID) if GUILD_ID else None
+    scope = f"guild:{GUILD_ID}" if GUILD_ID else "global"
+    digest = _tree_fingerprint(guild)
+    state = _load_sync_state()
+    if not force and state.get(scope) == digest:
+        logger.info(f"Slash commands unchanged ({scope}); skipping sync.")
+        return None
+    t0 = time.perf_counter()
+    synced = await bot.tree.sync(guild=guild)
+    state[scope] = digest
+    _save_sync_state(state)
+    logger.info(
+        f"Slash commands synced ({scope}): {len(synced)} command(s) "
+        f"in {time.perf_counter() - t0:.2f}s."
+    )
+    return len(synced)
 
 def is_commissioner(user_id: int) -> bool:
     return user_id in COMMISSIONER_IDS
@@ -73,23 +211,73 @@ def commissioner_check(interaction: discord.Interaction) -> bool:
         raise app_commands.CheckFailure("Commissioner-only command.")
     return True
 
-def league_id_effective() -> str:
-    return (CFG.league_id or ENV_LEAGUE_ID) or ""
+def guild_config(guild_id: int | None) -> BotConfig:
+    """Config for a guild, created with defaults on first use. DMs have no config."""
+    if not guild_id:
+        raise app_commands.NoPrivateMessage()
+    cfg = CONFIGS.get(guild_id)
+    if cfg is None:
+        cfg = CONFIGS[guild_id] = BotConfig()
+    return cfg
+
+async def _adopt_legacy_config() -> None:
+    """Give a legacy single-guild config.json to the one guild the bot is in, and schedule it."""
+    global _LEGACY_CONFIG
+    if _LEGACY_CONFIG is None:
+        return
+    if len(bot.guilds) != 1:
+        logger.warning(f"Legacy config.json not adopted: the bot is in {len(bot.guilds)} guilds. "
+                       "Set DISCORD_GUILD_ID to choose one.")
+        return
+    gid = bot.guilds[0].id
+    if gid not in CONFIGS:
+        CONFIGS[gid] = _LEGACY_CONFIG
+        await save_guild_configs()
+        logger.info(f"Legacy config.json adopted by guild {gid}.")
+        if bot.scheduler:
+            _register_guild_jobs(bot.scheduler, gid)
+            _catch_up_announcements(bot.scheduler, gid)
+    _LEGACY_CONFIG = None
+
+async def save_guild_configs() -> None:
+    """Write config.json off the event loop, from a snapshot taken on the loop."""
+    snapshot = {gid: replace(c) for gid, c in CONFIGS.items()}
+    await asyncio.to_thread(save_configs, snapshot)
+
+def league_id_effective(cfg: BotConfig) -> str:
+    return (cfg.league_id or ENV_LEAGUE_ID) or ""
+
+def all_league_ids() -> set[str]:
+    """Distinct league ids across every configured guild."""
+    return {lid for lid in (league_id_effective(c) for c in CONFIGS.values()) if lid}
 
 @bot.event
 async def on_ready():
     logger.info(f"Logged in as {bot.user} (ID: {bot.user.id})")
-    logger.info(f"Config: {CFG}")
+    await _adopt_legacy_config()
+    logger.info(f"Serving {len(bot.guilds)} guild(s); configured: {sorted(CONFIGS)}")
+    logger.info(f"Startup took {time.monotonic() - _STARTED:.2f}s.")
     logger.info("------")
 
+@bot.event
+async def on_app_command_completion(interaction: discord.Interaction, command):
+    finish_command("ok")
+
 @bot.tree.error
-async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+async def on_app_command_error(interaction: discord.Interaction,
+                               error: app_commands.AppCommandError):
     from discord.app_commands import CheckFailure
+    finish_command("error")
     logger.exception("Slash command error: %s", error)
     msg = "Something went wrong. Please try again."
     color = ERROR
-    if isinstance(error, CheckFailure):
+    if isinstance(error, app_commands.NoPrivateMessage):
+        msg = "This command only works in a server."
+    elif isinstance(error, CheckFailure):
         msg = "Permission denied — commissioner only."
+    elif isinstance(getattr(error, "original", None), UpstreamUnavailable):
+        msg = "Sleeper isn't responding right now. Please try again in a minute."
+        color = WARN
     try:
         await interaction.response.send_message(embed=card("Error", msg, color), ephemeral=True)
     except discord.InteractionResponded:
@@ -97,48 +285,139 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
 
 # ---------- Helpers ----------
 
-def _name_map(users, rosters):
-    uid_to_name = {u.get("user_id"): (u.get("display_name") or u.get("username") or "Unknown")
-                   for u in users}
-    rid_to_uid = {r.get("roster_id"): r.get("owner_id") for r in rosters}
-    return {rid: uid_to_name.get(uid, f"Roster {rid}") for rid, uid in rid_to_uid.items()}
+# NFL kickoff windows in ET: weekday -> (start_hour, end_hour)
+_GAME_WINDOWS = {
+    3: (19, 24),  # Thursday night
+    6: (9, 24),   # Sunday, from the early international games
+    0: (19, 24),  # Monday night
+}
 
-async def build_week_preview_embed(lid: str, week: int) -> discord.Embed:
-    users = await get_users(lid)
-    rosters = await get_standings(lid)
-    roster_name = _name_map(users, rosters)
-    m = await get_matchups(lid, week)
+def in_game_window(now: datetime | None = None) -> bool:
+    now = (now or datetime.now(TZ)).astimezone(TZ)
+    span = _GAME_WINDOWS.get(now.weekday())
+    return span is not None and span[0] <= now.hour < span[1]
+
+def _name_map(users: list[User], rosters: list[Roster]) -> dict[int, str]:
+    uid_to_name = {u.user_id: u.display_name for u in users}
+    return {r.roster_id: uid_to_name.get(r.owner_id, f"Roster {r.roster_id}") for r in rosters}
+
+@dataclass
+class WeekContext:
+    """Everything a week embed needs, fetched once per interaction."""
+    league_id: str
+    week: int
+    current_week: int
+    users: list[User]
+    rosters: list[Roster]
+    matchups: list[Matchup]
+
+    @property
+    def roster_name(self) -> dict:
+        return _name_map(self.users, self.rosters)
+
+async def load_week_context(lid: str, week: int | None = None, week_offset: int = 0) -> WeekContext:
+    """Fetch users, rosters, NFL state and matchups concurrently.
+
+    When week is None it resolves to the current NFL week plus week_offset; the
+    matchups fetch then chains on the state fetch while users/rosters run alongside.
+    """
+    async def _state_and_matchups():
+        state = await get_nfl_state()
+        current = int(state.get("week") or 1)
+        w = week if week is not None else max(1, current + week_offset)
+        return current, w, await get_week_matchups(lid, w)
+
+    if week is not None:
+        users, rosters, state, m = await asyncio.gather(
+            get_users(lid), get_standings(lid), get_nfl_state(), get_week_matchups(lid, week)
+        )
+        current_week, w = int(state.get("week") or 1), week
+    else:
+        users, rosters, (current_week, w, m) = await asyncio.gather(
+            get_users(lid), get_standings(lid), _state_and_matchups()
+        )
+    return WeekContext(lid, w, current_week, users or [], rosters or [], m or [])
+
+async def _regular_season(lid: str):
+    """(league, users, rosters, {week: matchups}) for closed regular-season weeks."""
+    league_data, users, rosters, season = await asyncio.gather(
+        get_league(lid), get_users(lid), get_standings(lid), season_matchups(lid)
+    )
+    # Regular season only: stop before the playoffs start
+    playoff_start = league_data.playoff_week_start if league_data else 0
+    if playoff_start:
+        season = {w: m for w, m in season.items() if w < playoff_start}
+    return league_data, users, rosters, season
+
+ODDS_MAX_ITERATIONS = 200_000
+
+async def build_playoff_odds_embed(lid: str, cfg: BotConfig, iterations: int | None = None,
+                                   seed: int | None = None) -> discord.Embed:
+    """Simulate the remaining regular season and render playoff odds."""
+    league_data, users, rosters, season = await _regular_season(lid)
+    playoff_teams = league_data.playoff_teams if league_data else 6
+    playoff_start = league_data.playoff_week_start if league_data else 0
+    first_open = max(season, default=0) + 1
+    weeks = list(range(first_open, playoff_start)) if playoff_start else []
+    upcoming = await asyncio.gather(*(get_week_matchups(lid, w) for w in weeks))
+    remaining = dict(zip(weeks, upcoming, strict=True))
+
+    names = _name_map(users, rosters)
+    table = compute_standings(rosters, names, season)
+    odds = await playoff_odds(
+        lid,
+        sorted(names),
+        names,
+        season,
+        remaining,
+        {t.roster_id: t.wins + 0.5 * t.ties for t in table},
+        {t.roster_id: t.pf for t in table},
+        playoff_teams,
+        max(100, min(ODDS_MAX_ITERATIONS, iterations or cfg.odds_iterations)),
+        seed if seed is not None else cfg.odds_seed,
+    )
+    e = card("Playoff Odds", "\n".join(odds_lines(odds)), PRIMARY)
+    e.set_footer(text=f"{playoff_teams} playoff spots · {len(weeks)} week(s) left to simulate")
+    return e
+
+def _matchup_groups(matchups: list[Matchup]) -> list[tuple[int | None, list[Matchup]]]:
+    """Pairs by matchup_id in id order, then each team without one (bye, or out of the
+    playoffs) on its own."""
+    groups: dict[int, list[Matchup]] = defaultdict(list)
+    byes: list[tuple[None, list[Matchup]]] = []
+    for entry in matchups:
+        if entry.matchup_id is None:
+            byes.append((None, [entry]))
+        else:
+            groups[entry.matchup_id].append(entry)
+    return [*sorted(groups.items()), *byes]
+
+def build_week_preview_embed(ctx: WeekContext) -> discord.Embed:
+    week = ctx.week
+    roster_name = ctx.roster_name
+    m = ctx.matchups
     e = card(f"Week {week} Preview", color=PRIMARY)
     if not m:
         add_kv(e, "No data", f"No matchups found for week {week}.", inline=False)
         return e
 
-    groups = defaultdict(list)
-    for entry in m:
-        groups[entry.get("matchup_id")].append(entry)
-
-    for mid, entries in sorted(groups.items()):
+    for mid, entries in _matchup_groups(m):
         if len(entries) == 2:
             a, b = entries
-            a_name = roster_name.get(a.get("roster_id"), f"Roster {a.get('roster_id')}")
-            b_name = roster_name.get(b.get("roster_id"), f"Roster {b.get('roster_id')}")
-            a_pts = a.get("points", 0) or 0
-            b_pts = b.get("points", 0) or 0
-            value = f"{a_name} vs {b_name}\n(Current: {a_pts:.2f} – {b_pts:.2f})"
+            a_name = roster_name.get(a.roster_id, f"Roster {a.roster_id}")
+            b_name = roster_name.get(b.roster_id, f"Roster {b.roster_id}")
+            value = f"{a_name} vs {b_name}\n(Current: {a.points:.2f} – {b.points:.2f})"
         else:
             e0 = entries[0]
-            a_name = roster_name.get(e0.get("roster_id"), f"Roster {e0.get('roster_id')}")
+            a_name = roster_name.get(e0.roster_id, f"Roster {e0.roster_id}")
             value = f"{a_name} (bye or unmatched)"
-        add_kv(e, f"Matchup {mid}", value)
+        add_kv(e, f"Matchup {mid}" if mid is not None else "Bye", value)
     return e
 
-async def build_week_results_embed(lid: str, week: int) -> discord.Embed:
-    users = await get_users(lid)
-    rosters = await get_standings(lid)
-    roster_name = _name_map(users, rosters)
-    m = await get_matchups(lid, week)
-    state = await get_nfl_state()
-    current_week = int(state.get("week") or 1)
+def build_week_results_embed(ctx: WeekContext) -> discord.Embed:
+    week, current_week = ctx.week, ctx.current_week
+    roster_name = ctx.roster_name
+    m = ctx.matchups
 
     title = f"Week {week} Results" + ("" if week < current_week else " (in progress)")
     e = card(title, color=SUCCESS if week < current_week else INFO)
@@ -147,17 +426,12 @@ async def build_week_results_embed(lid: str, week: int) -> discord.Embed:
         add_kv(e, "No data", f"No matchups found for week {week}.", inline=False)
         return e
 
-    groups = defaultdict(list)
-    for entry in m:
-        groups[entry.get("matchup_id")].append(entry)
-
-    for mid, entries in sorted(groups.items()):
+    for mid, entries in _matchup_groups(m):
         if len(entries) == 2:
             a, b = entries
-            a_name = roster_name.get(a.get("roster_id"), f"Roster {a.get('roster_id')}")
-            b_name = roster_name.get(b.get("roster_id"), f"Roster {b.get('roster_id')}")
-            a_pts = float(a.get("points", 0) or 0)
-            b_pts = float(b.get("points", 0) or 0)
+            a_name = roster_name.get(a.roster_id, f"Roster {a.roster_id}")
+            b_name = roster_name.get(b.roster_id, f"Roster {b.roster_id}")
+            a_pts, b_pts = a.points, b.points
             if a_pts > b_pts:
                 value = f"👑 {a_name} {a_pts:.2f} — {b_pts:.2f} {b_name}"
             elif b_pts > a_pts:
@@ -166,100 +440,409 @@ async def build_week_results_embed(lid: str, week: int) -> discord.Embed:
                 value = f"🤝 {a_name} {a_pts:.2f} — {b_pts:.2f} {b_name} (tie)"
         else:
             e0 = entries[0]
-            a_name = roster_name.get(e0.get("roster_id"), f"Roster {e0.get('roster_id')}")
+            a_name = roster_name.get(e0.roster_id, f"Roster {e0.roster_id}")
             value = f"{a_name} (bye or unmatched)"
-        add_kv(e, f"Matchup {mid}", value)
+        add_kv(e, f"Matchup {mid}" if mid is not None else "Bye", value)
     return e
 
-async def _post_weekly_preview():
-    """Job: post upcoming week preview to default announce channel/role."""
-    lid = league_id_effective()
-    if not lid or not CFG.announce_channel_id:
-        logger.warning("Preview job skipped: league_id or announce_channel missing.")
-        return
-    guild = bot.get_guild(GUILD_ID) if GUILD_ID else discord.utils.get(bot.guilds)
+def _announce_target(gid: int, cfg: BotConfig, job: str):
+    """Resolve (league_id, guild, channel) for a scheduled post, or None with a log line."""
+    lid = league_id_effective(cfg)
+    if not lid or not cfg.announce_channel_id:
+        logger.warning(f"{job} job skipped for guild {gid}: league_id or announce_channel missing.")
+        return None
+    guild = bot.get_guild(gid)
     if not guild:
-        logger.warning("Preview job skipped: guild not found.")
-        return
-    channel = guild.get_channel(CFG.announce_channel_id)
+        logger.warning(f"{job} job skipped: guild {gid} not found.")
+        return None
+    channel = guild.get_channel(cfg.announce_channel_id)
     if not channel:
-        logger.warning("Preview job skipped: channel not found.")
-        return
-
-    state = await get_nfl_state()
-    week = int(state.get("week") or 1)
-    e = await build_week_preview_embed(lid, week)
+        logger.warning(f"{job} job skipped for guild {gid}: channel not found.")
+        return None
+    return lid, guild, channel
 
+def _role_mention(guild: discord.Guild, cfg: BotConfig):
     content = None
     allowed = discord.AllowedMentions.none()
-    if CFG.announce_role_id:
-        role = guild.get_role(CFG.announce_role_id)
+    if cfg.announce_role_id:
+        role = guild.get_role(cfg.announce_role_id)
         if role:
             content = role.mention
             allowed = discord.AllowedMentions(roles=True)
-    await channel.send(content=content, embed=e, allowed_mentions=allowed)
-    logger.info(f"Weekly preview posted to channel {CFG.announce_channel_id} for week {week}.")
+    return content, allowed
 
-async def _post_weekly_results():
-    """Job: post last week's results (uses Tuesday mornings by default)."""
-    lid = league_id_effective()
-    if not lid or not CFG.announce_channel_id:
-        logger.warning("Results job skipped: league_id or announce_channel missing.")
+async def _render_weekly_preview(lid: str, cfg: BotConfig) -> tuple[int, list[discord.Embed]]:
+    ctx = await load_week_context(lid)
+    return ctx.week, [build_week_preview_embed(ctx)]
+
+async def _render_weekly_results(lid: str, cfg: BotConfig) -> tuple[int, list[discord.Embed]]:
+    ctx = await load_week_context(lid, week_offset=-1)  # post the week that just finished
+    embeds = [build_week_results_embed(ctx)]
+    if cfg.results_attach_odds:
+        try:
+            embeds.append(await build_playoff_odds_embed(lid, cfg))
+        except Exception:
+            logger.exception("Results job: playoff odds failed; posting results only.")
+    return ctx.week, embeds
+
+_RENDERERS = {"preview": _render_weekly_preview, "results": _render_weekly_results}
+
+# Scheduled announcements are rendered ahead of time and only sent at the cron time
+PRERENDER_RETRY_SECONDS = 30
+ANNOUNCE_GRACE_SECONDS = 6 * 3600   # how late a missed post may still go out
+
+def _announce_schedule(cfg: BotConfig, kind: str) -> tuple[bool, int, int, int]:
+    """(enabled, dow, hour, minute) for the preview or results job."""
+    if kind == "preview":
+        return cfg.schedule_enabled, cfg.schedule_dow, cfg.schedule_hour, cfg.schedule_minute
+    return cfg.results_enabled, cfg.results_dow, cfg.results_hour, cfg.results_minute
+
+def _last_fire(dow: int, hour: int, minute: int, now: datetime) -> datetime:
+    """Most recent weekly fire time at or before `now`."""
+    fire = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    fire -= timedelta(days=(fire.weekday() - dow) % 7)
+    return fire if fire <= now else fire - timedelta(days=7)
+
+def _shift_weekly(dow: int, hour: int, minute: int, minutes_before: int) -> tuple[int, int, int]:
+    total = (dow * 1440 + hour * 60 + minute - minutes_before) % (7 * 1440)
+    return total // 1440, (total % 1440) // 60, total % 60
+
+def _sent_scope(gid: int, kind: str) -> str:
+    return f"announce:{gid}:{kind}"
+
+async def _render_with_retry(gid: int, kind: str, deadline: datetime) -> PreparedPost | None:
+    """Render until it succeeds or the deadline passes."""
+    attempt = 0
+    while True:
+        cfg = guild_config(gid)
+        lid = league_id_effective(cfg)
+        if not lid:
+            return None
+        attempt += 1
+        try:
+            week, embeds = await _RENDERERS[kind](lid, cfg)
+            return PreparedPost(lid, week, embeds, datetime.now(TZ))
+        except Exception:
+            logger.exception(f"{kind} render for guild {gid} failed (attempt {attempt}).")
+        if datetime.now(TZ) + timedelta(seconds=PRERENDER_RETRY_SECONDS) >= deadline:
+            return None
+        await asyncio.sleep(PRERENDER_RETRY_SECONDS)
+
+async def _prepare_announcement(gid: int, kind: str):
+    """Job: render a scheduled post ahead of its cron time and hold it ready."""
+    cfg = guild_config(gid)
+    deadline = datetime.now(TZ) + timedelta(minutes=cfg.prerender_minutes)
+    post = await _render_with_retry(gid, kind, deadline)
+    if post is None:
+        logger.warning(
+            f"{kind} for guild {gid} could not be pre-rendered; will render at send time."
+        )
         return
-    guild = bot.get_guild(GUILD_ID) if GUILD_ID else discord.utils.get(bot.guilds)
-    if not guild:
-        logger.warning("Results job skipped: guild not found.")
+    bot.prepared[(gid, kind)] = post
+    logger.info(f"{kind} for guild {gid} (week {post.week}) rendered and ready.")
+
+async def _send_announcement(gid: int, kind: str):
+    """Job: send the prepared post, at most once per fire time.
+
+    Renders now only if preparing failed.
+    """
+    # setup_hook schedules catch-ups before the gateway connects; wait for the guild cache
+    await bot.wait_until_ready()
+    cfg = guild_config(gid)
+    _, dow, hour, minute = _announce_schedule(cfg, kind)
+    now = datetime.now(TZ)
+    fire = _last_fire(dow, hour, minute, now)
+    store = get_history_store()
+    if fire.isoformat() in (store.seen_ids(_sent_scope(gid, kind)) or set()):
+        logger.info(f"{kind} for guild {gid} at {fire:%a %H:%M} already sent; skipping.")
         return
-    channel = guild.get_channel(CFG.announce_channel_id)
-    if not channel:
-        logger.warning("Results job skipped: channel not found.")
+    target = _announce_target(gid, cfg, kind.capitalize())
+    if target is None:
         return
+    lid, guild, channel = target
 
-    state = await get_nfl_state()
-    current_week = int(state.get("week") or 1)
-    week = max(1, current_week - 1)  # post the week that just finished
+    post = bot.prepared.pop((gid, kind), None)
+    max_age = timedelta(minutes=cfg.prerender_minutes + 5)
+    if post is None or post.league_id != lid or now - post.rendered_at > max_age:
+        post = await _render_with_retry(gid, kind, now + timedelta(minutes=2))
+        if post is None:
+            logger.error(f"{kind} for guild {gid} dropped: rendering kept failing.")
+            return
 
-    e = await build_week_results_embed(lid, week)
+    content, allowed = _role_mention(guild, cfg)
+    delivery = Delivery(channel, f"{guild.name} #{channel}", content, allowed)
+    [result] = await get_queue().broadcast(post.embeds, [delivery])
+    if not result.ok:
+        logger.error(f"Weekly {kind} for guild {gid} failed to send: {result.error}")
+        return
+    store.mark_seen(_sent_scope(gid, kind), [fire.isoformat()], keep=20)
+    late = (datetime.now(TZ) - fire).total_seconds()
+    logger.info(f"Weekly {kind} posted to channel {cfg.announce_channel_id} for week {post.week} "
+                f"({late:.1f}s after schedule).")
 
-    content = None
-    allowed = discord.AllowedMentions.none()
-    if CFG.announce_role_id:
-        role = guild.get_role(CFG.announce_role_id)
-        if role:
-            content = role.mention
-            allowed = discord.AllowedMentions(roles=True)
-    await channel.send(content=content, embed=e, allowed_mentions=allowed)
-    logger.info(f"Weekly results posted to channel {CFG.announce_channel_id} for week {week}.")
+async def _post_weekly_preview(gid: int):
+    """Job: post upcoming week preview to the guild's default announce channel/role."""
+    await _send_announcement(gid, "preview")
 
-def _register_preview_job(sched: AsyncIOScheduler):
+async def _post_weekly_results(gid: int):
+    """Job: post last week's results (uses Tuesday mornings by default)."""
+    await _send_announcement(gid, "results")
+
+def _job_listener(event) -> None:
+    """Record scheduler job durations, labelled by job kind (the id before ':')."""
+    if event.code == EVENT_JOB_SUBMITTED:
+        for run_time in event.scheduled_run_times:
+            bot.job_started[(event.job_id, run_time)] = time.perf_counter()
+        return
+    started = bot.job_started.pop((event.job_id, event.scheduled_run_time), None)
+    if started is not None:
+        status = "error" if event.code == EVENT_JOB_ERROR else "ok"
+        observe("job_seconds", time.perf_counter() - started,
+                job=event.job_id.split(":")[0], status=status)
+
+def _remove_job(sched: AsyncIOScheduler, job_id: str) -> None:
     try:
-        sched.remove_job("weekly_preview")
+        sched.remove_job(job_id)
     except Exception:
         pass
-    if not CFG.schedule_enabled:
-        logger.info("Scheduler: weekly_preview disabled via config.")
+
+def _register_announce_jobs(sched: AsyncIOScheduler, gid: int, kind: str):
+    job_id = f"weekly_{kind}:{gid}"
+    prep_id = f"prepare_{kind}:{gid}"
+    _remove_job(sched, job_id)
+    _remove_job(sched, prep_id)
+    bot.prepared.pop((gid, kind), None)
+    cfg = guild_config(gid)
+    enabled, dow, hour, minute = _announce_schedule(cfg, kind)
+    if not enabled:
+        logger.info(f"Scheduler: {job_id} disabled via config.")
+        return
+    send = _post_weekly_preview if kind == "preview" else _post_weekly_results
+    trigger = CronTrigger(day_of_week=str(dow), hour=hour, minute=minute, timezone=TZ)
+    sched.add_job(send, trigger=trigger, id=job_id, args=[gid],
+                  misfire_grace_time=ANNOUNCE_GRACE_SECONDS, coalesce=True)
+    if cfg.prerender_minutes > 0:
+        p_dow, p_hour, p_minute = _shift_weekly(dow, hour, minute, cfg.prerender_minutes)
+        prep_trigger = CronTrigger(day_of_week=str(p_dow), hour=p_hour, minute=p_minute,
+                                   timezone=TZ)
+        sched.add_job(_prepare_announcement, trigger=prep_trigger, id=prep_id, args=[gid, kind],
+                      misfire_grace_time=cfg.prerender_minutes * 60, coalesce=True)
+    logger.info(f"Scheduler: {job_id} enabled at DOW={dow} {hour:02d}:{minute:02d} ET "
+                f"(rendered {cfg.prerender_minutes}m ahead).")
+
+def _register_preview_job(sched: AsyncIOScheduler, gid: int):
+    _register_announce_jobs(sched, gid, "preview")
+
+def _register_results_job(sched: AsyncIOScheduler, gid: int):
+    _register_announce_jobs(sched, gid, "results")
+
+def _catch_up_announcements(sched: AsyncIOScheduler, gid: int):
+    """After a restart, send a scheduled post whose fire time passed while we were down.
+
+    Only posts still within ANNOUNCE_GRACE_SECONDS and not recorded as sent are
+    caught up; a guild with no send history just starts recording.
+    """
+    cfg = guild_config(gid)
+    now = datetime.now(TZ)
+    store = get_history_store()
+    for kind in _RENDERERS:
+        enabled, dow, hour, minute = _announce_schedule(cfg, kind)
+        if not enabled:
+            continue
+        fire = _last_fire(dow, hour, minute, now)
+        sent = store.seen_ids(_sent_scope(gid, kind))
+        if sent is None:
+            store.mark_seen(_sent_scope(gid, kind), [], keep=20)
+        elif (fire.isoformat() not in sent
+              and (now - fire).total_seconds() <= ANNOUNCE_GRACE_SECONDS):
+            logger.info(f"Catching up missed {kind} for guild {gid} scheduled {fire:%a %H:%M}.")
+            sched.add_job(_send_announcement, args=[gid, kind], id=f"catchup_{kind}:{gid}",
+                          replace_existing=True, misfire_grace_time=None)
+
+def _register_guild_jobs(sched: AsyncIOScheduler, gid: int):
+    """(Re)register every per-guild job from that guild's config."""
+    _register_preview_job(sched, gid)
+    _register_results_job(sched, gid)
+    _register_live_job(sched, gid)
+    _register_txn_job(sched, gid)
+
+def _warm_settings() -> tuple[int, int] | None:
+    """(warm_minutes, warm_live_seconds) honouring the most eager guild.
+
+    None if every guild opted out.
+    """
+    cfgs = [c for c in CONFIGS.values() if c.warm_enabled] or ([BotConfig()] if not CONFIGS else [])
+    if not cfgs:
+        return None
+    return min(c.warm_minutes for c in cfgs), min(c.warm_live_seconds for c in cfgs)
+
+async def _warm_caches():
+    """Job: refresh Sleeper data for every configured league ahead of expiry.
+
+    The Sleeper cache is process-wide, so NFL state and players are fetched once
+    no matter how many guilds/leagues are served.
+    """
+    settings = _warm_settings()
+    if settings is None:
+        return
+    await bot.wait_until_ready()  # first run is scheduled from setup_hook, before connect()
+    warm_minutes, live_seconds = settings
+    now = datetime.now(TZ)
+    cadence = live_seconds if in_game_window(now) else warm_minutes * 60
+    if bot.last_warm is not None and (now - bot.last_warm).total_seconds() < cadence - 1:
         return
-    trigger = CronTrigger(day_of_week=str(CFG.schedule_dow),
-                          hour=CFG.schedule_hour,
-                          minute=CFG.schedule_minute,
-                          timezone=TZ)
-    sched.add_job(_post_weekly_preview, trigger=trigger, id="weekly_preview")
-    logger.info(f"Scheduler: weekly_preview enabled at DOW={CFG.schedule_dow} {CFG.schedule_hour:02d}:{CFG.schedule_minute:02d} ET.")
+    bot.last_warm = now
+    # Look one extra tick ahead so nothing lapses between runs
+    lids = all_league_ids()
+    counts = await asyncio.gather(*(warm(lid, ahead=cadence + live_seconds) for lid in lids))
+    get_index(await get_players())  # builds the search index on first run
+    for lid in lids:
+        await snapshot_rosters(lid)
+        await backfill(lid)
+    logger.debug(f"Cache warm: refreshed {sum(counts)} entries across {len(counts)} league(s) "
+                 f"(cadence {cadence}s).")
 
-def _register_results_job(sched: AsyncIOScheduler):
+def _register_warm_job(sched: AsyncIOScheduler):
+    _remove_job(sched, "cache_warm")
+    settings = _warm_settings()
+    if settings is None:
+        logger.info("Scheduler: cache_warm disabled via config.")
+        return
+    warm_minutes, live_seconds = settings
+    # Tick at the fast cadence; _warm_caches skips ticks outside game windows
+    trigger = IntervalTrigger(seconds=max(10, live_seconds), timezone=TZ)
+    sched.add_job(_warm_caches, trigger=trigger, id="cache_warm",
+                  next_run_time=datetime.now(TZ), max_instances=1, coalesce=True)
+    logger.info(
+        f"Scheduler: cache_warm enabled every {warm_minutes}m ({live_seconds}s during games)."
+    )
+
+# Live scoreboard polling: fast during kickoff windows, idle otherwise
+LIVE_FAST_SECONDS = 30
+LIVE_IDLE_SECONDS = 15 * 60
+
+def _scores_hash(ctx: WeekContext) -> str:
+    rows = sorted((m.matchup_id or 0, m.roster_id, round(m.points, 2)) for m in ctx.matchups)
+    return hashlib.sha1(repr((ctx.week, ctx.current_week, rows)).encode()).hexdigest()
+
+async def _live_message(channel, cfg: BotConfig) -> discord.Message | None:
+    if not cfg.live_message_id:
+        return None
     try:
-        sched.remove_job("weekly_results")
-    except Exception:
-        pass
-    if not getattr(CFG, "results_enabled", False):
-        logger.info("Scheduler: weekly_results disabled via config.")
+        return await channel.fetch_message(cfg.live_message_id)
+    except discord.NotFound:
+        return None
+
+async def _update_live_scoreboard(gid: int, force: bool = False) -> bool:
+    """Edit the guild's pinned live scoreboard if scores changed. Returns True when updated."""
+    cfg = guild_config(gid)
+    lid = league_id_effective(cfg)
+    channel = bot.get_channel(cfg.live_channel_id) if cfg.live_channel_id else None
+    if not lid or channel is None:
+        logger.warning(
+            f"Live scoreboard skipped for guild {gid}: league_id or live channel missing."
+        )
+        return False
+
+    ctx = await load_week_context(lid)
+    digest = _scores_hash(ctx)
+    if not force and digest == bot.live_hash.get(gid):
+        return False
+
+    e = build_week_results_embed(ctx)
+    e.set_footer(text="Live — updates automatically when scores change")
+    msg = await _live_message(channel, cfg)
+    if msg is None:
+        msg = await channel.send(embed=e)
+        try:
+            await msg.pin()
+        except discord.HTTPException:
+            logger.warning("Live scoreboard: could not pin message (missing Manage Messages?).")
+        cfg.live_message_id = msg.id
+        await save_guild_configs()
+    else:
+        await msg.edit(embed=e)
+    bot.live_hash[gid] = digest
+    logger.info(f"Live scoreboard updated for guild {gid}, week {ctx.week}.")
+    return True
+
+async def _poll_live_scores(gid: int):
+    """Job: adaptive poll of matchups; edits the scoreboard only on score changes."""
+    await bot.wait_until_ready()
+    now = datetime.now(TZ)
+    interval = LIVE_FAST_SECONDS if in_game_window(now) else LIVE_IDLE_SECONDS
+    last = bot.last_live.get(gid)
+    if last is not None and (now - last).total_seconds() < interval - 1:
+        return
+    bot.last_live[gid] = now
+    await _update_live_scoreboard(gid)
+
+def _register_live_job(sched: AsyncIOScheduler, gid: int):
+    job_id = f"live_scores:{gid}"
+    _remove_job(sched, job_id)
+    cfg = guild_config(gid)
+    if not cfg.live_enabled:
+        logger.info(f"Scheduler: {job_id} disabled via config.")
         return
-    trigger = CronTrigger(day_of_week=str(CFG.results_dow),
-                          hour=CFG.results_hour,
-                          minute=CFG.results_minute,
-                          timezone=TZ)
-    sched.add_job(_post_weekly_results, trigger=trigger, id="weekly_results")
-    logger.info(f"Scheduler: weekly_results enabled at DOW={CFG.results_dow} {CFG.results_hour:02d}:{CFG.results_minute:02d} ET.")
+    trigger = IntervalTrigger(seconds=LIVE_FAST_SECONDS, timezone=TZ)
+    sched.add_job(_poll_live_scores, trigger=trigger, id=job_id, args=[gid],
+                  max_instances=1, coalesce=True)
+    logger.info(f"Scheduler: {job_id} enabled in channel {cfg.live_channel_id}.")
+
+# Transaction feed polling: doubles the interval while nothing new shows up
+TXN_MIN_SECONDS = 60
+TXN_MAX_SECONDS = 15 * 60
+
+async def _post_new_transactions(gid: int) -> int:
+    """Post completed transactions the guild hasn't seen yet. Returns how many were posted."""
+    cfg = guild_config(gid)
+    target = _announce_target(gid, cfg, "Transaction feed")
+    if target is None:
+        return 0
+    lid, guild, channel = target
+
+    state = await get_nfl_state()
+    scope = f"txn:{gid}:{lid}"
+    txns = await new_transactions(lid, int(state.get("week") or 1), scope=scope)
+    if not txns:
+        return 0
+    users, rosters, players = await asyncio.gather(
+        get_users(lid), get_standings(lid), get_players()
+    )
+    roster_name = _name_map(users, rosters)
+    resolved = players.get_many(transaction_player_ids(txns))
+    lines = [format_transaction(t, roster_name, resolved) for t in txns]
+    for embeds in batch_embeds(paginate("League Activity", lines, INFO)):
+        await channel.send(embeds=embeds, allowed_mentions=discord.AllowedMentions.none())
+    mark_posted(scope, txns)  # only once sent, so a failed post is retried on the next poll
+    logger.info(f"Transaction feed: posted {len(txns)} new transaction(s) for guild {gid}.")
+    return len(txns)
+
+async def _poll_transactions(gid: int):
+    """Job: poll the current week's transactions, backing off while nothing changes."""
+    await bot.wait_until_ready()  # first run is scheduled from setup_hook, before connect()
+    now = datetime.now(TZ)
+    interval = bot.txn_interval.get(gid, TXN_MIN_SECONDS)
+    last = bot.last_txn.get(gid)
+    if last is not None and (now - last).total_seconds() < interval - 1:
+        return
+    bot.last_txn[gid] = now
+    posted = await _post_new_transactions(gid)
+    bot.txn_interval[gid] = TXN_MIN_SECONDS if posted else min(TXN_MAX_SECONDS, interval * 2)
+
+def _register_txn_job(sched: AsyncIOScheduler, gid: int):
+    job_id = f"txn_feed:{gid}"
+    _remove_job(sched, job_id)
+    bot.txn_interval.pop(gid, None)
+    cfg = guild_config(gid)
+    if not cfg.txn_feed_enabled:
+        logger.info(f"Scheduler: {job_id} disabled via config.")
+        return
+    trigger = IntervalTrigger(seconds=TXN_MIN_SECONDS, timezone=TZ)
+    sched.add_job(_poll_transactions, trigger=trigger, id=job_id, args=[gid],
+                  next_run_time=datetime.now(TZ), max_instances=1, coalesce=True)
+    logger.info(f"Scheduler: {job_id} enabled "
+                f"(every {TXN_MIN_SECONDS}s, backing off to {TXN_MAX_SECONDS}s).")
 
 # ---------- Commands ----------
 
@@ -269,74 +852,303 @@ async def ping(interaction: discord.Interaction):
 
 @bot.tree.command(name="league", description="Show basic Sleeper league info.")
 async def league(interaction: discord.Interaction):
+    cfg = guild_config(interaction.guild_id)
     await interaction.response.defer(thinking=True)
-    lid = league_id_effective()
+    lap("defer")
+    lid = league_id_effective(cfg)
     if not lid:
-        await interaction.followup.send(embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN))
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
         return
     data = await get_league(lid)
-    name = data.get("name", "Unknown League")
-    season = data.get("season", "Unknown")
-    total_rosters = data.get("total_rosters", "N/A")
-    e = card(title=name, desc=f"Season **{season}**", color=PRIMARY)
-    add_kv(e, "Total Rosters", str(total_rosters))
+    lap("fetch")
+    if data is None:
+        await interaction.followup.send(
+            embed=card("League not found", f"Sleeper has no league {lid}.", WARN)
+        )
+        return
+    e = card(title=data.name, desc=f"Season **{data.season or 'Unknown'}**", color=PRIMARY)
+    add_kv(e, "Total Rosters", str(data.total_rosters or "N/A"))
     e.set_footer(text=f"League ID: {lid}")
+    lap("render")
     await interaction.followup.send(embed=e)
 
 @bot.tree.command(name="standings", description="Show league standings.")
 async def standings(interaction: discord.Interaction):
+    cfg = guild_config(interaction.guild_id)
     await interaction.response.defer(thinking=True)
-    lid = league_id_effective()
+    lap("defer")
+    lid = league_id_effective(cfg)
     if not lid:
-        await interaction.followup.send(embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN))
-        return
-    rosters = await get_standings(lid)
-    sorted_rosters = sorted(
-        rosters,
-        key=lambda r: (
-            r.get("settings", {}).get("wins", 0),
-            r.get("settings", {}).get("fpts", 0),
-        ),
-        reverse=True,
-    )
-    e = card("League Standings", color=INFO)
-    for i, r in enumerate(sorted_rosters, start=1):
-        s = r.get("settings", {}) or {}
-        wins = s.get("wins", 0)
-        losses = s.get("losses", 0)
-        points = s.get("fpts", 0)
-        add_kv(e, f"#{i} — Roster {r.get('roster_id')}", f"Wins: {wins} | Losses: {losses} | Points: {points}")
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
+        return
+    _, users, rosters, season = await _regular_season(lid)
+    lap("fetch")
+    table = cached_standings(lid, rosters, _name_map(users, rosters), season)
+    if not table:
+        await interaction.followup.send(embed=card("League Standings", "No rosters found.", INFO))
+        return
+    pages = paginate("League Standings", standings_lines(table), INFO)
+    lap("render")
+    await send_pages(interaction, pages)
+
+@bot.tree.command(
+    name="powerrankings",
+    description="Show all-play power rankings, luck and strength of schedule.",
+)
+async def powerrankings(interaction: discord.Interaction):
+    cfg = guild_config(interaction.guild_id)
+    await interaction.response.defer(thinking=True)
+    lap("defer")
+    lid = league_id_effective(cfg)
+    if not lid:
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
+        return
+    _, users, rosters, season = await _regular_season(lid)
+    lap("fetch")
+    rows = power_rankings(lid, rosters, _name_map(users, rosters), season)
+    if not rows:
+        await interaction.followup.send(
+            embed=card("Power Rankings", "No completed weeks yet.", INFO)
+        )
+        return
+    title = f"Power Rankings — through week {max(season)}"
+    pages = paginate(title, power_lines(rows), PRIMARY)
+    lap("render")
+    await send_pages(interaction, pages)
+
+@bot.tree.command(
+    name="playoffodds",
+    description="Simulate the rest of the season and show playoff odds.",
+)
+@app_commands.describe(
+    iterations=f"Number of simulated seasons (default from config, max {ODDS_MAX_ITERATIONS})",
+    seed="Random seed for reproducible results",
+)
+async def playoffodds(interaction: discord.Interaction, iterations: int | None = None,
+                      seed: int | None = None):
+    cfg = guild_config(interaction.guild_id)
+    await interaction.response.defer(thinking=True)
+    lap("defer")
+    lid = league_id_effective(cfg)
+    if not lid:
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
+        return
+    e = await build_playoff_odds_embed(lid, cfg, iterations, seed)
+    lap("render")  # fetch + simulation
     await interaction.followup.send(embed=e)
 
-@bot.tree.command(name="schedule", description="Show matchups for a given week (defaults to current).")
+async def player_autocomplete(interaction: discord.Interaction,
+                              current: str) -> list[app_commands.Choice[str]]:
+    if not players_loaded():
+        return []  # a cold download takes far longer than Discord waits for choices
+    index = get_index(await get_players())
+    if index is None or not current.strip():
+        return []
+    return [app_commands.Choice(name=label[:100], value=pid)
+            for pid, label in index.search(current, k=25)]
+
+@bot.tree.command(name="player", description="Look up an NFL player.")
+@app_commands.describe(player="Start typing a name, team or position")
+@app_commands.autocomplete(player=player_autocomplete)
+async def player(interaction: discord.Interaction, player: str):
+    cfg = guild_config(interaction.guild_id)
+    await interaction.response.defer(thinking=True)
+    lap("defer")
+    store = await get_players()
+    p = store.get(player)
+    if p is None:
+        index = get_index(store)
+        hits = index.search(player, k=1) if index else []
+        p = store.get(hits[0][0]) if hits else None
+        player = hits[0][0] if hits else player
+    if p is None:
+        await interaction.followup.send(
+            embed=card("Player not found", f"No player matches “{player}”.", WARN)
+        )
+        return
+
+    e = card(player_label(p), color=PRIMARY)
+    add_kv(e, "Position", p.get("position") or "—", inline=True)
+    add_kv(e, "Team", p.get("team") or "Free agent", inline=True)
+    add_kv(e, "Status", p.get("injury_status") or p.get("status") or "—", inline=True)
+    if p.get("age"):
+        add_kv(e, "Age", str(p["age"]), inline=True)
+    if p.get("years_exp") is not None:
+        add_kv(e, "Experience", f"{p['years_exp']} yr", inline=True)
+    lid = league_id_effective(cfg)
+    if lid:
+        users, rosters = await asyncio.gather(get_users(lid), get_standings(lid))
+        owner = next((r.roster_id for r in rosters if player in r.players), None)
+        owner_name = _name_map(users, rosters).get(owner, "Free agent") if owner else "Free agent"
+        add_kv(e, "Rostered by", owner_name, inline=True)
+    e.set_footer(text=f"Sleeper player ID: {player}")
+    lap("render")
+    await interaction.followup.send(embed=e)
+
+# (league, roster) -> (key, embed)
+_roster_embeds: dict[tuple[str, int], tuple[str, discord.Embed]] = {}
+
+def build_roster_embed(name: str, roster: Roster, players: dict[str, dict],
+                       slots: list[str] | None) -> discord.Embed:
+    g = group_roster(roster, players, slots)
+    e = card(name, f"Record **{roster.record}**", color=PRIMARY)
+    if g.starters:
+        add_lines(e, "Starters", [f"`{slot:<5}` {label}" for slot, label in g.starters])
+    for pos, labels in g.bench.items():
+        add_lines(e, f"Bench · {pos}", labels, inline=True)
+    if g.reserve:
+        add_lines(e, "IR", g.reserve, inline=True)
+    if g.taxi:
+        add_lines(e, "Taxi", g.taxi, inline=True)
+    e.set_footer(text=f"Roster ID: {roster.roster_id}")
+    return e
+
+def _cached_roster_embed(lid: str, rid: int, key: str,
+                         build: Callable[[], discord.Embed]) -> discord.Embed:
+    """Reuse the last render while key matches; each send gets a copy stamped with now."""
+    hit = _roster_embeds.get((lid, rid))
+    if hit is None or hit[0] != key:
+        hit = _roster_embeds[(lid, rid)] = (key, build())
+    e = hit[1].copy()
+    e.timestamp = discord.utils.utcnow()
+    return e
+
+async def roster_autocomplete(interaction: discord.Interaction,
+                              current: str) -> list[app_commands.Choice[str]]:
+    if not interaction.guild_id:
+        return []
+    lid = league_id_effective(guild_config(interaction.guild_id))
+    if not lid:
+        return []
+    users, rosters = await asyncio.gather(get_users(lid), get_standings(lid))
+    names = _name_map(users, rosters)
+    needle = current.lower()
+    ranked = sorted(names.items(), key=lambda kv: kv[1].lower())
+    return [app_commands.Choice(name=n[:100], value=str(rid))
+            for rid, n in ranked if needle in n.lower()][:25]
+
+@bot.tree.command(name="roster", description="Show a team's starters and bench.")
+@app_commands.describe(team="Team (start typing an owner name)")
+@app_commands.autocomplete(team=roster_autocomplete)
+async def roster(interaction: discord.Interaction, team: str):
+    cfg = guild_config(interaction.guild_id)
+    await interaction.response.defer(thinking=True)
+    lap("defer")
+    lid = league_id_effective(cfg)
+    if not lid:
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
+        return
+    league_data, users, rosters = await asyncio.gather(
+        get_league(lid), get_users(lid), get_standings(lid)
+    )
+    names = _name_map(users, rosters)
+    r = next((r for r in rosters if str(r.roster_id) == team), None)
+    if r is None:
+        r = next((r for r in rosters if names.get(r.roster_id, "").lower() == team.lower()), None)
+    if r is None:
+        await interaction.followup.send(
+            embed=card("Roster not found", f"No team matches “{team}”.", WARN)
+        )
+        return
+
+    rid = r.roster_id
+    store = await get_players()
+    lap("fetch")
+    key = f"{roster_fingerprint(r)}:{names.get(rid)}:{r.record}:{store.meta().get('fetched_at')}"
+
+    def render() -> discord.Embed:
+        players = store.get_many(roster_player_ids(r))
+        slots = league_data.roster_positions if league_data else None
+        return build_roster_embed(names.get(rid, f"Roster {rid}"), r, players, slots)
+
+    embed = _cached_roster_embed(lid, rid, key, render)
+    lap("render")
+    await interaction.followup.send(embed=embed)
+
+@bot.tree.command(
+    name="schedule",
+    description="Show matchups for a given week (defaults to current).",
+)
 @app_commands.describe(week="NFL week number (optional)")
 async def schedule(interaction: discord.Interaction, week: int | None = None):
+    cfg = guild_config(interaction.guild_id)
     await interaction.response.defer(thinking=True)
-    lid = league_id_effective()
+    lap("defer")
+    lid = league_id_effective(cfg)
     if not lid:
-        await interaction.followup.send(embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN))
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
         return
-    if week is None:
-        state = await get_nfl_state()
-        week = int(state.get("week") or 1)
-    e = await build_week_preview_embed(lid, week)
+    ctx = await load_week_context(lid, week)
+    lap("fetch")
+    e = build_week_preview_embed(ctx)
+    lap("render")
     await interaction.followup.send(embed=e)
 
 @bot.tree.command(name="results", description="Show final (or current) results for a given week.")
 @app_commands.describe(week="NFL week number (optional)")
 async def results(interaction: discord.Interaction, week: int | None = None):
+    cfg = guild_config(interaction.guild_id)
     await interaction.response.defer(thinking=True)
-    lid = league_id_effective()
+    lap("defer")
+    lid = league_id_effective(cfg)
     if not lid:
-        await interaction.followup.send(embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN))
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
         return
-    state = await get_nfl_state()
-    current_week = int(state.get("week") or 1)
-    if week is None:
-        week = current_week
-    e = await build_week_results_embed(lid, week)
+    ctx = await load_week_context(lid, week)
+    lap("fetch")
+    e = build_week_results_embed(ctx)
+    lap("render")
     await interaction.followup.send(embed=e)
 
+@bot.tree.command(name="transactions", description="Show recent league transactions.")
+@app_commands.describe(days="Lookback in days (defaults to config default_days)")
+async def transactions(interaction: discord.Interaction, days: int | None = None):
+    cfg = guild_config(interaction.guild_id)
+    await interaction.response.defer(thinking=True)
+    lap("defer")
+    lid = league_id_effective(cfg)
+    if not lid:
+        await interaction.followup.send(
+            embed=card("Not configured", "No league ID set. Use /config set league_id.", WARN)
+        )
+        return
+    days = max(1, min(60, days or cfg.default_days))
+
+    async def _txns():
+        state = await get_nfl_state()
+        return await recent_transactions(lid, days, int(state.get("week") or 1))
+
+    users, rosters, players, txns = await asyncio.gather(
+        get_users(lid), get_standings(lid), get_players(), _txns()
+    )
+    lap("fetch")
+    title = f"Transactions — last {days} day{'s' if days != 1 else ''}"
+    if not txns:
+        await interaction.followup.send(
+            embed=card(title, "No completed transactions in that window.", INFO)
+        )
+        return
+    roster_name = _name_map(users, rosters)
+    resolved = players.get_many(transaction_player_ids(txns))
+    lines = [format_transaction(t, roster_name, resolved) for t in txns]
+    pages = paginate(title, lines, INFO)
+    lap("render")
+    await send_pages(interaction, pages)
+
 # ----- Admin-only: announce + manual preview/results -----
 
 def _is_commissioner_decorator():
@@ -344,7 +1156,48 @@ def _is_commissioner_decorator():
         return commissioner_check(interaction)
     return app_commands.check(predicate)
 
-@bot.tree.command(name="announce", description="(Commissioner only) Post an announcement to a channel.")
+def _league_destinations(
+    origin_gid: int, lid: str, broadcast: bool, include_origin: bool = True
+) -> tuple[list[Delivery], list[DeliveryResult]]:
+    """Announce-channel deliveries for the origin guild, or every guild on the same league.
+
+    Returns (deliveries, skipped) where skipped are guilds with no usable channel.
+    """
+    gids = []
+    if broadcast:
+        gids = [g for g, c in CONFIGS.items() if g != origin_gid and league_id_effective(c) == lid]
+    if include_origin:
+        gids.insert(0, origin_gid)
+    deliveries, skipped = [], []
+    for gid in gids:
+        cfg = guild_config(gid)
+        guild = bot.get_guild(gid)
+        channel = None
+        if guild and cfg.announce_channel_id:
+            channel = guild.get_channel(cfg.announce_channel_id)
+        if channel is None:
+            label = guild.name if guild else f"Guild {gid}"
+            skipped.append(
+                DeliveryResult(label, False, error="announce channel not set or not found")
+            )
+            continue
+        content, allowed = _role_mention(guild, cfg)
+        deliveries.append(Delivery(channel, f"{guild.name} {channel.mention}", content, allowed))
+    return deliveries, skipped
+
+def _delivery_report(title: str, results: list[DeliveryResult]) -> discord.Embed:
+    ok = sum(r.ok for r in results)
+    lines = [
+        f"✅ {r.label} — [Jump to message]({r.jump_url})" if r.ok else f"❌ {r.label} — {r.error}"
+        for r in results
+    ]
+    color = SUCCESS if ok == len(results) else (WARN if ok else ERROR)
+    return paginate(f"{title} — {ok}/{len(results)} delivered", lines, color)[0]
+
+@bot.tree.command(
+    name="announce",
+    description="(Commissioner only) Post an announcement to a channel.",
+)
 @_is_commissioner_decorator()
 @app_commands.describe(
     channel="Target channel (optional, uses config default if omitted)",
@@ -352,7 +1205,8 @@ def _is_commissioner_decorator():
     body="Main announcement text",
     role="Optional role to ping (uses config default if omitted)",
     ping="If true, tag the role",
-    image_url="Optional image URL"
+    image_url="Optional image URL",
+    broadcast="Also post to every other server following this league",
 )
 async def announce(
     interaction: discord.Interaction,
@@ -362,15 +1216,26 @@ async def announce(
     role: discord.Role | None = None,
     ping: bool = False,
     image_url: str | None = None,
+    broadcast: bool = False,
 ):
+    cfg = guild_config(interaction.guild_id)
     await interaction.response.defer(thinking=True, ephemeral=True)
+    lap("defer")
     try:
-        target_channel = channel or (interaction.guild.get_channel(CFG.announce_channel_id) if CFG.announce_channel_id else None)
+        target_channel = channel or (
+            interaction.guild.get_channel(cfg.announce_channel_id)
+            if cfg.announce_channel_id else None
+        )
         if not target_channel:
-            await interaction.followup.send(embed=card("Missing channel", "Provide channel: or set a default via /config set announce_channel.", WARN), ephemeral=True)
+            hint = "Provide channel: or set a default via /config set announce_channel."
+            await interaction.followup.send(
+                embed=card("Missing channel", hint, WARN), ephemeral=True
+            )
             return
 
-        target_role = role or (interaction.guild.get_role(CFG.announce_role_id) if CFG.announce_role_id else None)
+        target_role = role or (
+            interaction.guild.get_role(cfg.announce_role_id) if cfg.announce_role_id else None
+        )
 
         e = card(title, body, color=PRIMARY)
         if image_url:
@@ -385,69 +1250,199 @@ async def announce(
             content = target_role.mention
             allowed = discord.AllowedMentions(roles=True)
 
-        msg = await target_channel.send(content=content, embed=e, allowed_mentions=allowed)
-        await interaction.followup.send(embed=card("Announcement sent ✅", f"Posted to {target_channel.mention}\n[Jump to message]({msg.jump_url})", SUCCESS), ephemeral=True)
+        label = f"{interaction.guild.name} {target_channel.mention}"
+        deliveries = [Delivery(target_channel, label, content, allowed)]
+        skipped = []
+        lid = league_id_effective(cfg)
+        if broadcast and lid:
+            others, skipped = _league_destinations(
+                interaction.guild_id, lid, True, include_origin=False
+            )
+            if not ping:
+                for d in others:
+                    d.content, d.allowed_mentions = None, discord.AllowedMentions.none()
+            deliveries += others
+        results = await get_queue().broadcast([e], deliveries)
+        await interaction.followup.send(
+            embed=_delivery_report("Announcement sent", results + skipped), ephemeral=True
+        )
     except discord.Forbidden:
-        await interaction.followup.send(embed=card("Permission error", "I don't have permission to post in that channel.", ERROR), ephemeral=True)
+        hint = "I don't have permission to post in that channel."
+        await interaction.followup.send(embed=card("Permission error", hint, ERROR), ephemeral=True)
     except Exception as ex:
-        await interaction.followup.send(embed=card("Error sending announcement", f"{ex}", ERROR), ephemeral=True)
+        await interaction.followup.send(
+            embed=card("Error sending announcement", f"{ex}", ERROR), ephemeral=True
+        )
 
-@bot.tree.command(name="announce_preview", description="(Commissioner only) Manually post this week's preview to default channel.")
+@bot.tree.command(
+    name="announce_preview",
+    description="(Commissioner only) Manually post this week's preview to default channel.",
+)
 @_is_commissioner_decorator()
-async def announce_preview(interaction: discord.Interaction):
+@app_commands.describe(broadcast="Also post to every other server following this league")
+async def announce_preview(interaction: discord.Interaction, broadcast: bool = False):
+    cfg = guild_config(interaction.guild_id)
     await interaction.response.defer(thinking=True, ephemeral=True)
-    lid = league_id_effective()
-    if not lid or not CFG.announce_channel_id:
-        await interaction.followup.send(embed=card("Not configured", "Set league_id and nnounce_channel in /config set.", WARN), ephemeral=True)
+    lap("defer")
+    lid = league_id_effective(cfg)
+    if not lid or not cfg.announce_channel_id:
+        hint = "Set league_id and announce_channel in /config set."
+        await interaction.followup.send(embed=card("Not configured", hint, WARN), ephemeral=True)
         return
-    guild = interaction.guild
-    channel = guild.get_channel(CFG.announce_channel_id)
-    if not channel:
-        await interaction.followup.send(embed=card("Channel not found", "Update /config set announce_channel.", WARN), ephemeral=True)
+    deliveries, skipped = _league_destinations(interaction.guild_id, lid, broadcast)
+    if not deliveries and not broadcast:
+        await interaction.followup.send(
+            embed=card("Channel not found", "Update /config set announce_channel.", WARN),
+            ephemeral=True,
+        )
         return
-    state = await get_nfl_state()
-    week = int(state.get("week") or 1)
-    e = await build_week_preview_embed(lid, week)
+    ctx = await load_week_context(lid)
+    e = build_week_preview_embed(ctx)  # rendered once, reused for every destination
 
-    content = None
-    allowed = discord.AllowedMentions.none()
-    if CFG.announce_role_id:
-        role = guild.get_role(CFG.announce_role_id)
-        if role:
-            content = role.mention
-            allowed = discord.AllowedMentions(roles=True)
-
-    msg = await channel.send(content=content, embed=e, allowed_mentions=allowed)
-    await interaction.followup.send(embed=card("Preview sent ✅", f"Posted to {channel.mention}\n[Jump to message]({msg.jump_url})", SUCCESS), ephemeral=True)
+    results = await get_queue().broadcast([e], deliveries)
+    await interaction.followup.send(
+        embed=_delivery_report("Preview sent", skipped + results), ephemeral=True
+    )
 
-@bot.tree.command(name="announce_results", description="(Commissioner only) Manually post last week's results to default channel.")
+@bot.tree.command(
+    name="announce_results",
+    description="(Commissioner only) Manually post last week's results to default channel.",
+)
 @_is_commissioner_decorator()
-async def announce_results(interaction: discord.Interaction):
+@app_commands.describe(broadcast="Also post to every other server following this league")
+async def announce_results(interaction: discord.Interaction, broadcast: bool = False):
+    cfg = guild_config(interaction.guild_id)
     await interaction.response.defer(thinking=True, ephemeral=True)
-    lid = league_id_effective()
-    if not lid or not CFG.announce_channel_id:
-        await interaction.followup.send(embed=card("Not configured", "Set league_id and nnounce_channel in /config set.", WARN), ephemeral=True)
+    lap("defer")
+    lid = league_id_effective(cfg)
+    if not lid or not cfg.announce_channel_id:
+        hint = "Set league_id and announce_channel in /config set."
+        await interaction.followup.send(embed=card("Not configured", hint, WARN), ephemeral=True)
         return
-    guild = interaction.guild
-    channel = guild.get_channel(CFG.announce_channel_id)
-    if not channel:
-        await interaction.followup.send(embed=card("Channel not found", "Update /config set announce_channel.", WARN), ephemeral=True)
+    deliveries, skipped = _league_destinations(interaction.guild_id, lid, broadcast)
+    if not deliveries and not broadcast:
+        await interaction.followup.send(
+            embed=card("Channel not found", "Update /config set announce_channel.", WARN),
+            ephemeral=True,
+        )
         return
-    state = await get_nfl_state()
-    current_week = int(state.get("week") or 1)
-    week = max(1, current_week - 1)
-    e = await build_week_results_embed(lid, week)
+    ctx = await load_week_context(lid, week_offset=-1)
+    e = build_week_results_embed(ctx)  # rendered once, reused for every destination
 
-    content = None
-    allowed = discord.AllowedMentions.none()
-    if CFG.announce_role_id:
-        role = guild.get_role(CFG.announce_role_id)
-        if role:
-            content = role.mention
-            allowed = discord.AllowedMentions(roles=True)
+    results = await get_queue().broadcast([e], deliveries)
+    await interaction.followup.send(
+        embed=_delivery_report("Results sent", skipped + results), ephemeral=True
+    )
+
+@bot.tree.command(
+    name="cache_stats",
+    description="(Commissioner only) Show Sleeper cache hit/miss counters.",
+)
+@_is_commissioner_decorator()
+async def cache_stats_cmd(interaction: discord.Interaction):
+    s = cache_stats()
+    e = card("Sleeper Cache", color=INFO)
+    add_kv(e, "Entries", f"{s['size']} / {s['maxsize']}", inline=True)
+    add_kv(e, "Hits", str(s["hits"]), inline=True)
+    add_kv(e, "Misses", str(s["misses"]), inline=True)
+    add_kv(e, "Coalesced", str(s["coalesced"]), inline=True)
+    add_kv(e, "Evictions", str(s["evictions"]), inline=True)
+    add_kv(e, "Hit ratio", f"{s['hit_ratio']:.1%}", inline=True)
+    await interaction.response.send_message(embed=e, ephemeral=True)
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms"
 
-    msg = await channel.send(content=content, embed=e, allowed_mentions=allowed)
-    await interaction.followup.send(embed=card("Results sent ✅", f"Posted to {channel.mention}\n[Jump to message]({msg.jump_url})", SUCCESS), ephemeral=True)
+@bot.tree.command(
+    name="stats",
+    description="(Commissioner only) Show latency, upstream and cache metrics.",
+)
+@_is_commissioner_decorator()
+async def stats(interaction: discord.Interaction):
+    uptime = timedelta(seconds=int(time.monotonic() - _STARTED))
+    e = card("Bot Stats", f"Uptime {uptime}", color=INFO)
+    phases: dict[str, dict[str, float]] = defaultdict(dict)
+    for labels, h in metrics.histograms("command_phase_seconds").items():
+        d = dict(labels)
+        phases[d["command"]][d["phase"]] = h.quantile(0.5)
+    order = ("defer", "fetch", "render", "send")
+    lines = []
+    for command, n, p50, p95 in summarize("command_seconds", "command")[:10]:
+        split = " · ".join(f"{p} {_ms(phases[command][p])}" for p in order if p in phases[command])
+        detail = f"\n↳ {split}" if split else ""
+        lines.append(f"`/{command}` ×{n} p50 {_ms(p50)} p95 {_ms(p95)}{detail}")
+    add_kv(e, "Commands", "\n".join(lines)[:1024] or "No commands yet.")
+
+    statuses: dict[str, list[str]] = defaultdict(list)
+    for labels, count in sorted(metrics.counters("sleeper_responses_total").items()):
+        d = dict(labels)
+        statuses[d["endpoint"]].append(f"{d['status']}×{count:g}")
+    lines = [f"`{ep}` ×{n} p50 {_ms(p50)} p95 {_ms(p95)} ({', '.join(statuses[ep])})"
+             for ep, n, p50, p95 in summarize("sleeper_request_seconds", "endpoint")[:10]]
+    add_kv(e, "Sleeper endpoints", "\n".join(lines)[:1024] or "No upstream calls yet.")
+
+    c = cache_stats()
+    add_kv(e, "Cache", f"{c['hit_ratio']:.1%} hits "
+                       f"({c['hits']} hit / {c['misses']} miss / {c['coalesced']} coalesced)")
+    lines = [f"`{job}` ×{n} p50 {_ms(p50)} p95 {_ms(p95)}"
+             for job, n, p50, p95 in summarize("job_seconds", "job")]
+    add_kv(e, "Scheduler jobs", "\n".join(lines)[:1024] or "No jobs run yet.")
+    await interaction.response.send_message(embed=e, ephemeral=True)
+
+@bot.tree.command(
+    name="resync",
+    description="(Commissioner only) Force a slash-command sync with Discord.",
+)
+@_is_commissioner_decorator()
+async def resync(interaction: discord.Interaction):
+    await interaction.response.defer(thinking=True, ephemeral=True)
+    lap("defer")
+    count = await sync_commands(force=True)
+    await interaction.followup.send(
+        embed=card("Commands synced ✅", f"{count} command(s) registered with Discord.", SUCCESS),
+        ephemeral=True,
+    )
+
+@bot.tree.command(name="live", description="(Commissioner only) Start or stop the live scoreboard.")
+@_is_commissioner_decorator()
+@app_commands.describe(
+    enabled="Turn the live scoreboard on or off",
+    channel="Channel for the pinned scoreboard (defaults to the announce channel)",
+)
+async def live(interaction: discord.Interaction, enabled: bool,
+               channel: discord.TextChannel | None = None):
+    cfg = guild_config(interaction.guild_id)
+    await interaction.response.defer(thinking=True, ephemeral=True)
+    lap("defer")
+    if not enabled:
+        cfg.live_enabled = False
+        await save_guild_configs()
+        if bot.scheduler:
+            _register_live_job(bot.scheduler, interaction.guild_id)
+        await interaction.followup.send(
+            embed=card("Live scoreboard stopped", color=INFO), ephemeral=True
+        )
+        return
+
+    target = channel or (
+        interaction.guild.get_channel(cfg.announce_channel_id) if cfg.announce_channel_id else None
+    )
+    if not target:
+        hint = "Provide channel: or set /config set announce_channel."
+        await interaction.followup.send(embed=card("Missing channel", hint, WARN), ephemeral=True)
+        return
+    if target.id != cfg.live_channel_id:
+        cfg.live_message_id = None  # start a fresh message in the new channel
+    cfg.live_channel_id = target.id
+    cfg.live_enabled = True
+    await save_guild_configs()
+    bot.live_hash.pop(interaction.guild_id, None)
+    await _update_live_scoreboard(interaction.guild_id, force=True)
+    if bot.scheduler:
+        _register_live_job(bot.scheduler, interaction.guild_id)
+    started = card("Live scoreboard started ✅",
+                   f"Updating in {target.mention} when scores change.", SUCCESS)
+    await interaction.followup.send(embed=started, ephemeral=True)
 
 # ---------- /config (commissioner only) ----------
 
@@ -461,21 +1456,36 @@ bot.tree.add_command(config_group)
 @config_group.command(name="get", description="Show current configuration.")
 @_is_commissioner_decorator()
 async def config_get(interaction: discord.Interaction):
+    cfg = guild_config(interaction.guild_id)
     e = card("Current Configuration", color=PRIMARY)
-    add_kv(e, "league_id", str(CFG.league_id or ENV_LEAGUE_ID or "—"))
-    add_kv(e, "announce_channel_id", str(CFG.announce_channel_id or "—"))
-    add_kv(e, "announce_role_id", str(CFG.announce_role_id or "—"))
-    add_kv(e, "default_days", str(CFG.default_days))
+    add_kv(e, "league_id", str(cfg.league_id or ENV_LEAGUE_ID or "—"))
+    add_kv(e, "announce_channel_id", str(cfg.announce_channel_id or "—"))
+    add_kv(e, "announce_role_id", str(cfg.announce_role_id or "—"))
+    add_kv(e, "default_days", str(cfg.default_days))
     # preview schedule
-    add_kv(e, "schedule_enabled", str(CFG.schedule_enabled))
-    add_kv(e, "schedule_dow", str(CFG.schedule_dow))
-    add_kv(e, "schedule_hour", str(CFG.schedule_hour))
-    add_kv(e, "schedule_minute", str(CFG.schedule_minute))
+    add_kv(e, "schedule_enabled", str(cfg.schedule_enabled))
+    add_kv(e, "schedule_dow", str(cfg.schedule_dow))
+    add_kv(e, "schedule_hour", str(cfg.schedule_hour))
+    add_kv(e, "schedule_minute", str(cfg.schedule_minute))
     # results schedule
-    add_kv(e, "results_enabled", str(getattr(CFG, "results_enabled", False)))
-    add_kv(e, "results_dow", str(getattr(CFG, "results_dow", 1)))
-    add_kv(e, "results_hour", str(getattr(CFG, "results_hour", 9)))
-    add_kv(e, "results_minute", str(getattr(CFG, "results_minute", 0)))
+    add_kv(e, "results_enabled", str(getattr(cfg, "results_enabled", False)))
+    add_kv(e, "results_dow", str(getattr(cfg, "results_dow", 1)))
+    add_kv(e, "results_hour", str(getattr(cfg, "results_hour", 9)))
+    add_kv(e, "results_minute", str(getattr(cfg, "results_minute", 0)))
+    # cache warming
+    add_kv(e, "warm_enabled", str(cfg.warm_enabled))
+    add_kv(e, "warm_minutes", str(cfg.warm_minutes))
+    add_kv(e, "warm_live_seconds", str(cfg.warm_live_seconds))
+    # live scoreboard
+    add_kv(e, "live_enabled", str(cfg.live_enabled))
+    add_kv(e, "live_channel_id", str(cfg.live_channel_id or "—"))
+    # playoff odds
+    add_kv(e, "odds_iterations", str(cfg.odds_iterations))
+    add_kv(e, "odds_seed", str(cfg.odds_seed if cfg.odds_seed is not None else "—"))
+    add_kv(e, "results_attach_odds", str(cfg.results_attach_odds))
+    add_kv(e, "prerender_minutes", str(cfg.prerender_minutes))
+    # transaction feed
+    add_kv(e, "txn_feed_enabled", str(cfg.txn_feed_enabled))
     await interaction.response.send_message(embed=e, ephemeral=True)
 
 @config_group.command(name="set", description="Update a configuration value.")
@@ -493,6 +1503,14 @@ async def config_get(interaction: discord.Interaction):
     results_dow="Day of week (0=Mon … 6=Sun; Tuesday=1)",
     results_hour="Hour (ET, 0-23)",
     results_minute="Minute (0-59)",
+    warm_enabled="Keep Sleeper data warm in the background?",
+    warm_minutes="Cache warm cadence outside game windows (minutes)",
+    warm_live_seconds="Cache warm cadence during game windows (seconds)",
+    odds_iterations="Default playoff-odds simulation count",
+    odds_seed="Default playoff-odds random seed (-1 to clear)",
+    results_attach_odds="Attach playoff odds to the weekly results post?",
+    txn_feed_enabled="Post new adds/drops/trades to the announce channel?",
+    prerender_minutes="Render scheduled posts this many minutes early (0 = at send time)",
 )
 async def config_set(
     interaction: discord.Interaction,
@@ -508,54 +1526,89 @@ async def config_set(
     results_dow: int | None = None,
     results_hour: int | None = None,
     results_minute: int | None = None,
+    warm_enabled: bool | None = None,
+    warm_minutes: int | None = None,
+    warm_live_seconds: int | None = None,
+    odds_iterations: int | None = None,
+    odds_seed: int | None = None,
+    results_attach_odds: bool | None = None,
+    txn_feed_enabled: bool | None = None,
+    prerender_minutes: int | None = None,
 ):
+    cfg = guild_config(interaction.guild_id)
     changed = []
     if league_id is not None:
-        CFG.league_id = league_id.strip()
+        cfg.league_id = league_id.strip()
         changed.append("league_id")
     if announce_channel is not None:
-        CFG.announce_channel_id = announce_channel.id
+        cfg.announce_channel_id = announce_channel.id
         changed.append("announce_channel_id")
     if announce_role is not None:
-        CFG.announce_role_id = announce_role.id
+        cfg.announce_role_id = announce_role.id
         changed.append("announce_role_id")
     if default_days is not None:
-        CFG.default_days = max(1, min(60, int(default_days)))
+        cfg.default_days = max(1, min(60, int(default_days)))
         changed.append("default_days")
     if schedule_enabled is not None:
-        CFG.schedule_enabled = bool(schedule_enabled)
+        cfg.schedule_enabled = bool(schedule_enabled)
         changed.append("schedule_enabled")
     if schedule_dow is not None:
-        CFG.schedule_dow = max(0, min(6, int(schedule_dow)))
+        cfg.schedule_dow = max(0, min(6, int(schedule_dow)))
         changed.append("schedule_dow")
     if schedule_hour is not None:
-        CFG.schedule_hour = max(0, min(23, int(schedule_hour)))
+        cfg.schedule_hour = max(0, min(23, int(schedule_hour)))
         changed.append("schedule_hour")
     if schedule_minute is not None:
-        CFG.schedule_minute = max(0, min(59, int(schedule_minute)))
+        cfg.schedule_minute = max(0, min(59, int(schedule_minute)))
         changed.append("schedule_minute")
     if results_enabled is not None:
-        CFG.results_enabled = bool(results_enabled)
+        cfg.results_enabled = bool(results_enabled)
         changed.append("results_enabled")
     if results_dow is not None:
-        CFG.results_dow = max(0, min(6, int(results_dow)))
+        cfg.results_dow = max(0, min(6, int(results_dow)))
         changed.append("results_dow")
     if results_hour is not None:
-        CFG.results_hour = max(0, min(23, int(results_hour)))
+        cfg.results_hour = max(0, min(23, int(results_hour)))
         changed.append("results_hour")
     if results_minute is not None:
-        CFG.results_minute = max(0, min(59, int(results_minute)))
+        cfg.results_minute = max(0, min(59, int(results_minute)))
         changed.append("results_minute")
+    if warm_enabled is not None:
+        cfg.warm_enabled = bool(warm_enabled)
+        changed.append("warm_enabled")
+    if warm_minutes is not None:
+        cfg.warm_minutes = max(1, min(60, int(warm_minutes)))
+        changed.append("warm_minutes")
+    if warm_live_seconds is not None:
+        cfg.warm_live_seconds = max(10, min(600, int(warm_live_seconds)))
+        changed.append("warm_live_seconds")
+    if odds_iterations is not None:
+        cfg.odds_iterations = max(100, min(ODDS_MAX_ITERATIONS, int(odds_iterations)))
+        changed.append("odds_iterations")
+    if odds_seed is not None:
+        cfg.odds_seed = None if odds_seed < 0 else int(odds_seed)
+        changed.append("odds_seed")
+    if results_attach_odds is not None:
+        cfg.results_attach_odds = bool(results_attach_odds)
+        changed.append("results_attach_odds")
+    if txn_feed_enabled is not None:
+        cfg.txn_feed_enabled = bool(txn_feed_enabled)
+        changed.append("txn_feed_enabled")
+    if prerender_minutes is not None:
+        cfg.prerender_minutes = max(0, min(120, int(prerender_minutes)))
+        changed.append("prerender_minutes")
 
-    save_config(CFG)
+    await save_guild_configs()
 
     # (Re)register jobs with latest config
     if bot.scheduler:
-        _register_preview_job(bot.scheduler)
-        _register_results_job(bot.scheduler)
+        _register_guild_jobs(bot.scheduler, interaction.guild_id)
+        _register_warm_job(bot.scheduler)
 
     if not changed:
-        await interaction.response.send_message(embed=card("No changes", "Provide at least one field to update.", WARN), ephemeral=True)
+        await interaction.response.send_message(
+            embed=card("No changes", "Provide at least one field to update.", WARN), ephemeral=True
+        )
         return
 
     e = card("Config updated ✅", color=SUCCESS)
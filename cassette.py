@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+
+import httpx
+from loguru import logger
+
+RECORD = "record"
+REPLAY = "replay"
+MODES = (RECORD, REPLAY)
+
+# Hop-by-hop/encoding headers that no longer describe a stored (decoded) body
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class CassetteMiss(LookupError):
+    """Replay was asked for a request that was never recorded."""
+
+
+def cassette_key(request: httpx.Request) -> str:
+    """Method, path and sorted query: the same call replays whatever host it was recorded from."""
+    query = sorted(request.url.params.multi_items())
+    key = f"{request.method} {request.url.path}"
+    return key + "?" + "&".join(f"{k}={v}" for k, v in query) if query else key
+
+
+class Cassette:
+    """SQLite file of upstream responses keyed by cassette_key; the newest recording wins."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers TEXT,"
+            " body BLOB, recorded_at REAL) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, key: str) -> tuple[int, list, bytes] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), row[2]
+
+    def put(self, key: str, url: str, status: int, headers: list, body: bytes) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(headers), body, time.time()),
+            )
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return [k for (k,) in self._conn.execute("SELECT key FROM responses ORDER BY key")]
+
+
+class CassetteTransport(httpx.AsyncBaseTransport):
+    """Record responses from `inner` to a cassette, or replay them without network.
+
+    Replay sleeps `latency` seconds per request to mimic a slow upstream. Transient
+    failures (429/5xx) and bodiless 304s are not recorded, so a flaky capture never
+    replays as an outage and conditional requests replay the full payload.
+    """
+
+    def __init__(self, cassette: Cassette, mode: str, inner: httpx.AsyncBaseTransport | None = None,
+                 latency: float = 0.0):
+        if mode not in MODES:
+            raise ValueError(f"cassette mode must be one of {MODES}, not {mode!r}")
+        self.cassette = cassette
+        self.mode = mode
+        self.inner = inner
+        self.latency = latency
+        logger.info(
+            f"Sleeper cassette {mode} mode ({cassette.path}, latency={latency * 1000:.0f}ms)."
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = cassette_key(request)
+        if self.mode == REPLAY:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            hit = await asyncio.to_thread(self.cassette.get, key)
+            if hit is None:
+                raise CassetteMiss(f"{key} is not in cassette {self.cassette.path}")
+            status, headers, body = hit
+            return httpx.Response(status, headers=headers, content=body, request=request)
+
+        response = await self.inner.handle_async_request(request)
+        body = await httpx.Response(response.status_code, headers=response.headers,
+                                    stream=response.stream).aread()
+        headers = [
+            (k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROP_HEADERS
+        ]
+        status = response.status_code
+        if status not in (304, 429) and status < 500:
+            await asyncio.to_thread(self.cassette.put, key, str(request.url), status, headers, body)
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    async def aclose(self) -> None:
+        if self.inner is not None:
+            await self.inner.aclose()
+        self.cassette.close()
+
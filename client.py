@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import random
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
+from loguru import logger
+
+import metrics
+from cassette import REPLAY, Cassette, CassetteTransport
+
+# Connection settings (env-overridable)
+HTTP2 = (os.getenv("SLEEPER_HTTP2") or "").strip().lower() in {"1", "true", "yes"}
+MAX_CONNECTIONS = int(os.getenv("SLEEPER_MAX_CONNECTIONS", "20") or 20)
+MAX_KEEPALIVE = int(os.getenv("SLEEPER_MAX_KEEPALIVE", "10") or 10)
+KEEPALIVE_EXPIRY = float(os.getenv("SLEEPER_KEEPALIVE_EXPIRY", "30") or 30)
+TIMEOUT = float(os.getenv("SLEEPER_TIMEOUT", "10") or 10)
+CONNECT_TIMEOUT = float(os.getenv("SLEEPER_CONNECT_TIMEOUT", "5") or 5)
+
+# Resilience settings (env-overridable); Sleeper asks clients to stay under 1000 calls/min
+RATE_PER_MINUTE = float(os.getenv("SLEEPER_RATE_PER_MINUTE", "600") or 600)
+RATE_BURST = int(os.getenv("SLEEPER_RATE_BURST", "20") or 20)
+MAX_RETRIES = int(os.getenv("SLEEPER_MAX_RETRIES", "3") or 3)
+BACKOFF_BASE = float(os.getenv("SLEEPER_BACKOFF_BASE", "0.5") or 0.5)
+BACKOFF_CAP = float(os.getenv("SLEEPER_BACKOFF_CAP", "8") or 8)
+BREAKER_THRESHOLD = int(os.getenv("SLEEPER_BREAKER_THRESHOLD", "5") or 5)
+BREAKER_RESET = float(os.getenv("SLEEPER_BREAKER_RESET", "30") or 30)
+
+# Record/replay (see cassette.py): SLEEPER_CASSETTE_MODE=record|replay, SLEEPER_CASSETTE=path
+CASSETTE_MODE = (os.getenv("SLEEPER_CASSETTE_MODE") or "").strip().lower()
+CASSETTE_PATH = os.getenv("SLEEPER_CASSETTE") or "sleeper_cassette.db"
+CASSETTE_LATENCY_MS = float(os.getenv("SLEEPER_CASSETTE_LATENCY_MS", "0") or 0)
+
+_client: httpx.AsyncClient | None = None
+
+
+class UpstreamUnavailable(Exception):
+    """Sleeper is failing (retries exhausted) or the circuit breaker is open."""
+
+
+class TokenBucket:
+    """Async token bucket shared by every Sleeper request."""
+
+    def __init__(self, rate_per_minute: float, burst: int, name: str = "Sleeper"):
+        self.name = name
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.throttled = False
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:  # FIFO: waiters are served in arrival order
+            self._refill()
+            while self.tokens < 1:
+                if not self.throttled:
+                    self.throttled = True
+                    logger.warning(f"{self.name} rate limiter engaged; throttling requests.")
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            if self.throttled and self.tokens >= self.capacity / 2:
+                self.throttled = False
+                logger.info(f"{self.name} rate limiter released.")
+            self.tokens -= 1
+
+
+class CircuitBreaker:
+    """closed -> open after `threshold` consecutive failures; half-open after `reset` seconds.
+
+    Half-open lets a single probe through; everything else is rejected until it
+    succeeds (closed) or fails (open again). A probe that never reports back (e.g. a
+    cancelled request) is given up on after another `reset` seconds.
+    """
+
+    def __init__(self, threshold: int, reset: float):
+        self.threshold = threshold
+        self.reset = reset
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_at: float | None = None  # when the in-flight half-open probe started
+
+    def _transition(self, state: str) -> None:
+        if state != self.state:
+            log = logger.warning if state == "open" else logger.info
+            log(f"Sleeper circuit breaker: {self.state} -> {state} (failures={self.failures}).")
+            self.state = state
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        if self.state == "open" and now - self._opened_at >= self.reset:
+            self._transition("half_open")
+        if self.state == "half_open":
+            if self._probe_at is not None and now - self._probe_at < self.reset:
+                return False
+            self._probe_at = now
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probe_at = None
+        self._transition("closed")
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_at = None
+        if self.state == "half_open" or self.failures >= self.threshold:
+            self._opened_at = time.monotonic()
+            self._transition("open")
+
+
+_bucket = TokenBucket(RATE_PER_MINUTE, RATE_BURST)
+_breaker = CircuitBreaker(BREAKER_THRESHOLD, BREAKER_RESET)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = HTTP2
+    if http2 and not _http2_available():
+        logger.warning("SLEEPER_HTTP2 is set but the 'h2' package is missing; using HTTP/1.1.")
+        http2 = False
+    logger.info(
+        f"HTTP client created (http2={http2}, max_connections={MAX_CONNECTIONS}, "
+        f"keepalive={MAX_KEEPALIVE})."
+    )
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(TIMEOUT, connect=CONNECT_TIMEOUT)
+    if CASSETTE_MODE:
+        inner = (
+            None if CASSETTE_MODE == REPLAY
+            else httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        )
+        transport = CassetteTransport(
+            Cassette(CASSETTE_PATH), CASSETTE_MODE, inner, CASSETTE_LATENCY_MS / 1000
+        )
+        return httpx.AsyncClient(transport=transport, timeout=timeout)
+    return httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
+
+
+async def start_client() -> httpx.AsyncClient:
+    """Create the shared pooled client (idempotent)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client and release pooled connections."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("HTTP client closed.")
+    _client = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily outside the bot (scripts, tests)."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+def _retryable(r: httpx.Response) -> bool:
+    return r.status_code == 429 or r.status_code >= 500
+
+
+def _retry_after(r: httpx.Response | None) -> float:
+    try:
+        return float(r.headers.get("retry-after", 0)) if r is not None else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _record(url: str, started: float, status: str) -> None:
+    endpoint = metrics.endpoint_of(url)
+    metrics.observe("sleeper_request_seconds", time.perf_counter() - started, endpoint=endpoint)
+    metrics.inc("sleeper_responses_total", endpoint=endpoint, status=status)
+
+
+async def request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Rate-limited request with jittered exponential retry on 429/5xx/timeouts.
+
+    Raises UpstreamUnavailable when retries are exhausted or the breaker is open;
+    other responses (including 4xx) are returned for the caller to check.
+    """
+    attempt = 0
+    while True:
+        if not _breaker.allow():
+            raise UpstreamUnavailable("Sleeper circuit breaker is open.")
+        if CASSETTE_MODE != REPLAY:  # replays never reach Sleeper, so don't throttle them
+            await _bucket.acquire()
+        r = None
+        started = time.perf_counter()
+        try:
+            r = await get_client().request(method, url, **kwargs)
+        except httpx.TransportError as ex:  # includes timeouts
+            err: Exception = ex
+            _record(url, started, type(ex).__name__)
+        else:
+            _record(url, started, str(r.status_code))
+            if not _retryable(r):
+                _breaker.record_success()
+                return r
+            err = httpx.HTTPStatusError(f"HTTP {r.status_code}", request=r.request, response=r)
+        _breaker.record_failure()
+        if attempt == MAX_RETRIES:
+            raise UpstreamUnavailable(
+                f"{method} {url} failed after {attempt + 1} attempts: {err!r}"
+            ) from err
+        delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+        delay = max(delay, _retry_after(r))
+        logger.warning(
+            f"Sleeper {method} {url} failed ({err!r}); "
+            f"retry {attempt + 1}/{MAX_RETRIES} in {delay:.2f}s."
+        )
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+@asynccontextmanager
+async def stream(method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+    """Rate-limited, breaker-guarded streaming request (no retries; callers retry later)."""
+    if not _breaker.allow():
+        raise UpstreamUnavailable("Sleeper circuit breaker is open.")
+    if CASSETTE_MODE != REPLAY:
+        await _bucket.acquire()
+    started = time.perf_counter()
+    try:
+        async with get_client().stream(method, url, **kwargs) as r:
+            _record(url, started, str(r.status_code))  # time to headers
+            if _retryable(r):
+                _breaker.record_failure()
+            else:
+                _breaker.record_success()
+            yield r
+    except httpx.TransportError as ex:
+        _record(url, started, type(ex).__name__)
+        _breaker.record_failure()
+        raise
+
+
+def breaker_state() -> str:
+    return _breaker.state
@@ -1,7 +1,7 @@
 ﻿from __future__ import annotations
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 
 _CONFIG_PATH = "config.json"
 
@@ -24,18 +24,47 @@ class BotConfig:
     results_hour: int = 9
     results_minute: int = 0
 
-def load_config() -> BotConfig:
+    # scheduled posts are rendered this many minutes before they are sent
+    prerender_minutes: int = 10
+
+    # cache warming
+    warm_enabled: bool = True
+    warm_minutes: int = 5          # cadence outside game windows
+    warm_live_seconds: int = 30    # cadence during NFL game windows
+
+    # live scoreboard (one pinned message edited in place)
+    live_enabled: bool = False
+    live_channel_id: int | None = None
+    live_message_id: int | None = None
+
+    # playoff odds simulation
+    odds_iterations: int = 20000
+    odds_seed: int | None = None
+    results_attach_odds: bool = False
+
+    # transaction feed (new adds/drops/trades posted to the announce channel)
+    txn_feed_enabled: bool = False
+
+def _from_dict(data: dict) -> BotConfig:
+    known = {f.name for f in fields(BotConfig)}
+    return BotConfig(**{k: v for k, v in data.items() if k in known})
+
+def load_configs() -> dict[int, BotConfig]:
+    """Return {guild_id: BotConfig}. A legacy single-guild file loads under key 0."""
     if not os.path.exists(_CONFIG_PATH):
-        return BotConfig()
+        return {}
     try:
         with open(_CONFIG_PATH, "r", encoding="utf-8") as f:
             data = json.load(f)
-            return BotConfig(**data)
+        if "guilds" not in data:
+            return {0: _from_dict(data)}
+        return {int(gid): _from_dict(c) for gid, c in data["guilds"].items()}
     except Exception:
-        return BotConfig()
+        return {}
 
-def save_config(cfg: BotConfig) -> None:
+def save_configs(cfgs: dict[int, BotConfig]) -> None:
     tmp = _CONFIG_PATH + ".tmp"
+    data = {"guilds": {str(gid): asdict(c) for gid, c in cfgs.items()}}
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(asdict(cfg), f, indent=2)
+        json.dump(data, f, indent=2)
     os.replace(tmp, _CONFIG_PATH)
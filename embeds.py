@@ -15,3 +15,114 @@ def card(title: str, desc: str | None = None, color: int = PRIMARY) -> discord.E
 
 def add_kv(e: discord.Embed, name: str, value: str, inline: bool = False) -> None:
     e.add_field(name=name, value=value, inline=inline)
+
+FIELD_CHARS = 1024  # Discord: characters per field value
+
+def add_lines(e: discord.Embed, name: str, lines: list[str], inline: bool = False,
+              max_chars: int = FIELD_CHARS) -> None:
+    """Add lines as one field, continued in further "(cont.)" fields past the value limit."""
+    chunks: list[list[str]] = [[]]
+    size = 0
+    for line in lines:
+        line = line[:max_chars]
+        if chunks[-1] and size + len(line) + 1 > max_chars:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(line)
+        size += len(line) + 1
+    for i, chunk in enumerate(chunks):
+        add_kv(e, name if i == 0 else f"{name} (cont.)", "\n".join(chunk), inline)
+
+# Discord limits: 4096 chars per description, 6000 per message across embeds
+PAGE_CHARS = 3800
+
+def paginate(title: str, lines: list[str], color: int = PRIMARY,
+             max_chars: int = PAGE_CHARS) -> list[discord.Embed]:
+    """Split lines into as many description-only cards as needed, with page footers."""
+    pages: list[list[str]] = [[]]
+    size = 0
+    for line in lines:
+        line = line[:max_chars]
+        if pages[-1] and size + len(line) + 1 > max_chars:
+            pages.append([])
+            size = 0
+        pages[-1].append(line)
+        size += len(line) + 1
+    embeds = [card(title, "\n".join(p), color) for p in pages]
+    if len(embeds) > 1:
+        for i, e in enumerate(embeds, start=1):
+            e.set_footer(text=f"Page {i}/{len(embeds)}")
+    return embeds
+
+MESSAGE_EMBEDS = 10     # Discord: embeds per message
+MESSAGE_CHARS = 6000    # Discord: total embed characters per message
+
+def batch_embeds(embeds: list[discord.Embed], max_embeds: int = MESSAGE_EMBEDS,
+                 max_chars: int = MESSAGE_CHARS) -> list[list[discord.Embed]]:
+    """Group embeds into as few messages as Discord's per-message limits allow."""
+    batches: list[list[discord.Embed]] = []
+    size = 0
+    for e in embeds:
+        if not batches or len(batches[-1]) >= max_embeds or size + len(e) > max_chars:
+            batches.append([])
+            size = 0
+        batches[-1].append(e)
+        size += len(e)
+    return batches
+
+class PageView(discord.ui.View):
+    """Prev/next buttons that swap between pre-rendered embeds.
+
+    Only the user who ran the command can page; the buttons are disabled on timeout.
+    """
+
+    def __init__(self, pages: list[discord.Embed], owner_id: int, timeout: float = 300):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.owner_id = owner_id
+        self.index = 0
+        self.message: discord.Message | None = None  # set once sent, for on_timeout
+        self._sync()
+
+    def _sync(self) -> None:
+        self.prev_page.disabled = self.index == 0
+        self.next_page.disabled = self.index >= len(self.pages) - 1
+
+    async def _show(self, interaction: discord.Interaction, index: int) -> None:
+        self.index = max(0, min(len(self.pages) - 1, index))
+        self._sync()
+        await interaction.response.edit_message(embed=self.pages[self.index], view=self)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id == self.owner_id:
+            return True
+        await interaction.response.send_message(
+            "Only the person who ran this command can turn its pages.", ephemeral=True
+        )
+        return False
+
+    async def on_timeout(self) -> None:
+        for item in self.children:
+            item.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass  # message deleted or the followup token expired
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.index - 1)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.index + 1)
+
+async def send_pages(interaction: discord.Interaction, pages: list[discord.Embed],
+                     **kwargs) -> None:
+    """Send the first page as a followup, with page buttons when there is more than one."""
+    if len(pages) == 1:
+        await interaction.followup.send(embed=pages[0], **kwargs)
+        return
+    view = PageView(pages, interaction.user.id)
+    view.message = await interaction.followup.send(embed=pages[0], view=view, wait=True, **kwargs)
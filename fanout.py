@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+import discord
+from loguru import logger
+
+from client import TokenBucket
+
+# Discord limits: 50 requests/s per bot globally, ~5 messages per 5 s per channel
+GLOBAL_PER_SECOND = 50
+CHANNEL_PER_MINUTE = 60
+CHANNEL_BURST = 5
+MAX_IN_FLIGHT = 8
+
+
+@dataclass
+class Delivery:
+    """One destination for a broadcast; embeds are shared, content is per destination."""
+    channel: discord.abc.Messageable
+    label: str
+    content: str | None = None
+    allowed_mentions: discord.AllowedMentions = field(default_factory=discord.AllowedMentions.none)
+
+
+@dataclass
+class DeliveryResult:
+    label: str
+    ok: bool
+    jump_url: str | None = None
+    error: str | None = None
+
+
+class FanoutQueue:
+    """Concurrent sender that stays inside Discord's global and per-channel limits.
+
+    Each channel has its own token bucket (the per-route limit) and every send
+    also takes a token from the global bucket, so a broadcast to many channels
+    runs in parallel without tripping 429s.
+    """
+
+    def __init__(self, per_second: int = GLOBAL_PER_SECOND, max_in_flight: int = MAX_IN_FLIGHT):
+        self._global = TokenBucket(per_second * 60, per_second, name="Discord")
+        self._routes: dict[int, TokenBucket] = {}
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    def _route(self, channel_id: int) -> TokenBucket:
+        bucket = self._routes.get(channel_id)
+        if bucket is None:
+            bucket = self._routes[channel_id] = TokenBucket(
+                CHANNEL_PER_MINUTE, CHANNEL_BURST, name=f"Channel {channel_id}"
+            )
+        return bucket
+
+    async def _send(self, d: Delivery, embeds: list[discord.Embed]) -> DeliveryResult:
+        await self._route(getattr(d.channel, "id", 0)).acquire()
+        async with self._slots:
+            await self._global.acquire()
+            try:
+                msg = await d.channel.send(
+                    content=d.content, embeds=embeds, allowed_mentions=d.allowed_mentions
+                )
+                return DeliveryResult(d.label, True, jump_url=msg.jump_url)
+            except discord.Forbidden:
+                return DeliveryResult(d.label, False, error="missing permission")
+            except discord.HTTPException as ex:
+                return DeliveryResult(d.label, False, error=f"HTTP {ex.status}: {ex.text or ex}")
+            except Exception as ex:
+                logger.exception(f"Fan-out send to {d.label} failed.")
+                return DeliveryResult(d.label, False, error=str(ex) or type(ex).__name__)
+
+    async def broadcast(
+        self, embeds: list[discord.Embed], deliveries: list[Delivery]
+    ) -> list[DeliveryResult]:
+        """Send the same pre-rendered embeds to every destination; one result per destination."""
+        results = await asyncio.gather(*(self._send(d, embeds) for d in deliveries))
+        failed = sum(not r.ok for r in results)
+        logger.info(f"Fan-out: {len(results) - failed}/{len(results)} destination(s) delivered.")
+        return list(results)
+
+
+_queue: FanoutQueue | None = None
+
+
+def get_queue() -> FanoutQueue:
+    global _queue
+    if _queue is None:
+        _queue = FanoutQueue()
+    return _queue
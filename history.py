@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import time
+
+from loguru import logger
+
+from models import Matchup, Roster, Transaction, to_row
+from sleeper import get_league, get_matchups, get_nfl_state, get_standings, get_transactions
+
+_HISTORY_DB_PATH = "history.db"
+
+# Kinds of per-week payloads kept in the store
+MATCHUPS = "matchups"
+ROSTERS = "rosters"
+TRANSACTIONS = "transactions"
+_MODELS = {MATCHUPS: Matchup, ROSTERS: Roster, TRANSACTIONS: Transaction}
+
+# Bumped when the stored payload shape changes; older rows are dropped and refetched
+_SCHEMA_VERSION = 1
+
+
+class HistoryStore:
+    """SQLite-backed per-week model lists keyed by (kind, league, season, week).
+
+    Immutable rows (closed weeks) are also memoised decoded, so repeat reads
+    never touch the network or re-parse JSON.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS weeks ("
+            " kind TEXT, league_id TEXT, season TEXT, week INTEGER,"
+            " payload TEXT, immutable INTEGER, updated_at REAL,"
+            " PRIMARY KEY (kind, league_id, season, week)) WITHOUT ROWID"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " scope TEXT, item_id TEXT, seen_at REAL,"
+            " PRIMARY KEY (scope, item_id)) WITHOUT ROWID"
+        )
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            self._conn.execute("DELETE FROM weeks")  # raw Sleeper JSON from before the typed models
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.commit()
+        self._memo: dict[tuple, object] = {}
+        self._open: dict[tuple, object] = {}  # last payload written for each mutable row
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, kind: str, league_id: str, season: str, week: int) -> tuple[list, bool] | None:
+        """Return (payload, immutable) or None when the week isn't stored."""
+        key = (kind, league_id, season, int(week))
+        if key in self._memo:
+            return self._memo[key], True
+        row = self._conn.execute(
+            "SELECT payload, immutable FROM weeks"
+            " WHERE kind = ? AND league_id = ? AND season = ? AND week = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            return None
+        model = _MODELS[kind]
+        payload, immutable = [model(**d) for d in json.loads(row[0])], bool(row[1])
+        if immutable:
+            self._memo[key] = payload
+        return payload, immutable
+
+    def put(
+        self, kind: str, league_id: str, season: str, week: int, payload: list, immutable: bool
+    ) -> None:
+        """Store a week. Re-putting the very payload object last stored for a mutable row
+        (the Sleeper cache hands out the same list until it refetches) is a no-op."""
+        key = (kind, league_id, season, int(week))
+        if not immutable and self._open.get(key) is payload:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO weeks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps([to_row(x) for x in payload]), int(immutable), time.time()),
+            )
+        if immutable:
+            self._memo[key] = payload
+            self._open.pop(key, None)
+        else:
+            self._memo.pop(key, None)
+            self._open[key] = payload
+
+    def get_sealed(self, kind: str, league_id: str, week: int) -> list | None:
+        """Payload of a closed week under whichever season it was stored, or None.
+
+        Sleeper issues a new league_id every season, so the season isn't needed
+        to find it; callers can check here before resolving the season upstream.
+        """
+        row = self._conn.execute(
+            "SELECT season FROM weeks"
+            " WHERE kind = ? AND league_id = ? AND week = ? AND immutable = 1",
+            (kind, league_id, int(week)),
+        ).fetchone()
+        if row is None:
+            return None
+        hit = self.get(kind, league_id, row[0], week)
+        return hit[0] if hit is not None else None
+
+    def seal_before(self, kind: str, league_id: str, season: str, week: int) -> None:
+        """Mark every stored week before `week` immutable."""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE weeks SET immutable = 1"
+                " WHERE kind = ? AND league_id = ? AND season = ? AND week < ?",
+                (kind, league_id, season, int(week)),
+            )
+        for key in [k for k in self._open if k[:3] == (kind, league_id, season) and k[3] < week]:
+            del self._open[key]
+
+    def immutable_weeks(self, kind: str, league_id: str, season: str) -> set[int]:
+        rows = self._conn.execute(
+            "SELECT week FROM weeks"
+            " WHERE kind = ? AND league_id = ? AND season = ? AND immutable = 1",
+            (kind, league_id, season),
+        ).fetchall()
+        return {w for (w,) in rows}
+
+    def seen_ids(self, scope: str) -> set[str] | None:
+        """Ids recorded under `scope`, or None if the scope was never recorded."""
+        rows = self._conn.execute("SELECT item_id FROM seen WHERE scope = ?", (scope,)).fetchall()
+        if not rows:
+            return None
+        return {i for (i,) in rows if i}
+
+    def mark_seen(self, scope: str, ids, keep: int = 500) -> None:
+        """Record ids under `scope`, keeping only the newest `keep` of them.
+
+        An empty marker row is kept too, so a scope recorded with no ids still
+        reads back as an (empty) set rather than None.
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen VALUES (?, ?, ?)",
+                [(scope, "", now), *((scope, str(i), now) for i in ids)],
+            )
+            self._conn.execute(
+                "DELETE FROM seen WHERE scope = ? AND item_id != '' AND item_id NOT IN ("
+                " SELECT item_id FROM seen WHERE scope = ? AND item_id != ''"
+                " ORDER BY seen_at DESC LIMIT ?)",
+                (scope, scope, keep),
+            )
+
+
+_store: HistoryStore | None = None
+
+
+def get_store() -> HistoryStore:
+    global _store
+    if _store is None:
+        _store = HistoryStore(_HISTORY_DB_PATH)
+    return _store
+
+
+async def _season_and_week(league_id: str) -> tuple[str, int]:
+    league, state = await asyncio.gather(get_league(league_id), get_nfl_state())
+    season = (league.season if league else "") or str(state.get("season") or "")
+    return season, int(state.get("week") or 1)
+
+
+_FETCHERS = {MATCHUPS: get_matchups, TRANSACTIONS: get_transactions}
+
+
+async def get_week(kind: str, league_id: str, week: int) -> list:
+    """Per-week matchups or transactions: closed weeks are read locally, open weeks
+    are fetched (through the Sleeper cache) and stored, sealed once the week closes.
+
+    Anything not stored yet has to be fetched, so the season/week lookup runs
+    alongside the fetch rather than ahead of it: one round trip when cold.
+    """
+    store = get_store()
+    sealed = store.get_sealed(kind, league_id, week)
+    if sealed is not None:
+        return sealed
+    (season, current_week), data = await asyncio.gather(
+        _season_and_week(league_id), _FETCHERS[kind](league_id, week)
+    )
+    data = data or []
+    store.put(kind, league_id, season, week, data, immutable=week < current_week)
+    return data
+
+
+async def get_week_matchups(league_id: str, week: int) -> list:
+    return await get_week(MATCHUPS, league_id, week)
+
+
+async def get_week_transactions(league_id: str, week: int) -> list:
+    return await get_week(TRANSACTIONS, league_id, week)
+
+
+async def season_matchups(league_id: str, through_week: int | None = None) -> dict[int, list]:
+    """{week: matchups} for weeks 1..through_week (default: last closed week)."""
+    season, current_week = await _season_and_week(league_id)
+    last = through_week if through_week is not None else current_week - 1
+    weeks = list(range(1, max(0, last) + 1))
+    results = await asyncio.gather(*(get_week_matchups(league_id, w) for w in weeks))
+    return dict(zip(weeks, results, strict=True))
+
+
+async def backfill(league_id: str, kinds: tuple[str, ...] = (MATCHUPS, TRANSACTIONS)) -> int:
+    """Concurrently load every closed week not yet stored. Returns the number of weeks fetched."""
+    season, current_week = await _season_and_week(league_id)
+    store = get_store()
+    closed = set(range(1, current_week))
+    todo = [
+        (kind, w)
+        for kind in kinds
+        for w in sorted(closed - store.immutable_weeks(kind, league_id, season))
+    ]
+    if not todo:
+        return 0
+    results = await asyncio.gather(
+        *(get_week(kind, league_id, w) for kind, w in todo), return_exceptions=True
+    )
+    failed = [t for t, r in zip(todo, results, strict=True) if isinstance(r, Exception)]
+    if failed:
+        logger.warning(f"History backfill for {league_id}: {len(failed)} week(s) failed: {failed}")
+    logger.info(f"History backfill for {league_id}: loaded {len(todo) - len(failed)} week(s).")
+    return len(todo) - len(failed)
+
+
+async def snapshot_rosters(league_id: str) -> None:
+    """Record the current rosters as this week's snapshot and seal earlier weeks."""
+    (season, current_week), rosters = await asyncio.gather(
+        _season_and_week(league_id), get_standings(league_id)
+    )
+    store = get_store()
+    store.put(ROSTERS, league_id, season, current_week, rosters or [], immutable=False)
+    store.seal_before(ROSTERS, league_id, season, current_week)
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import bisect
+import os
+import re
+import time
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from aiohttp import web
+from loguru import logger
+
+# Local Prometheus-style endpoint (env-overridable; port 0 disables it)
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1") or "127.0.0.1"
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108") or 0)
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (seconds)."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate by linear interpolation inside the bucket holding the q-th observation."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lo = self.buckets[i - 1] if i > 0 else 0.0
+                hi = self.buckets[i] if i < len(self.buckets) else lo
+                return lo + (hi - lo) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+_histograms: dict[tuple[str, Labels], Histogram] = {}
+_counters: dict[tuple[str, Labels], float] = {}
+_collectors: list[Callable[[], Iterable[tuple[str, dict, float]]]] = []
+
+
+def _key(name: str, labels: dict) -> tuple[str, Labels]:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    key = _key(name, labels)
+    h = _histograms.get(key)
+    if h is None:
+        h = _histograms[key] = Histogram()
+    h.observe(seconds)
+
+
+def inc(name: str, amount: float = 1, **labels) -> None:
+    key = _key(name, labels)
+    _counters[key] = _counters.get(key, 0) + amount
+
+
+def register_collector(fn: Callable[[], Iterable[tuple[str, dict, float]]]) -> None:
+    """Add a callback yielding (name, labels, value) gauges, read at scrape time."""
+    _collectors.append(fn)
+
+
+def histograms(name: str) -> dict[Labels, Histogram]:
+    return {labels: h for (n, labels), h in _histograms.items() if n == name}
+
+
+def counters(name: str) -> dict[Labels, float]:
+    return {labels: v for (n, labels), v in _counters.items() if n == name}
+
+
+def summarize(name: str, by: str) -> list[tuple[str, int, float, float]]:
+    """(label value, count, p50, p95) per value of label `by`, merging other labels.
+
+    Busiest first.
+    """
+    merged: dict[str, Histogram] = {}
+    for labels, h in histograms(name).items():
+        value = dict(labels).get(by, "")
+        m = merged.setdefault(value, Histogram(h.buckets))
+        m.counts = [a + b for a, b in zip(m.counts, h.counts, strict=True)]
+        m.count += h.count
+        m.sum += h.sum
+    rows = [(v, h.count, h.quantile(0.5), h.quantile(0.95)) for v, h in merged.items()]
+    return sorted(rows, key=lambda r: -r[1])
+
+
+def reset() -> None:
+    _histograms.clear()
+    _counters.clear()
+
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_of(url: str) -> str:
+    """Collapse ids in a Sleeper URL so timings group per endpoint (/league/{id}/matchups/{id})."""
+    path = url.split("://", 1)[-1].split("?", 1)[0]
+    path = path[path.find("/"):] if "/" in path else "/"
+    return _ID_SEGMENT.sub("/{id}", path.removeprefix("/v1"))
+
+
+# ----- Slash-command phases -----
+
+@dataclass
+class CommandTrace:
+    command: str
+    started: float = field(default_factory=time.perf_counter)
+    last: float = 0.0
+    laps: int = 0
+
+    def __post_init__(self):
+        self.last = self.started
+
+
+_trace: ContextVar[CommandTrace | None] = ContextVar("command_trace", default=None)
+
+
+def start_command(command: str) -> None:
+    """Begin timing a slash command in the current task (see lap/finish_command)."""
+    _trace.set(CommandTrace(command))
+
+
+def lap(phase: str) -> None:
+    """Record the time since the previous lap as `phase` (defer, fetch, render, …)."""
+    t = _trace.get()
+    if t is None:
+        return
+    now = time.perf_counter()
+    observe("command_phase_seconds", now - t.last, command=t.command, phase=phase)
+    t.last = now
+    t.laps += 1
+
+
+def finish_command(status: str = "ok") -> None:
+    """Close the trace: what's left after the last lap counts as the send phase."""
+    t = _trace.get()
+    if t is None:
+        return
+    if t.laps:
+        lap("send")
+    observe("command_seconds", time.perf_counter() - t.started, command=t.command, status=status)
+    _trace.set(None)
+
+
+# ----- Exposition -----
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _fmt_labels(labels: Iterable[tuple[str, str]]) -> str:
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+    return "{" + inner + "}" if inner else ""
+
+
+def render_prometheus() -> str:
+    """Text exposition format (version 0.0.4)."""
+    out: list[str] = []
+    typed: set[str] = set()
+    for (name, labels), h in sorted(_histograms.items()):
+        if name not in typed:
+            out.append(f"# TYPE {name} histogram")
+            typed.add(name)
+        cumulative = 0
+        for bound, n in zip((*h.buckets, float("inf")), h.counts, strict=True):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else f"{bound:g}"
+            out.append(f"{name}_bucket{_fmt_labels((*labels, ('le', le)))} {cumulative}")
+        out.append(f"{name}_sum{_fmt_labels(labels)} {h.sum:.6f}")
+        out.append(f"{name}_count{_fmt_labels(labels)} {h.count}")
+    for (name, labels), v in sorted(_counters.items()):
+        if name not in typed:
+            out.append(f"# TYPE {name} counter")
+            typed.add(name)
+        out.append(f"{name}{_fmt_labels(labels)} {v:g}")
+    for fn in _collectors:
+        try:
+            for name, labels, v in fn():
+                if name not in typed:
+                    out.append(f"# TYPE {name} gauge")
+                    typed.add(name)
+                pairs = sorted((k, str(x)) for k, x in labels.items())
+                out.append(f"{name}{_fmt_labels(pairs)} {v:g}")
+        except Exception:
+            logger.exception("Metrics collector failed.")
+    return "\n".join(out) + "\n"
+
+
+_runner = None
+
+
+async def start_server(host: str = METRICS_HOST, port: int = METRICS_PORT) -> None:
+    """Serve /metrics on a local port (no-op when port is 0)."""
+    global _runner
+    if not port or _runner is not None:
+        return
+
+    async def handle(_request):
+        return web.Response(text=render_prometheus(), content_type="text/plain", charset="utf-8")
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError as ex:
+        await runner.cleanup()
+        logger.warning(f"Metrics endpoint not started on {host}:{port}: {ex}")
+        return
+    _runner = runner
+    logger.info(f"Metrics endpoint listening on http://{host}:{port}/metrics")
+
+
+async def stop_server() -> None:
+    global _runner
+    if _runner is not None:
+        await _runner.cleanup()
+        _runner = None
@@ -0,0 +1,182 @@
+"""Typed, slotted views of the Sleeper payloads every command shares.
+
+Responses are decoded once, straight from the body bytes, into these models
+and cached as such; commands read attributes instead of re-walking raw dicts.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass, field, fields
+
+try:  # optional: msgspec's decoder is several times faster than the stdlib's
+    from msgspec.json import decode as loads
+except ImportError:
+    from json import loads
+
+
+def settings_points(settings: dict, key: str) -> float:
+    """Sleeper splits season points into an integer and a hundredths field."""
+    return float(settings.get(key) or 0) + float(settings.get(f"{key}_decimal") or 0) / 100
+
+
+@dataclass(slots=True)
+class League:
+    league_id: str
+    name: str = "Unknown League"
+    season: str = ""
+    status: str = ""
+    total_rosters: int = 0
+    roster_positions: list[str] = field(default_factory=list)
+    playoff_week_start: int = 0
+    playoff_teams: int = 6
+
+    @classmethod
+    def from_json(cls, d: dict) -> League:
+        s = d.get("settings") or {}
+        return cls(
+            league_id=str(d.get("league_id") or ""),
+            name=d.get("name") or "Unknown League",
+            season=str(d.get("season") or ""),
+            status=d.get("status") or "",
+            total_rosters=int(d.get("total_rosters") or 0),
+            roster_positions=d.get("roster_positions") or [],
+            playoff_week_start=int(s.get("playoff_week_start") or 0),
+            playoff_teams=int(s.get("playoff_teams") or 6),
+        )
+
+
+@dataclass(slots=True)
+class User:
+    user_id: str
+    display_name: str = ""
+    team_name: str = ""
+    avatar: str | None = None
+
+    @classmethod
+    def from_json(cls, d: dict) -> User:
+        return cls(
+            user_id=str(d.get("user_id") or ""),
+            display_name=d.get("display_name") or d.get("username") or "Unknown",
+            team_name=(d.get("metadata") or {}).get("team_name") or "",
+            avatar=d.get("avatar"),
+        )
+
+
+@dataclass(slots=True)
+class Roster:
+    roster_id: int
+    owner_id: str | None = None
+    players: list[str] = field(default_factory=list)
+    starters: list[str] = field(default_factory=list)
+    reserve: list[str] = field(default_factory=list)
+    taxi: list[str] = field(default_factory=list)
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    fpts: float = 0.0          # fpts + fpts_decimal / 100
+    fpts_against: float = 0.0  # fpts_against + fpts_against_decimal / 100
+
+    @classmethod
+    def from_json(cls, d: dict) -> Roster:
+        s = d.get("settings") or {}
+        return cls(
+            roster_id=int(d.get("roster_id") or 0),
+            owner_id=d.get("owner_id"),
+            players=d.get("players") or [],
+            starters=d.get("starters") or [],
+            reserve=d.get("reserve") or [],
+            taxi=d.get("taxi") or [],
+            wins=int(s.get("wins") or 0),
+            losses=int(s.get("losses") or 0),
+            ties=int(s.get("ties") or 0),
+            fpts=settings_points(s, "fpts"),
+            fpts_against=settings_points(s, "fpts_against"),
+        )
+
+    @property
+    def record(self) -> str:
+        return f"{self.wins}-{self.losses}" + (f"-{self.ties}" if self.ties else "")
+
+
+@dataclass(slots=True)
+class Matchup:
+    roster_id: int
+    matchup_id: int | None = None  # None for a bye
+    points: float = 0.0
+    starters: list[str] = field(default_factory=list)
+    players: list[str] = field(default_factory=list)
+    starters_points: list[float] = field(default_factory=list)
+    players_points: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, d: dict) -> Matchup:
+        mid = d.get("matchup_id")
+        return cls(
+            roster_id=int(d.get("roster_id") or 0),
+            matchup_id=int(mid) if mid is not None else None,
+            points=float(d.get("points") or 0),
+            starters=d.get("starters") or [],
+            players=d.get("players") or [],
+            starters_points=d.get("starters_points") or [],
+            players_points=d.get("players_points") or {},
+        )
+
+
+@dataclass(slots=True)
+class Transaction:
+    transaction_id: str
+    type: str = ""
+    status: str = ""
+    when: int = 0  # status_updated, else created (epoch ms)
+    leg: int = 0
+    roster_ids: list[int] = field(default_factory=list)
+    adds: dict[str, int] = field(default_factory=dict)
+    drops: dict[str, int] = field(default_factory=dict)
+    draft_picks: list[dict] = field(default_factory=list)
+    waiver_budget: list[dict] = field(default_factory=list)
+    waiver_bid: int | None = None
+
+    @classmethod
+    def from_json(cls, d: dict) -> Transaction:
+        return cls(
+            transaction_id=str(d.get("transaction_id") or ""),
+            type=d.get("type") or "",
+            status=d.get("status") or "",
+            when=int(d.get("status_updated") or d.get("created") or 0),
+            leg=int(d.get("leg") or 0),
+            roster_ids=d.get("roster_ids") or [],
+            adds=d.get("adds") or {},
+            drops=d.get("drops") or {},
+            draft_picks=d.get("draft_picks") or [],
+            waiver_budget=d.get("waiver_budget") or [],
+            waiver_bid=(d.get("settings") or {}).get("waiver_bid"),
+        )
+
+
+def to_row(model) -> dict:
+    """Shallow field dict for storage; much cheaper than dataclasses.asdict's deep copy."""
+    return {f.name: getattr(model, f.name) for f in fields(model)}
+
+
+def _one(model) -> Callable[[bytes], object]:
+    def decode(body: bytes):
+        raw = loads(body)
+        return model.from_json(raw) if raw else None
+    return decode
+
+
+def _many(model) -> Callable[[bytes], list]:
+    def decode(body: bytes) -> list:
+        return [model.from_json(d) for d in loads(body) or []]
+    return decode
+
+
+# Response body -> model(s), per sleeper.TTLS kind; NFL state stays a plain dict
+DECODERS: dict[str, Callable[[bytes], object]] = {
+    "league": _one(League),
+    "users": _many(User),
+    "rosters": _many(Roster),
+    "matchups": _many(Matchup),
+    "transactions": _many(Transaction),
+    "state": lambda body: loads(body) or {},
+}
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import re
+from collections import defaultdict
+
+from loguru import logger
+
+from players_store import PlayersStore
+from sleeper import player_label
+
+MAX_PREFIX = 12          # longest token prefix indexed
+_UNRANKED = 10**9        # Sleeper search_rank for players with no rank
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower().replace("'", "").replace(".", ""))
+
+
+def _trigrams(text: str) -> set[str]:
+    """Trigrams of each word, padded so every name part (not just the first) has
+    word-boundary grams."""
+    grams: set[str] = set()
+    for tok in _tokens(text):
+        s = f"  {tok} "
+        grams.update(s[i : i + 3] for i in range(len(s) - 2))
+    return grams
+
+
+class PlayerIndex:
+    """Prefix + trigram index over player names, team and position.
+
+    Prefix posting lists are pre-sorted by Sleeper's search_rank, so a one-word
+    query is a dict lookup plus a slice; multi-word queries intersect the
+    lists. Trigrams catch typos and mid-word matches when no prefix matches.
+    """
+
+    def __init__(self, players):
+        self.ids: list[str] = []
+        self.labels: list[str] = []
+        self.rank: list[int] = []
+        prefix: dict[str, list[int]] = defaultdict(list)
+        trigrams: dict[str, list[int]] = defaultdict(list)
+        for pid, p in players:
+            if not p.get("position"):
+                continue
+            doc = len(self.ids)
+            self.ids.append(pid)
+            self.labels.append(player_label(p))
+            self.rank.append(int(p.get("search_rank") or _UNRANKED))
+            name = p.get("full_name") or " ".join(
+                filter(None, [p.get("first_name"), p.get("last_name")])
+            )
+            words = set(_tokens(name))
+            words |= set(_tokens(p.get("team") or "")) | set(_tokens(p.get("position") or ""))
+            keys = {w[:n] for w in words for n in range(1, min(len(w), MAX_PREFIX) + 1)}
+            for k in keys:
+                prefix[k].append(doc)
+            for g in _trigrams(name):
+                trigrams[g].append(doc)
+        by_rank = self.rank.__getitem__
+        self.prefix = {k: sorted(docs, key=by_rank) for k, docs in prefix.items()}
+        self.trigrams = dict(trigrams)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, query: str, k: int = 25) -> list[tuple[str, str]]:
+        """Top-k (player_id, label) matches, best Sleeper search rank first."""
+        words = [w[:MAX_PREFIX] for w in _tokens(query)]
+        if not words:
+            return []
+        lists = [self.prefix.get(w) for w in words]
+        if all(lists):
+            lists.sort(key=len)
+            if len(lists) == 1:
+                docs = lists[0][:k]
+            else:
+                common = set(lists[0]).intersection(*lists[1:])
+                docs = heapq.nsmallest(k, common, key=self.rank.__getitem__)
+            if docs:
+                return [(self.ids[d], self.labels[d]) for d in docs]
+        return self._fuzzy(query, k)
+
+    def _fuzzy(self, query: str, k: int) -> list[tuple[str, str]]:
+        grams = _trigrams(query)
+        scores: dict[int, int] = defaultdict(int)
+        for g in grams:
+            for d in self.trigrams.get(g, ()):
+                scores[d] += 1
+        need = max(1, len(grams) // 2)
+        hits = [d for d, n in scores.items() if n >= need]
+        best = heapq.nsmallest(k, hits, key=lambda d: (-scores[d], self.rank[d]))
+        return [(self.ids[d], self.labels[d]) for d in best]
+
+
+_index: PlayerIndex | None = None
+_building: asyncio.Task | None = None
+
+
+def _build_from_db(path: str) -> PlayerIndex:
+    store = PlayersStore(path)  # own connection: built in a worker thread
+    try:
+        return PlayerIndex(store.iter_all())
+    finally:
+        store.close()
+
+
+async def rebuild_index(store: PlayersStore) -> None:
+    """Rebuild the index off the event loop and swap it in."""
+    global _index
+    index = await asyncio.to_thread(_build_from_db, store.path)
+    _index = index
+    logger.info(f"Player search index rebuilt ({len(index)} players).")
+
+
+def get_index(store: PlayersStore | None = None) -> PlayerIndex | None:
+    """Current index; when missing and a store is given, start building it in the background."""
+    global _building
+    idle = _building is None or _building.done()
+    if _index is None and store is not None and store.loaded and idle:
+        _building = asyncio.create_task(rebuild_index(store))
+    return _index
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterable
+
+# Only the fields player_label(), /player and search ranking read are kept
+FIELD_TYPES = {
+    "full_name": "TEXT",
+    "first_name": "TEXT",
+    "last_name": "TEXT",
+    "position": "TEXT",
+    "team": "TEXT",
+    "status": "TEXT",
+    "injury_status": "TEXT",
+    "age": "INTEGER",
+    "years_exp": "INTEGER",
+    "search_rank": "INTEGER",
+}
+FIELDS = tuple(FIELD_TYPES)
+_SCHEMA_VERSION = "2"
+_BATCH = 500  # stay under SQLite's bound-parameter limit
+
+
+def build_players_db(path: str, players: dict, meta: dict | None = None) -> int:
+    """Write a compact players table to path (via a temp file + os.replace). Returns row count."""
+    tmp = path + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    conn = sqlite3.connect(tmp)
+    try:
+        cols = ", ".join(f"{f} {t}" for f, t in FIELD_TYPES.items())
+        conn.execute(f"CREATE TABLE players (player_id TEXT PRIMARY KEY, {cols}) WITHOUT ROWID")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        rows = (
+            (str(pid), *(p.get(f) if p.get(f) not in ("", None) else None for f in FIELDS))
+            for pid, p in players.items()
+            if isinstance(p, dict)
+        )
+        marks = ", ".join("?" for _ in range(len(FIELDS) + 1))
+        conn.executemany(f"INSERT INTO players VALUES ({marks})", rows)
+        info = {"schema": _SCHEMA_VERSION, "fetched_at": str(time.time()), **(meta or {})}
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [(k, str(v)) for k, v in info.items()])
+        conn.commit()
+        count = conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    return count
+
+
+def build_players_db_from_file(json_path: str, path: str, meta: dict | None = None) -> int:
+    """Parse a downloaded /players/nfl dump and build the table (run in a worker process)."""
+    with open(json_path, "rb") as f:
+        players = json.load(f)
+    return build_players_db(path, players, meta)
+
+
+def touch_players_db(path: str, meta: dict | None = None) -> None:
+    """Mark an existing table as freshly revalidated (e.g. after a 304).
+
+    Only `checked_at` moves; `fetched_at` keeps identifying the data itself.
+    """
+    info = {"checked_at": str(time.time()), **(meta or {})}
+    conn = sqlite3.connect(path)
+    try:
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)", [(k, str(v)) for k, v in info.items()]
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class PlayersStore:
+    """Read-only, indexed view over the on-disk players table.
+
+    Supports the small Mapping surface the bot uses (get, [], in, len) plus
+    get_many() for resolving many ids in one query.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._len: int | None = None
+        self.reopen()
+
+    def reopen(self) -> None:
+        """(Re)open the database file, e.g. after it was replaced on disk."""
+        old = self._conn
+        self._conn = None
+        self._len = None
+        if os.path.exists(self.path):
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            try:
+                conn.execute("PRAGMA cache_size = -512")  # ~512 KiB page cache
+                if self._meta(conn).get("schema") == _SCHEMA_VERSION:
+                    self._conn = conn
+                else:
+                    conn.close()
+            except sqlite3.DatabaseError:
+                conn.close()
+        if old is not None:
+            old.close()
+
+    def replace_with(self, new_path: str) -> None:
+        """Move a freshly built database over this one and reopen it.
+
+        The read handle is closed first: Windows can't replace a file that is open.
+        """
+        self.close()
+        try:
+            os.replace(new_path, self.path)
+        finally:
+            self.reopen()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection) -> dict[str, str]:
+        return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+    @property
+    def loaded(self) -> bool:
+        return self._conn is not None
+
+    def meta(self) -> dict[str, str]:
+        return self._meta(self._conn) if self._conn is not None else {}
+
+    def age_seconds(self) -> float | None:
+        """Seconds since the data was last fetched or revalidated."""
+        meta = self.meta()
+        try:
+            return time.time() - float(meta.get("checked_at") or meta["fetched_at"])
+        except (KeyError, ValueError):
+            return None
+
+    def get(self, player_id: str, default: dict | None = None) -> dict | None:
+        if self._conn is None or player_id is None:
+            return default
+        row = self._conn.execute(
+            f"SELECT {', '.join(FIELDS)} FROM players WHERE player_id = ?", (str(player_id),)
+        ).fetchone()
+        return dict(zip(FIELDS, row, strict=True)) if row else default
+
+    def get_many(self, player_ids: Iterable[str]) -> dict[str, dict]:
+        """Resolve many ids at once; unknown ids are omitted from the result."""
+        ids = list(dict.fromkeys(str(pid) for pid in player_ids if pid is not None))
+        out: dict[str, dict] = {}
+        if self._conn is None:
+            return out
+        for i in range(0, len(ids), _BATCH):
+            chunk = ids[i : i + _BATCH]
+            marks = ", ".join("?" for _ in chunk)
+            for pid, *vals in self._conn.execute(
+                f"SELECT player_id, {', '.join(FIELDS)} FROM players WHERE player_id IN ({marks})",
+                chunk,
+            ):
+                out[pid] = dict(zip(FIELDS, vals, strict=True))
+        return out
+
+    def iter_all(self):
+        """Yield (player_id, player_dict) for every stored player."""
+        if self._conn is None:
+            return
+        for pid, *vals in self._conn.execute(f"SELECT player_id, {', '.join(FIELDS)} FROM players"):
+            yield pid, dict(zip(FIELDS, vals, strict=True))
+
+    def __getitem__(self, player_id: str) -> dict:
+        p = self.get(player_id)
+        if p is None:
+            raise KeyError(player_id)
+        return p
+
+    def __contains__(self, player_id: object) -> bool:
+        return isinstance(player_id, str) and self.get(player_id) is not None
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        if self._len is None:
+            self._len = self._conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+        return self._len
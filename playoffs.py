@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from models import Matchup
+
+_BATCH = 5000           # iterations simulated per vectorized batch (bounds memory)
+_MIN_SIGMA = 10.0       # floor on a team's weekly scoring spread
+_DEFAULT_MU = 100.0     # used before any week has been played
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=1)
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def simulate_odds(
+    history: list[list[float]],
+    wins: list[float],
+    points: list[float],
+    schedule: list[list[int]],
+    playoff_teams: int,
+    iterations: int,
+    seed: int | None,
+) -> dict[str, list[float]]:
+    """Monte Carlo the rest of the regular season (runs in a worker process).
+
+    history: per-team past weekly scores; wins/points: current totals;
+    schedule: per remaining week, each team's opponent index (-1 for a bye).
+    Returns per-team playoff %, top-seed %, and mean projected wins.
+    """
+    n = len(wins)
+    rng = np.random.default_rng(seed)
+    played = [np.asarray(h, dtype=float) for h in history]
+    all_scores = np.concatenate(played) if any(len(h) for h in played) else np.array([_DEFAULT_MU])
+    mu = np.array([h.mean() if len(h) else all_scores.mean() for h in played])
+    sigma = np.array([h.std(ddof=1) if len(h) > 1 else all_scores.std() for h in played])
+    sigma = np.maximum(np.nan_to_num(sigma), _MIN_SIGMA)
+
+    opp = np.asarray(schedule, dtype=np.int64).reshape(len(schedule), n)  # (R, T)
+    has_opp = opp >= 0
+    safe_opp = np.maximum(opp, 0)
+    base_wins = np.asarray(wins, dtype=float)
+    base_pts = np.asarray(points, dtype=float)
+    spots = max(0, min(playoff_teams, n))
+
+    made = np.zeros(n)
+    top = np.zeros(n)
+    proj = np.zeros(n)
+    done = 0
+    while done < iterations:
+        b = min(_BATCH, iterations - done)
+        scores = rng.normal(mu, sigma, size=(b, len(schedule), n))         # (B, R, T)
+        opp_scores = np.take_along_axis(scores, np.broadcast_to(safe_opp, scores.shape), axis=2)
+        result = np.where(scores > opp_scores, 1.0, np.where(scores == opp_scores, 0.5, 0.0))
+        w = base_wins + (result * has_opp).sum(axis=1)                      # (B, T)
+        p = base_pts + scores.sum(axis=1)
+        # Seed by wins, then points for (points never reach 1e6 so the key stays ordered)
+        rank = np.argsort(np.argsort(-(w * 1e6 + p), axis=1), axis=1)
+        made += (rank < spots).sum(axis=0)
+        top += (rank == 0).sum(axis=0)
+        proj += w.sum(axis=0)
+        done += b
+
+    total = max(1, iterations)
+    return {
+        "playoffs": (made / total).tolist(),
+        "top_seed": (top / total).tolist(),
+        "projected_wins": (proj / total).tolist(),
+    }
+
+
+@dataclass
+class TeamOdds:
+    roster_id: int
+    name: str
+    playoffs: float
+    top_seed: float
+    projected_wins: float
+
+
+_odds_cache: dict[str, tuple[str, dict]] = {}  # league_id -> (inputs digest, simulation result)
+
+
+async def playoff_odds(
+    league_id: str,
+    roster_ids: list[int],
+    names: dict,
+    season: dict[int, list[Matchup]],
+    remaining: dict[int, list[Matchup]],
+    wins: dict[int, float],
+    points: dict[int, float],
+    playoff_teams: int,
+    iterations: int,
+    seed: int | None,
+) -> list[TeamOdds]:
+    """Simulate in the process pool; cached until scores, schedule or settings change.
+
+    Only the simulation is cached: team names are applied on every call, so a rename
+    shows up without rerunning it.
+    """
+    def rows(weeks: dict[int, list[Matchup]]) -> list:
+        return [
+            [w, [(m.roster_id, m.matchup_id, m.points) for m in weeks[w]]] for w in sorted(weeks)
+        ]
+
+    digest = hashlib.sha1(
+        json.dumps(
+            [roster_ids, rows(season), rows(remaining), playoff_teams, iterations, seed]
+        ).encode()
+    ).hexdigest()
+    hit = _odds_cache.get(league_id)
+    res = hit[1] if hit is not None and hit[0] == digest else None
+    if res is None:
+        res = await _simulate(
+            roster_ids, season, remaining, wins, points, playoff_teams, iterations, seed
+        )
+        _odds_cache[league_id] = (digest, res)
+
+    odds = [
+        TeamOdds(
+            rid, names.get(rid, f"Roster {rid}"),
+            res["playoffs"][i], res["top_seed"][i], res["projected_wins"][i],
+        )
+        for i, rid in enumerate(roster_ids)
+    ]
+    odds.sort(key=lambda o: (-o.playoffs, -o.projected_wins))
+    return odds
+
+
+async def _simulate(
+    roster_ids: list[int],
+    season: dict[int, list[Matchup]],
+    remaining: dict[int, list[Matchup]],
+    wins: dict[int, float],
+    points: dict[int, float],
+    playoff_teams: int,
+    iterations: int,
+    seed: int | None,
+) -> dict:
+    index = {rid: i for i, rid in enumerate(roster_ids)}
+    history: list[list[float]] = [[] for _ in roster_ids]
+    for week in sorted(season):
+        for m in season[week]:
+            i = index.get(m.roster_id)
+            if i is not None:
+                history[i].append(m.points)
+
+    schedule = []
+    for week in sorted(remaining):
+        by_mid: dict[int, list[int]] = {}
+        for m in remaining[week]:
+            i = index.get(m.roster_id)
+            if i is not None and m.matchup_id is not None:
+                by_mid.setdefault(m.matchup_id, []).append(i)
+        row = [-1] * len(roster_ids)
+        for pair in by_mid.values():
+            if len(pair) == 2:
+                row[pair[0]], row[pair[1]] = pair[1], pair[0]
+        schedule.append(row)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_pool(),
+        simulate_odds,
+        history,
+        [wins.get(rid, 0.0) for rid in roster_ids],
+        [points.get(rid, 0.0) for rid in roster_ids],
+        schedule,
+        playoff_teams,
+        iterations,
+        seed,
+    )
+
+
+def odds_lines(odds: list[TeamOdds]) -> list[str]:
+    return [
+        f"**{o.name}** — {o.playoffs:.1%} playoffs · {o.top_seed:.1%} #1 seed"
+        f" · proj {o.projected_wins:.1f} W"
+        for o in odds
+    ]
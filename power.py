@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from models import Matchup, Roster
+
+
+@dataclass
+class PowerRow:
+    roster_id: int
+    name: str
+    allplay_wins: float
+    allplay_losses: float
+    expected_wins: float
+    actual_wins: float
+    luck: float
+    sos: float
+    pf: float
+
+    @property
+    def allplay_pct(self) -> float:
+        games = self.allplay_wins + self.allplay_losses
+        return self.allplay_wins / games if games else 0.0
+
+
+class PowerTable:
+    """Per-league (teams x weeks) score matrix with all-play results per column.
+
+    Columns are appended as weeks close, so a new week only computes its own
+    column; season aggregates are cheap reductions over the matrices.
+    """
+
+    def __init__(self, roster_ids: list[int]):
+        self.roster_ids = list(roster_ids)
+        self.index = {rid: i for i, rid in enumerate(self.roster_ids)}
+        n = len(self.roster_ids)
+        self.weeks: list[int] = []
+        self.scores = np.zeros((n, 0))
+        self.allplay = np.zeros((n, 0))   # all-play wins that week (ties count 0.5)
+        self.actual = np.zeros((n, 0))    # 1 / 0.5 / 0, NaN when no opponent
+        self.opponent = np.zeros((n, 0), dtype=np.int64)  # opponent row, -1 when none
+
+    def _column(
+        self, entries: list[Matchup]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        n = len(self.roster_ids)
+        s = np.zeros(n)
+        mid = np.full(n, -1, dtype=np.int64)
+        for m in entries:
+            i = self.index.get(m.roster_id)
+            if i is not None:
+                s[i] = m.points
+                if m.matchup_id is not None:
+                    mid[i] = m.matchup_id
+
+        gt = (s[:, None] > s[None, :]).sum(axis=1)
+        eq = (s[:, None] == s[None, :]).sum(axis=1) - 1
+        allplay = gt + 0.5 * eq
+
+        # Opponent = the other row sharing this row's matchup_id
+        same = (mid[:, None] == mid[None, :]) & (mid[:, None] >= 0) & ~np.eye(n, dtype=bool)
+        has_opp = same.sum(axis=1) == 1
+        opp = np.where(has_opp, same.argmax(axis=1), -1)
+        opp_score = s[np.maximum(opp, 0)]
+        actual = np.where(s > opp_score, 1.0, np.where(s == opp_score, 0.5, 0.0))
+        actual = np.where(has_opp, actual, np.nan)
+        return s, allplay, actual, opp
+
+    def update(self, season: dict[int, list[Matchup]]) -> int:
+        """Append columns for weeks not yet in the table. Returns how many were added."""
+        new = sorted(w for w in season if w not in self.weeks and season[w])
+        if not new:
+            return 0
+        cols = [self._column(season[w]) for w in new]
+        self.scores = np.column_stack([self.scores, *(c[0] for c in cols)])
+        self.allplay = np.column_stack([self.allplay, *(c[1] for c in cols)])
+        self.actual = np.column_stack([self.actual, *(c[2] for c in cols)])
+        self.opponent = np.column_stack([self.opponent, *(c[3] for c in cols)])
+        self.weeks.extend(new)
+        return len(new)
+
+    def rows(self, names: dict) -> list[PowerRow]:
+        """Season power rankings, best expected wins first."""
+        n = len(self.roster_ids)
+        if n < 2 or not self.weeks:
+            return []
+        weeks = len(self.weeks)
+        ap_wins = self.allplay.sum(axis=1)
+        ap_losses = (n - 1) * weeks - ap_wins
+        expected = (self.allplay / (n - 1)).sum(axis=1)
+        actual = np.nansum(self.actual, axis=1)
+        ap_pct = ap_wins / ((n - 1) * weeks)
+
+        # Strength of schedule: mean season all-play % of the opponents faced
+        faced = self.opponent >= 0
+        opp_pct = np.where(faced, ap_pct[np.maximum(self.opponent, 0)], 0.0)
+        played = faced.sum(axis=1)
+        sos = np.divide(opp_pct.sum(axis=1), played, out=np.zeros(n), where=played > 0)
+        pf = self.scores.sum(axis=1)
+
+        order = np.lexsort((-pf, -expected))
+        return [
+            PowerRow(
+                roster_id=self.roster_ids[i],
+                name=names.get(self.roster_ids[i], f"Roster {self.roster_ids[i]}"),
+                allplay_wins=float(ap_wins[i]),
+                allplay_losses=float(ap_losses[i]),
+                expected_wins=float(expected[i]),
+                actual_wins=float(actual[i]),
+                luck=float(actual[i] - expected[i]),
+                sos=float(sos[i]),
+                pf=float(pf[i]),
+            )
+            for i in order
+        ]
+
+
+_tables: dict[str, PowerTable] = {}
+
+
+def power_rankings(league_id: str, rosters: list[Roster], names: dict,
+                   season: dict[int, list[Matchup]]) -> list[PowerRow]:
+    """Power rankings for closed weeks, reusing the league's cached columns."""
+    roster_ids = sorted(r.roster_id for r in rosters)
+    table = _tables.get(league_id)
+    if table is None or table.roster_ids != roster_ids or any(w not in season for w in table.weeks):
+        table = _tables[league_id] = PowerTable(roster_ids)
+    table.update(season)
+    return table.rows(names)
+
+
+def power_lines(rows: list[PowerRow]) -> list[str]:
+    def fmt(x: float) -> str:
+        return f"{x:g}" if x == int(x) else f"{x:.1f}"
+
+    return [
+        f"**{i}. {r.name}** — all-play {fmt(r.allplay_wins)}-{fmt(r.allplay_losses)}"
+        f" ({r.allplay_pct:.3f})\n"
+        f"xW {r.expected_wins:.2f} · W {fmt(r.actual_wins)} · luck {r.luck:+.2f}"
+        f" · SOS {r.sos:.3f} · PF {r.pf:.2f}"
+        for i, r in enumerate(rows, start=1)
+    ]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from models import Roster
+from sleeper import player_label
+
+POSITION_ORDER = ("QB", "RB", "WR", "TE", "K", "DEF", "DL", "LB", "DB")
+_EMPTY = {"0", "", None}  # Sleeper marks an unfilled starting slot with "0"
+
+
+def roster_player_ids(roster: Roster) -> list[str]:
+    """Every id referenced by a roster (players, starters, IR, taxi), de-duplicated."""
+    ids: dict[str, None] = {}
+    for group in (roster.starters, roster.players, roster.reserve, roster.taxi):
+        for pid in group:
+            if pid not in _EMPTY:
+                ids[pid] = None
+    return list(ids)
+
+
+def roster_fingerprint(roster: Roster) -> str:
+    """Changes only when the roster's id lists change."""
+    lists = [roster.starters, sorted(roster.players), sorted(roster.reserve), sorted(roster.taxi)]
+    return hashlib.sha1(json.dumps(lists).encode()).hexdigest()
+
+
+@dataclass
+class RosterGroups:
+    starters: list[tuple[str, str]] = field(default_factory=list)  # (slot, label) in lineup order
+    bench: dict[str, list[str]] = field(default_factory=dict)       # position -> labels
+    reserve: list[str] = field(default_factory=list)
+    taxi: list[str] = field(default_factory=list)
+
+
+def _pos_key(pos: str) -> tuple[int, str]:
+    return (POSITION_ORDER.index(pos) if pos in POSITION_ORDER else len(POSITION_ORDER), pos)
+
+
+def group_roster(
+    roster: Roster, players: dict[str, dict], slots: list[str] | None = None
+) -> RosterGroups:
+    """Split a roster into starters (by lineup slot) and bench grouped by position.
+
+    `players` is a bulk lookup of the roster's ids; `slots` is the league's
+    roster_positions, whose leading entries line up with `starters`.
+    """
+    slots = [s for s in (slots or []) if s not in ("BN", "IR", "TAXI")]
+    starters = roster.starters
+    reserve = set(roster.reserve)
+    taxi = set(roster.taxi)
+
+    def label(pid: str) -> str:
+        p = players.get(pid)
+        return player_label(p) if p else f"Player {pid}"
+
+    def by_rank(pid: str) -> tuple[int, str]:
+        p = players.get(pid) or {}
+        return (int(p.get("search_rank") or 10**9), label(pid))
+
+    g = RosterGroups()
+    for i, pid in enumerate(starters):
+        slot = slots[i] if i < len(slots) else "FLEX"
+        g.starters.append((slot, "— empty —" if pid in _EMPTY else label(pid)))
+
+    bench: dict[str, list[str]] = defaultdict(list)
+    placed = set(starters) | reserve | taxi
+    benched = [pid for pid in roster.players if pid not in placed]
+    for pid in sorted(benched, key=by_rank):
+        bench[(players.get(pid) or {}).get("position") or "?"].append(label(pid))
+    g.bench = {pos: bench[pos] for pos in sorted(bench, key=_pos_key)}
+    g.reserve = [label(pid) for pid in sorted(reserve, key=by_rank)]
+    g.taxi = [label(pid) for pid in sorted(taxi, key=by_rank)]
+    return g
@@ -1,100 +1,236 @@
 from __future__ import annotations
 
-import httpx
-
-BASE = "https://api.sleeper.app/v1"
-
-
-async def get_league(league_id: str):
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await client.get(f"{BASE}/league/{league_id}")
-        r.raise_for_status()
-        return r.json()
-async def get_standings(league_id: str):
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await client.get(f"{BASE}/league/{league_id}/rosters")
-        r.raise_for_status()
-        return r.json()
-async def get_standings(league_id: str):
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await client.get(f"{BASE}/league/{league_id}/rosters")
-        r.raise_for_status()
-        return r.json()
-async def get_users(league_id: str):
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await client.get(f"{BASE}/league/{league_id}/users")
-        r.raise_for_status()
-        return r.json()
-
-async def get_matchups(league_id: str, week: int):
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await client.get(f"{BASE}/league/{league_id}/matchups/{week}")
-        r.raise_for_status()
-        return r.json()
-
-async def get_nfl_state():
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await client.get(f"{BASE}/state/nfl")
-        r.raise_for_status()
-        return r.json()
-async def get_transactions(league_id: str, week: int):
-    async with httpx.AsyncClient(timeout=10) as client:
-        r = await client.get(f"{BASE}/league/{league_id}/transactions/{week}")
-        r.raise_for_status()
-        return r.json()
-import json
+import asyncio
 import os
-from datetime import datetime, timedelta
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from loguru import logger
+
+import metrics
+from cache import TTLCache
+from client import UpstreamUnavailable, request, stream
+from models import DECODERS, League, Matchup, Roster, Transaction, User
+from players_store import PlayersStore, build_players_db_from_file, touch_players_db
+
+BASE = (os.getenv("SLEEPER_BASE_URL") or "https://api.sleeper.app/v1").rstrip("/")
+
+# Seconds each endpoint stays fresh in the shared response cache
+TTLS = {
+    "league": 60 * 60,
+    "rosters": 10 * 60,
+    "users": 6 * 60 * 60,
+    "matchups": 30,
+    "state": 10 * 60,
+    "transactions": 60,
+}
+CACHE_MAXSIZE = int(os.getenv("SLEEPER_CACHE_MAXSIZE", "512") or 512)
+_cache = TTLCache(maxsize=CACHE_MAXSIZE)
+
+
+# Bodies larger than this are decoded in a worker thread so the event loop keeps serving
+PARSE_OFFLOAD_BYTES = 256 * 1024
+
+async def _get_decoded(kind: str, path: str):
+    """GET path and decode the body bytes straight into the kind's models."""
+    r = await request("GET", f"{BASE}{path}")
+    r.raise_for_status()
+    decode = DECODERS[kind]
+    if len(r.content) > PARSE_OFFLOAD_BYTES:
+        return await asyncio.to_thread(decode, r.content)
+    return decode(r.content)
+
+async def _cached_json(kind: str, path: str, force: bool = False):
+    """Fetch path through the shared TTL cache; concurrent misses share one request.
+
+    While Sleeper is unavailable the last good (expired) value is served instead.
+    """
+    try:
+        return await _cache.get_or_fetch(
+            path, TTLS[kind], lambda: _get_decoded(kind, path), force=force
+        )
+    except UpstreamUnavailable:
+        stale = _cache.get_stale(path)
+        if stale is None:
+            raise
+        logger.warning(f"Sleeper unavailable; serving stale {path}.")
+        return stale
+
+def cache_stats() -> dict:
+    """Hit/miss counters for the Sleeper response cache."""
+    return _cache.stats()
+
+def _cache_metrics():
+    s = _cache.stats()
+    for key in ("size", "hits", "misses", "coalesced", "evictions", "hit_ratio"):
+        yield f"sleeper_cache_{key}", {}, s[key]
+
+metrics.register_collector(_cache_metrics)
+
+async def get_league(league_id: str) -> League | None:
+    return await _cached_json("league", f"/league/{league_id}")
+
+async def get_standings(league_id: str) -> list[Roster]:
+    return await _cached_json("rosters", f"/league/{league_id}/rosters")
+
+async def get_users(league_id: str) -> list[User]:
+    return await _cached_json("users", f"/league/{league_id}/users")
+
+async def get_matchups(league_id: str, week: int) -> list[Matchup]:
+    return await _cached_json("matchups", f"/league/{league_id}/matchups/{week}")
+
+async def get_nfl_state() -> dict:
+    return await _cached_json("state", "/state/nfl")
+
+async def get_transactions(league_id: str, week: int) -> list[Transaction]:
+    return await _cached_json("transactions", f"/league/{league_id}/transactions/{week}")
+
+async def warm(league_id: str, ahead: float) -> int:
+    """Refresh league, users, rosters, NFL state and current-week matchups that would
+    expire within `ahead` seconds. Returns how many entries were refreshed."""
+    state = await get_nfl_state()
+    week = int(state.get("week") or 1)
+    targets = {
+        "/state/nfl": "state",
+        f"/league/{league_id}": "league",
+        f"/league/{league_id}/users": "users",
+        f"/league/{league_id}/rosters": "rosters",
+        f"/league/{league_id}/matchups/{week}": "matchups",
+    }
+    due = [(kind, path) for path, kind in targets.items() if _cache.expires_in(path) < ahead]
+    results = await asyncio.gather(
+        *(_cached_json(kind, path, force=True) for kind, path in due), return_exceptions=True
+    )
+    for (_, path), res in zip(due, results, strict=True):
+        if isinstance(res, Exception):
+            logger.warning(f"Cache warm failed for {path}: {res!r}")
+    return sum(1 for res in results if not isinstance(res, Exception))
 
 PLAYERS_URL = f"{BASE}/players/nfl"
-_PLAYERS_CACHE_PATH = "players.cache.json"
+_PLAYERS_DB_PATH = "players.db"
 _PLAYERS_CACHE_TTL_HOURS = 24
-_players = None  # in-memory cache
+_players: PlayersStore | None = None  # open handle on the on-disk store
+_players_lock = asyncio.Lock()  # only one refresh at a time
+_players_task: asyncio.Task | None = None
+_players_listeners: list[Callable[[PlayersStore], Awaitable[None]]] = []
+_players_pool: ProcessPoolExecutor | None = None  # long-lived worker for table rebuilds
 
-def _cache_fresh(path: str, ttl_hours: int) -> bool:
-    try:
-        mtime = datetime.fromtimestamp(os.path.getmtime(path))
-        return datetime.now() - mtime < timedelta(hours=ttl_hours)
-    except Exception:
-        return False
+def _get_players_pool() -> ProcessPoolExecutor:
+    global _players_pool
+    if _players_pool is None:
+        _players_pool = ProcessPoolExecutor(max_workers=1)
+    return _players_pool
+
+def shutdown_players_pool() -> None:
+    global _players_pool
+    if _players_pool is not None:
+        _players_pool.shutdown(wait=False, cancel_futures=True)
+        _players_pool = None
+
+def on_players_refresh(callback: Callable[[PlayersStore], Awaitable[None]]) -> None:
+    """Register an async callback run after fresh players data has been swapped in."""
+    _players_listeners.append(callback)
 
-async def get_players():
-    """Return a dict of {player_id: player_dict}. Cached to disk for 24h."""
+def _players_store() -> PlayersStore:
     global _players
-    if _players is not None:
-        return _players
+    if _players is None:
+        _players = PlayersStore(_PLAYERS_DB_PATH)
+    return _players
 
-    # Try disk cache first
-    if os.path.exists(_PLAYERS_CACHE_PATH) and _cache_fresh(_PLAYERS_CACHE_PATH, _PLAYERS_CACHE_TTL_HOURS):
-        try:
-            with open(_PLAYERS_CACHE_PATH, "r", encoding="utf-8") as f:
-                _players = json.load(f)
-                return _players
-        except Exception:
-            pass
+def players_loaded() -> bool:
+    """Whether players data is on disk, i.e. get_players() won't wait for a download."""
+    return _players_store().loaded
 
-    # Fetch from Sleeper
-    async with httpx.AsyncClient(timeout=30) as client:
-        r = await client.get(PLAYERS_URL)
-        r.raise_for_status()
-        data = r.json()
+def _players_fresh(store: PlayersStore) -> bool:
+    age = store.age_seconds()
+    return store.loaded and age is not None and age < _PLAYERS_CACHE_TTL_HOURS * 3600
 
-    # Save to disk (best-effort)
-    try:
-        with open(_PLAYERS_CACHE_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f)
-    except Exception:
-        pass
+async def get_players() -> PlayersStore:
+    """Return the indexed players store ({player_id: player_dict}-like). Refreshed every 24h.
 
-    _players = data
-    return _players
+    Stale data is served immediately while a background refresh runs; only a cold
+    start (no store on disk yet) waits for the download.
+    """
+    global _players_task
+    store = _players_store()
+    if _players_fresh(store):
+        return store
+    if store.loaded:
+        if _players_task is None or _players_task.done():
+            _players_task = asyncio.create_task(refresh_players())
+        return store
+    await refresh_players()
+    return store
+
+async def refresh_players(force: bool = False) -> bool:
+    """Stream /players/nfl to disk, rebuild the table off the event loop and swap it in.
+
+    Sends If-None-Match / If-Modified-Since from the previous download. Returns True
+    when new data was swapped in, False when skipped, unchanged (304) or failed.
+    """
+    async with _players_lock:
+        store = _players_store()
+        if not force and _players_fresh(store):
+            return False  # another caller refreshed while we waited
+
+        meta = store.meta()
+        headers = {}
+        if store.loaded and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if store.loaded and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        download = _PLAYERS_DB_PATH + ".download"
+        staged = _PLAYERS_DB_PATH + ".new"  # built by the worker, swapped in from here
+        try:
+            async with stream("GET", PLAYERS_URL, headers=headers, timeout=60) as r:
+                if r.status_code == 304:
+                    await asyncio.to_thread(touch_players_db, _PLAYERS_DB_PATH)
+                    logger.info("Players data unchanged (304); revalidated.")
+                    return False
+                r.raise_for_status()
+                validators = {
+                    "etag": r.headers.get("etag") or "",
+                    "last_modified": r.headers.get("last-modified") or "",
+                }
+                with open(download, "wb") as f:
+                    async for chunk in r.aiter_bytes():
+                        await asyncio.to_thread(f.write, chunk)
+
+            loop = asyncio.get_running_loop()
+            count = await loop.run_in_executor(
+                _get_players_pool(), build_players_db_from_file, download, staged, validators
+            )
+            store.replace_with(staged)
+        except Exception:
+            if not store.loaded:
+                raise
+            logger.exception("Players refresh failed; keeping previous data.")
+            return False
+        finally:
+            for path in (download, staged):
+                if os.path.exists(path):
+                    os.remove(path)
+
+        logger.info(f"Players store refreshed ({count} players).")
+        for callback in _players_listeners:
+            try:
+                await callback(store)
+            except Exception:
+                logger.exception("Players refresh listener failed.")
+        return True
 
 def player_label(p: dict | None) -> str:
     """Return a short, human-friendly label for a player dict."""
     if not p:
         return "Unknown Player"
     # Sleeper fields commonly present: full_name, first_name, last_name, position, team
-    name = p.get("full_name") or " ".join(filter(None, [p.get("first_name"), p.get("last_name")])) or p.get("last_name") or "Unknown"
+    name = (
+        p.get("full_name")
+        or " ".join(filter(None, [p.get("first_name"), p.get("last_name")]))
+        or p.get("last_name")
+        or "Unknown"
+    )
     pos = p.get("position") or ""
     team = p.get("team") or ""
     suffix = " ".join(filter(None, [pos, team])).strip()
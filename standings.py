@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from statistics import median
+
+from models import Matchup, Roster
+
+
+@dataclass
+class TeamRecord:
+    roster_id: int
+    name: str
+    wins: int = 0
+    losses: int = 0
+    ties: int = 0
+    pf: float = 0.0
+    pa: float = 0.0
+    median_wins: int = 0
+    median_losses: int = 0
+    median_ties: int = 0
+    results: list[str] = field(default_factory=list)  # "W"/"L"/"T" in week order
+    h2h: dict[int, float] = field(default_factory=lambda: defaultdict(float))  # opp -> wins
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.losses + self.ties
+
+    @property
+    def win_pct(self) -> float:
+        return (self.wins + 0.5 * self.ties) / self.games if self.games else 0.0
+
+    @property
+    def record(self) -> str:
+        return f"{self.wins}-{self.losses}" + (f"-{self.ties}" if self.ties else "")
+
+    @property
+    def median_record(self) -> str:
+        ties = f"-{self.median_ties}" if self.median_ties else ""
+        return f"{self.median_wins}-{self.median_losses}{ties}"
+
+    @property
+    def streak(self) -> str:
+        if not self.results:
+            return "—"
+        last = self.results[-1]
+        n = 0
+        for r in reversed(self.results):
+            if r != last:
+                break
+            n += 1
+        return f"{last}{n}"
+
+
+def _from_roster_settings(rosters: list[Roster], names: dict) -> dict[int, TeamRecord]:
+    return {
+        r.roster_id: TeamRecord(
+            roster_id=r.roster_id,
+            name=names.get(r.roster_id, f"Roster {r.roster_id}"),
+            wins=r.wins,
+            losses=r.losses,
+            ties=r.ties,
+            pf=r.fpts,
+            pa=r.fpts_against,
+        )
+        for r in rosters
+    }
+
+
+def compute_standings(rosters: list[Roster], names: dict,
+                      season: dict[int, list[Matchup]]) -> list[TeamRecord]:
+    """Ranked standings from the season's closed-week matchups in a single pass.
+
+    Falls back to the roster settings totals before any week has closed.
+    Tiebreakers: win %, head-to-head wins among the teams tied on win %,
+    points for, then fewest points against.
+    """
+    if not any(season.values()):
+        teams = _from_roster_settings(rosters, names)
+    else:
+        teams = {
+            r.roster_id: TeamRecord(r.roster_id, names.get(r.roster_id, f"Roster {r.roster_id}"))
+            for r in rosters
+        }
+        for week in sorted(season):
+            entries = [m for m in season[week] if m.roster_id in teams]
+            if not entries:
+                continue
+            pts = {m.roster_id: m.points for m in entries}
+            week_median = median(pts.values())
+            groups = defaultdict(list)
+            for m in entries:
+                if m.matchup_id is not None:
+                    groups[m.matchup_id].append(m.roster_id)
+            for rid, p in pts.items():
+                t = teams[rid]
+                t.pf += p
+                if p > week_median:
+                    t.median_wins += 1
+                elif p < week_median:
+                    t.median_losses += 1
+                else:
+                    t.median_ties += 1
+            for pair in groups.values():
+                if len(pair) != 2:
+                    continue
+                a, b = pair
+                for me, opp in ((a, b), (b, a)):
+                    t = teams[me]
+                    t.pa += pts[opp]
+                    if pts[me] > pts[opp]:
+                        t.wins += 1
+                        t.results.append("W")
+                        t.h2h[opp] += 1
+                    elif pts[me] < pts[opp]:
+                        t.losses += 1
+                        t.results.append("L")
+                    else:
+                        t.ties += 1
+                        t.results.append("T")
+                        t.h2h[opp] += 0.5
+
+    ordered = list(teams.values())
+    tied = defaultdict(list)
+    for t in ordered:
+        tied[round(t.win_pct, 6)].append(t.roster_id)
+
+    def h2h_in_group(t: TeamRecord) -> float:
+        group = tied[round(t.win_pct, 6)]
+        return sum(t.h2h.get(opp, 0.0) for opp in group if opp != t.roster_id)
+
+    ordered.sort(key=lambda t: (-t.win_pct, -h2h_in_group(t), -t.pf, t.pa))
+    return ordered
+
+
+def rosters_fingerprint(rosters: list[Roster]) -> str:
+    """Changes whenever any roster's record or points change (i.e. after a week is scored)."""
+    rows = sorted(
+        (r.roster_id, r.wins, r.losses, r.ties, r.fpts, r.fpts_against, r.owner_id or "")
+        for r in rosters
+    )
+    return hashlib.sha1(repr(rows).encode()).hexdigest()
+
+
+_table_cache: dict[str, tuple[str, list[TeamRecord]]] = {}  # league_id -> (fingerprint, table)
+
+
+def cached_standings(league_id: str, rosters: list[Roster], names: dict,
+                     season: dict[int, list[Matchup]]) -> list[TeamRecord]:
+    """compute_standings(), memoised per league until the rosters change."""
+    weeks = sorted(w for w, m in season.items() if m)
+    fp = f"{rosters_fingerprint(rosters)}:{weeks}:{sorted(names.items())}"
+    hit = _table_cache.get(league_id)
+    if hit is not None and hit[0] == fp:
+        return hit[1]
+    table = compute_standings(rosters, names, season)
+    _table_cache[league_id] = (fp, table)
+    return table
+
+
+def standings_lines(table: list[TeamRecord]) -> list[str]:
+    return [
+        f"**{i}. {t.name}** — {t.record} ({t.win_pct:.3f})\n"
+        f"PF {t.pf:.2f} · PA {t.pa:.2f} · Streak {t.streak} · vs median {t.median_record}"
+        for i, t in enumerate(table, start=1)
+    ]
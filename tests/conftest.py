@@ -0,0 +1,36 @@
+import asyncio
+import json
+
+import pytest
+
+import sleeper
+from cache import TTLCache
+from models import DECODERS
+
+
+class FakeUpstream:
+    """Canned Sleeper bodies by path, counting calls and sequential round trips."""
+
+    def __init__(self, bodies: dict):
+        self.bodies = bodies
+        self.calls: list[str] = []
+        self.rounds = 0
+
+    async def get_decoded(self, kind: str, path: str):
+        depth = self.rounds + 1  # one more than the deepest call finished so far
+        self.calls.append(path)
+        await asyncio.sleep(0.01)
+        self.rounds = max(self.rounds, depth)
+        return DECODERS[kind](json.dumps(self.bodies.get(path, [])).encode())
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """A cold Sleeper cache in front of FakeUpstream (league "L", week 5 of 2025)."""
+    fake = FakeUpstream({
+        "/state/nfl": {"week": 5, "season": "2025"},
+        "/league/L": {"league_id": "L", "name": "League", "season": "2025"},
+    })
+    monkeypatch.setattr(sleeper, "_cache", TTLCache())
+    monkeypatch.setattr(sleeper, "_get_decoded", fake.get_decoded)
+    return fake
@@ -0,0 +1,316 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from discord import app_commands
+
+import bot
+import history
+from config import BotConfig
+from models import Matchup, Roster, User
+
+
+class FakeMessage:
+    def __init__(self, mid):
+        self.id = mid
+        self.jump_url = f"https://discord.com/channels/1/55/{mid}"
+        self.edits = []
+
+    async def pin(self):
+        pass
+
+    async def edit(self, embed=None):
+        self.edits.append(embed)
+
+
+class FakeChannel:
+    id = 55
+    mention = "#live"
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, embed=None, embeds=None, **kwargs):
+        self.sent.append(embed or embeds)
+        return FakeMessage(900 + len(self.sent))
+
+
+class FakeInteraction:
+    def __init__(self, guild_id, channel):
+        self.guild_id = guild_id
+        self.guild = SimpleNamespace(id=guild_id, get_channel=lambda _id: channel)
+        self.user = SimpleNamespace(id=1)
+        self.response = SimpleNamespace(defer=self._noop)
+        self.followup = SimpleNamespace(send=self._record)
+        self.replies = []
+
+    async def _noop(self, **kwargs):
+        pass
+
+    async def _record(self, embed=None, **kwargs):
+        self.replies.append(embed)
+
+
+@pytest.fixture
+def guilds(monkeypatch):
+    configs = {1: BotConfig(league_id="L"), 2: BotConfig(league_id="L")}
+    monkeypatch.setattr(bot, "CONFIGS", configs)
+    monkeypatch.setattr(bot, "save_configs", lambda cfgs: None)
+    monkeypatch.setattr(bot.bot, "live_hash", {2: "other-guild"})
+    monkeypatch.setattr(bot.bot, "scheduler", None)
+    return configs
+
+
+@pytest.mark.asyncio
+async def test_live_enable_posts_scoreboard_for_that_guild(guilds, monkeypatch):
+    channel = FakeChannel()
+    monkeypatch.setattr(bot.bot, "get_channel", lambda cid: channel if cid == channel.id else None)
+
+    async def fake_context(lid, week=None, week_offset=0):
+        return bot.WeekContext(
+            lid, 3, 4, [User("u1", "Sam")], [Roster(1, "u1")], [Matchup(1, 1, 99.5)]
+        )
+
+    monkeypatch.setattr(bot, "load_week_context", fake_context)
+    interaction = FakeInteraction(1, channel)
+    await bot.live.callback(interaction, True, channel)
+
+    assert guilds[1].live_enabled and guilds[1].live_message_id == 901
+    assert len(channel.sent) == 1 and channel.sent[0].title.startswith("Week 3 Results")
+    assert set(bot.bot.live_hash) == {1, 2} and bot.bot.live_hash[2] == "other-guild"
+    assert interaction.replies[0].title.startswith("Live scoreboard started")
+
+
+def test_dms_have_no_config(guilds):
+    with pytest.raises(app_commands.NoPrivateMessage):
+        bot.guild_config(None)
+    assert 0 not in guilds
+
+
+@pytest.mark.asyncio
+async def test_legacy_config_is_adopted_by_the_only_guild(monkeypatch):
+    legacy = BotConfig(league_id="OLD", schedule_enabled=True)
+    monkeypatch.setattr(bot, "CONFIGS", {})
+    monkeypatch.setattr(bot, "_LEGACY_CONFIG", legacy)
+    monkeypatch.setattr(bot, "save_configs", lambda cfgs: None)
+    monkeypatch.setattr(bot.bot, "scheduler", None)
+    monkeypatch.setattr(type(bot.bot), "guilds", property(lambda self: [SimpleNamespace(id=123)]))
+
+    await bot._adopt_legacy_config()
+    assert bot.CONFIGS == {123: legacy} and bot._LEGACY_CONFIG is None
+
+
+@pytest.mark.asyncio
+async def test_player_autocomplete_does_not_wait_for_a_cold_download(monkeypatch):
+    async def cold_download():
+        raise AssertionError("autocomplete must not wait for the players download")
+
+    monkeypatch.setattr(bot, "players_loaded", lambda: False)
+    monkeypatch.setattr(bot, "get_players", cold_download)
+    assert await bot.player_autocomplete(FakeInteraction(1, None), "mahomes") == []
+
+
+def test_roster_embed_splits_long_starters_across_fields():
+    starters = [str(i) for i in range(30)]
+    players = {
+        pid: {"full_name": f"Player With A Rather Long Name {pid}", "position": "WR", "team": "KC"}
+        for pid in starters
+    }
+    e = bot.build_roster_embed("Alpha", Roster(1, "u1", players=starters, starters=starters),
+                               players, ["WR"] * 30)
+
+    assert [f.name for f in e.fields] == ["Starters", "Starters (cont.)"]
+    assert all(len(f.value) <= 1024 for f in e.fields)
+    assert sum(f.value.count("\n") + 1 for f in e.fields) == 30
+
+
+def test_cached_roster_embed_is_restamped_on_every_send(monkeypatch):
+    monkeypatch.setattr(bot, "_roster_embeds", {})
+    builds = []
+
+    def build():
+        builds.append(1)
+        return bot.build_roster_embed("Alpha", Roster(1, "u1"), {}, None)
+
+    now = datetime(2025, 10, 5, 17, 0, tzinfo=UTC)
+    monkeypatch.setattr(bot.discord.utils, "utcnow", lambda: now)
+    first = bot._cached_roster_embed("L", 1, "k1", build)
+    now += timedelta(hours=2)
+    second = bot._cached_roster_embed("L", 1, "k1", build)
+
+    assert len(builds) == 1  # second send reuses the render...
+    assert first.timestamp != second.timestamp == now  # ...but not its timestamp
+    assert second.footer.text == "Roster ID: 1"
+    bot._cached_roster_embed("L", 1, "k2", build)
+    assert len(builds) == 2
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.jobs = {}
+
+    def add_job(self, func, args=(), id=None, **kwargs):
+        self.jobs[id] = (func, args)
+
+
+@pytest.fixture
+def announcing(monkeypatch, tmp_path):
+    """One guild with a preview that was due an hour ago, a fresh history store and a
+    guild cache that stays empty until the gateway reports ready."""
+    fire = datetime.now(bot.TZ) - timedelta(hours=1)
+    cfg = BotConfig(league_id="L", announce_channel_id=FakeChannel.id, schedule_enabled=True,
+                    schedule_dow=fire.weekday(), schedule_hour=fire.hour,
+                    schedule_minute=fire.minute)
+    monkeypatch.setattr(bot, "CONFIGS", {1: cfg})
+    monkeypatch.setattr(history, "_store", history.HistoryStore(str(tmp_path / "history.db")))
+    monkeypatch.setattr(bot.bot, "prepared", {})
+
+    channel = FakeChannel()
+    guilds: dict[int, SimpleNamespace] = {}
+    ready = asyncio.Event()
+    monkeypatch.setattr(bot.bot, "get_guild", lambda gid: guilds.get(gid))
+    monkeypatch.setattr(bot.bot, "wait_until_ready", ready.wait)
+
+    def connect():
+        guilds[1] = SimpleNamespace(id=1, name="Guild", get_channel=lambda _id: channel,
+                                    get_role=lambda _id: None)
+        ready.set()
+
+    renders = []
+
+    async def render(lid, cfg):
+        renders.append(lid)
+        return 7, [bot.card("Week 7 Preview")]
+
+    monkeypatch.setitem(bot._RENDERERS, "preview", render)
+    return SimpleNamespace(channel=channel, connect=connect, renders=renders)
+
+
+@pytest.mark.asyncio
+async def test_catch_up_waits_for_the_guild_cache_and_sends_once(announcing):
+    history.get_store().mark_seen(bot._sent_scope(1, "preview"), [], keep=20)  # known guild
+    sched = FakeScheduler()
+    bot._catch_up_announcements(sched, 1)
+    func, args = sched.jobs["catchup_preview:1"]
+
+    job = asyncio.create_task(func(*args))  # fires straight away, as in setup_hook
+    await asyncio.sleep(0)
+    assert not job.done() and announcing.channel.sent == []
+    announcing.connect()
+    await job
+    assert len(announcing.channel.sent) == 1
+
+    # after another restart the post is known as sent: no catch-up, no second send
+    again = FakeScheduler()
+    bot._catch_up_announcements(again, 1)
+    assert again.jobs == {}
+    await bot._send_announcement(1, "preview")
+    assert len(announcing.channel.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_prepared_post_is_sent_without_rendering_again(announcing):
+    announcing.connect()
+    await bot._prepare_announcement(1, "preview")
+    assert (1, "preview") in bot.bot.prepared and announcing.renders == ["L"]
+
+    await bot._send_announcement(1, "preview")
+    assert announcing.renders == ["L"] and len(announcing.channel.sent) == 1
+    assert bot.bot.prepared == {}
+
+
+def test_week_embeds_list_teams_without_a_matchup_id_as_byes():
+    users = [User("u1", "Sam"), User("u2", "Alex"), User("u3", "Kim")]
+    rosters = [Roster(1, "u1"), Roster(2, "u2"), Roster(3, "u3")]
+    matchups = [Matchup(3, None, 55.0), Matchup(1, 1, 101.5), Matchup(2, 1, 99.0)]
+    ctx = bot.WeekContext("L", 15, 16, users, rosters, matchups)
+
+    for e in (bot.build_week_preview_embed(ctx), bot.build_week_results_embed(ctx)):
+        assert [f.name for f in e.fields] == ["Matchup 1", "Bye"]
+        assert e.fields[1].value == "Kim (bye or unmatched)"
+
+
+@pytest.mark.asyncio
+async def test_week_context_fetches_each_input_once(monkeypatch, tmp_path, upstream):
+    monkeypatch.setattr(history, "_store", history.HistoryStore(str(tmp_path / "history.db")))
+
+    ctx = await bot.load_week_context("L", 3)
+    bot.build_week_preview_embed(ctx)
+    bot.build_week_results_embed(ctx)
+    assert sorted(upstream.calls) == [
+        "/league/L", "/league/L/matchups/3", "/league/L/rosters", "/league/L/users", "/state/nfl"
+    ]
+    assert upstream.rounds == 1  # all concurrent: one round trip
+    assert (ctx.week, ctx.current_week) == (3, 5)
+
+    upstream.calls.clear()
+    ctx = await bot.load_week_context("L")  # current week: matchups wait on the NFL state only
+    assert upstream.calls == ["/league/L/matchups/5"] and ctx.week == 5
+
+
+@pytest.mark.asyncio
+async def test_cache_warmer_preloads_then_refreshes_only_what_expires(monkeypatch, upstream):
+    monkeypatch.setattr(bot, "CONFIGS", {1: BotConfig(league_id="L")})
+    monkeypatch.setattr(bot.bot, "last_warm", None)
+    monkeypatch.setattr(bot, "in_game_window", lambda now: False)
+    warmed = []
+
+    async def ready():
+        pass
+
+    async def fake_players():
+        warmed.append("players")
+        return None
+
+    async def fake_league_job(lid):
+        warmed.append(lid)
+
+    monkeypatch.setattr(bot.bot, "wait_until_ready", ready)
+    monkeypatch.setattr(bot, "get_players", fake_players)
+    monkeypatch.setattr(bot, "get_index", lambda store: None)
+    monkeypatch.setattr(bot, "snapshot_rosters", fake_league_job)
+    monkeypatch.setattr(bot, "backfill", fake_league_job)
+
+    await bot._warm_caches()
+    assert sorted(set(upstream.calls)) == [
+        "/league/L", "/league/L/matchups/5", "/league/L/rosters", "/league/L/users", "/state/nfl"
+    ]
+    assert warmed == ["players", "L", "L"]
+
+    upstream.calls.clear()
+    await bot._warm_caches()  # ticked again before the 5-minute cadence: skipped
+    assert upstream.calls == []
+
+    bot.bot.last_warm -= timedelta(minutes=5)
+    await bot._warm_caches()  # only matchups (30s TTL) would lapse before the next run
+    assert upstream.calls == ["/league/L/matchups/5"]
+
+
+@pytest.mark.asyncio
+async def test_sync_commands_skips_an_unchanged_tree(monkeypatch, tmp_path):
+    monkeypatch.setattr(bot, "_SYNC_STATE_PATH", str(tmp_path / "command_sync.json"))
+    monkeypatch.setattr(bot, "GUILD_ID", 0)
+    syncs = []
+
+    async def fake_sync(guild=None):
+        syncs.append(guild)
+        return bot.bot.tree.get_commands()
+
+    monkeypatch.setattr(bot.bot.tree, "sync", fake_sync)
+
+    assert await bot.sync_commands() == len(bot.bot.tree.get_commands())
+    assert await bot.sync_commands() is None  # fingerprint persisted: nothing to do
+    assert await bot.sync_commands(force=True) is not None  # /resync
+    assert len(syncs) == 2
+
+    @app_commands.command(name="sync_probe", description="Temporary test command.")
+    async def sync_probe(interaction):
+        pass
+
+    bot.bot.tree.add_command(sync_probe)
+    try:
+        assert await bot.sync_commands() is not None  # tree changed: synced again
+    finally:
+        bot.bot.tree.remove_command("sync_probe")
+    assert len(syncs) == 3
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch():
+    cache = TTLCache(maxsize=4)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"week": 3}
+
+    results = await asyncio.gather(*(cache.get_or_fetch("state", 60, fetch) for _ in range(10)))
+    assert calls == 1
+    assert all(r == {"week": 3} for r in results)
+    assert cache.misses == 1 and cache.coalesced == 9
+
+    assert await cache.get_or_fetch("state", 60, fetch) == {"week": 3}
+    assert cache.hits == 1 and calls == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_expiry():
+    cache = TTLCache(maxsize=2)
+
+    async def value(v):
+        return v
+
+    await cache.get_or_fetch("a", 60, lambda: value(1))
+    await cache.get_or_fetch("b", 60, lambda: value(2))
+    await cache.get_or_fetch("a", 60, lambda: value(1))  # a is now most recent
+    await cache.get_or_fetch("c", 60, lambda: value(3))
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+    await cache.get_or_fetch("d", 0, lambda: value(4))
+    assert cache.get("d") is None
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached():
+    cache = TTLCache()
+
+    async def boom():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch("k", 60, boom)
+    assert len(cache) == 0
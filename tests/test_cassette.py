@@ -0,0 +1,53 @@
+import time
+
+import httpx
+import pytest
+
+from cassette import RECORD, REPLAY, Cassette, CassetteMiss, CassetteTransport, cassette_key
+
+
+def _client(transport):
+    return httpx.AsyncClient(transport=transport)
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_without_network(tmp_path):
+    path = str(tmp_path / "c.db")
+    calls = []
+
+    def upstream(req):
+        calls.append(req.url.path)
+        if req.url.path.endswith("/flaky"):
+            return httpx.Response(503)
+        return httpx.Response(200, json={"path": req.url.path}, headers={"etag": '"v1"'})
+
+    recorder = CassetteTransport(Cassette(path), RECORD, httpx.MockTransport(upstream))
+    async with _client(recorder) as c:
+        r = await c.get("https://api.sleeper.app/v1/league/1/matchups/3")
+        assert r.json() == {"path": "/v1/league/1/matchups/3"}
+        assert (await c.get("https://api.sleeper.app/v1/flaky")).status_code == 503
+
+    async with _client(CassetteTransport(Cassette(path), REPLAY)) as c:
+        r = await c.get("http://127.0.0.1:9/v1/league/1/matchups/3")  # any host replays
+        assert r.status_code == 200 and r.json() == {"path": "/v1/league/1/matchups/3"}
+        assert r.headers["etag"] == '"v1"'
+        with pytest.raises(CassetteMiss):
+            await c.get("https://api.sleeper.app/v1/flaky")  # transient failures aren't recorded
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_replay_applies_fixed_latency(tmp_path):
+    cassette = Cassette(str(tmp_path / "c.db"))
+    cassette.put("GET /v1/state/nfl", "https://x/v1/state/nfl", 200, [], b'{"week": 5}')
+    async with _client(CassetteTransport(cassette, REPLAY, latency=0.05)) as c:
+        t0 = time.perf_counter()
+        r = await c.get("https://x/v1/state/nfl")
+        assert time.perf_counter() - t0 >= 0.05
+        assert r.json() == {"week": 5}
+
+
+def test_key_ignores_host_and_query_order():
+    a = httpx.Request("GET", "https://a/v1/players?b=2&a=1")
+    b = httpx.Request("GET", "http://b:8080/v1/players?a=1&b=2")
+    assert cassette_key(a) == cassette_key(b) == "GET /v1/players?a=1&b=2"
@@ -0,0 +1,114 @@
+import httpx
+import pytest
+
+import client
+
+
+@pytest.fixture
+def fast_client(monkeypatch):
+    monkeypatch.setattr(client, "BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(client, "_bucket", client.TokenBucket(6000, 100))
+    monkeypatch.setattr(client, "_breaker", client.CircuitBreaker(threshold=3, reset=60))
+
+    def install(handler):
+        mock = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(client, "_client", mock)
+
+    return install
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(fast_client):
+    statuses = iter([503, 429, 200])
+    fast_client(lambda req: httpx.Response(next(statuses), json={"ok": True}))
+    r = await client.request("GET", "https://sleeper.test/state/nfl")
+    assert r.status_code == 200
+    assert client.breaker_state() == "closed"
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_repeated_failures(fast_client, monkeypatch):
+    monkeypatch.setattr(client, "MAX_RETRIES", 1)
+    calls = []
+
+    def handler(req):
+        calls.append(req)
+        return httpx.Response(500)
+
+    fast_client(handler)
+    with pytest.raises(client.UpstreamUnavailable):
+        await client.request("GET", "https://sleeper.test/a")
+    with pytest.raises(client.UpstreamUnavailable):
+        await client.request("GET", "https://sleeper.test/b")
+    assert client.breaker_state() == "open"
+
+    before = len(calls)
+    with pytest.raises(client.UpstreamUnavailable):
+        await client.request("GET", "https://sleeper.test/c")
+    assert len(calls) == before  # short-circuited without touching upstream
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(fast_client):
+    calls = []
+
+    def handler(req):
+        calls.append(req)
+        return httpx.Response(404)
+
+    fast_client(handler)
+    r = await client.request("GET", "https://sleeper.test/league/missing")
+    assert r.status_code == 404 and len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_lets_one_probe_through(fast_client, monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr(client, "MAX_RETRIES", 0)
+    release = asyncio.Event()
+    calls = []
+
+    async def handler(req):
+        calls.append(req)
+        await release.wait()
+        return httpx.Response(200)
+
+    fast_client(handler)
+    breaker = client._breaker
+    for _ in range(breaker.threshold):
+        breaker.record_failure()
+    breaker._opened_at -= breaker.reset  # the reset window has passed
+
+    probe = asyncio.create_task(client.request("GET", "https://sleeper.test/a"))
+    await asyncio.sleep(0)
+    assert client.breaker_state() == "half_open" and len(calls) == 1
+    with pytest.raises(client.UpstreamUnavailable):
+        # probe still in flight: rejected at once rather than queued behind it
+        await asyncio.wait_for(client.request("GET", "https://sleeper.test/b"), 1)
+    assert len(calls) == 1
+
+    release.set()
+    assert (await probe).status_code == 200
+    assert client.breaker_state() == "closed"
+    await client.request("GET", "https://sleeper.test/c")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_serves_stale_cached_json(fast_client, monkeypatch):
+    import sleeper
+    from cache import TTLCache
+
+    monkeypatch.setattr(sleeper, "_cache", TTLCache())
+    fast_client(lambda req: httpx.Response(200, json={"week": 7, "season": "2025"}))
+    fresh = await sleeper._cached_json("state", "/state/nfl")
+    assert fresh["week"] == 7
+
+    sleeper._cache.set("/state/nfl", fresh, ttl=0)  # expired, kept for fallback
+    for _ in range(client._breaker.threshold):
+        client._breaker.record_failure()
+    assert client.breaker_state() == "open"
+    assert await sleeper._cached_json("state", "/state/nfl") is fresh
+    with pytest.raises(client.UpstreamUnavailable):
+        await sleeper._cached_json("league", "/league/never-fetched")
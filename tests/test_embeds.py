@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pytest
+
+from embeds import PageView, paginate, send_pages
+
+
+class FakeResponse:
+    def __init__(self):
+        self.sent, self.edits = [], []
+
+    async def send_message(self, content=None, **kwargs):
+        self.sent.append((content, kwargs))
+
+    async def edit_message(self, **kwargs):
+        self.edits.append(kwargs)
+
+
+class FakeMessage:
+    def __init__(self):
+        self.edits = []
+
+    async def edit(self, **kwargs):
+        self.edits.append(kwargs)
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, **kwargs):
+        self.sent.append(kwargs)
+        return FakeMessage() if kwargs.get("wait") else None
+
+
+def interaction(user_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        user=SimpleNamespace(id=user_id), response=FakeResponse(), followup=FakeFollowup()
+    )
+
+
+def pages(n: int):
+    return paginate("Results", [f"line {i} " + "x" * 50 for i in range(n)], max_chars=200)
+
+
+@pytest.mark.asyncio
+async def test_only_the_invoking_user_can_turn_pages():
+    owner = interaction(1)
+    await send_pages(owner, pages(10))
+    sent = owner.followup.sent[0]
+    view = sent["view"]
+    assert view.owner_id == 1 and view.message is not None
+
+    stranger = interaction(2)
+    assert await view.interaction_check(stranger) is False
+    assert stranger.response.sent[0][1]["ephemeral"] is True
+    assert await view.interaction_check(owner) is True
+
+
+@pytest.mark.asyncio
+async def test_single_page_has_no_buttons():
+    owner = interaction(1)
+    await send_pages(owner, pages(1))
+    assert "view" not in owner.followup.sent[0]
+
+
+@pytest.mark.asyncio
+async def test_timeout_disables_the_buttons():
+    view = PageView(pages(10), owner_id=1)
+    view.message = FakeMessage()
+    await view.on_timeout()
+    assert all(item.disabled for item in view.children)
+    assert view.message.edits == [{"view": view}]
@@ -0,0 +1,48 @@
+import asyncio
+from types import SimpleNamespace
+
+import discord
+import pytest
+
+from fanout import Delivery, FanoutQueue
+
+
+class FakeChannel:
+    def __init__(self, cid, fail=None):
+        self.id = cid
+        self.fail = fail
+        self.sent = []
+
+    async def send(self, content=None, embeds=None, allowed_mentions=None):
+        await asyncio.sleep(0.01)
+        if self.fail is not None:
+            raise self.fail
+        self.sent.append((content, embeds))
+        return SimpleNamespace(jump_url=f"https://discord.com/channels/1/{self.id}/1")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_shares_embeds_and_reports_each_destination():
+    forbidden = discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "nope")
+    channels = [FakeChannel(i) for i in range(5)] + [FakeChannel(99, fail=forbidden)]
+    embed = discord.Embed(title="Week 3 Preview")
+    results = await FanoutQueue().broadcast(
+        [embed], [Delivery(c, f"#{c.id}", content="@here" if c.id == 0 else None) for c in channels]
+    )
+    assert [r.ok for r in results] == [True] * 5 + [False]
+    assert results[-1].error == "missing permission"
+    assert all(c.sent[0][1][0] is embed for c in channels[:5])
+    assert channels[0].sent[0][0] == "@here"
+
+
+@pytest.mark.asyncio
+async def test_per_channel_limit_spaces_sends_to_one_channel():
+    channel = FakeChannel(1)
+    queue = FanoutQueue()
+    queue._route(1).rate = 100 / 60  # keep the test fast: refill ~1.7 tokens/s
+    queue._route(1).capacity = queue._route(1).tokens = 2
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await queue.broadcast([], [Delivery(channel, "#1") for _ in range(3)])
+    assert len(channel.sent) == 3
+    assert loop.time() - start >= 0.5  # third send waited for a token
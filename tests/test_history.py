@@ -0,0 +1,99 @@
+import pytest
+
+import history
+from models import Matchup
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(history, "_store", history.HistoryStore(str(tmp_path / "history.db")))
+
+    async def fake_season_and_week(league_id):
+        return "2025", 5
+
+    monkeypatch.setattr(history, "_season_and_week", fake_season_and_week)
+    return history.get_store()
+
+
+@pytest.mark.asyncio
+async def test_closed_weeks_are_fetched_once(store, monkeypatch):
+    fetched = []
+
+    async def fake_get_matchups(league_id, week):
+        fetched.append(week)
+        return [Matchup(1, 1, float(week))]
+
+    monkeypatch.setitem(history._FETCHERS, history.MATCHUPS, fake_get_matchups)
+
+    season = await history.season_matchups("L")
+    assert sorted(season) == [1, 2, 3, 4] and sorted(fetched) == [1, 2, 3, 4]
+    assert store.immutable_weeks(history.MATCHUPS, "L", "2025") == {1, 2, 3, 4}
+
+    fetched.clear()
+    reopened = history.HistoryStore(store.path)  # decoded back into models from disk
+    assert reopened.get(history.MATCHUPS, "L", "2025", 3) == ([Matchup(1, 1, 3.0)], True)
+    reopened.close()
+    await history.season_matchups("L")
+    await history.get_week_matchups("L", 5)  # the open week is always refetched
+    await history.get_week_matchups("L", 5)
+    assert fetched == [5, 5]
+
+
+@pytest.mark.asyncio
+async def test_open_week_is_written_only_when_the_payload_changes(store, monkeypatch):
+    payload = [Matchup(1, 1, 50.0)]
+
+    async def fake_get_matchups(league_id, week):
+        return payload
+
+    monkeypatch.setitem(history._FETCHERS, history.MATCHUPS, fake_get_matchups)
+    writes = []
+    store._conn.set_trace_callback(
+        lambda sql: writes.append(sql) if sql.startswith("INSERT") else None
+    )
+
+    await history.get_week_matchups("L", 5)
+    await history.get_week_matchups("L", 5)  # same cached list: nothing to persist
+    assert len(writes) == 1
+    payload = [Matchup(1, 1, 61.5)]
+    assert await history.get_week_matchups("L", 5) == payload
+    assert len(writes) == 2
+
+
+@pytest.mark.asyncio
+async def test_backfill_loads_only_missing_weeks(store, monkeypatch):
+    fetched = []
+
+    async def fake_get_transactions(league_id, week):
+        fetched.append(week)
+        return []
+
+    monkeypatch.setitem(history._FETCHERS, history.TRANSACTIONS, fake_get_transactions)
+    store.put(history.TRANSACTIONS, "L", "2025", 2, [], immutable=True)
+
+    assert await history.backfill("L", kinds=(history.TRANSACTIONS,)) == 3
+    assert sorted(fetched) == [1, 3, 4]
+    assert await history.backfill("L", kinds=(history.TRANSACTIONS,)) == 0
+
+
+def test_seen_ids_are_bounded(store):
+    assert store.seen_ids("feed") is None
+    store.mark_seen("feed", [])
+    assert store.seen_ids("feed") == set()
+    store.mark_seen("feed", ["a", "b", "c"], keep=3)
+    store.mark_seen("feed", ["d"], keep=3)
+    seen = store.seen_ids("feed")
+    assert "d" in seen and len(seen) == 3
+
+
+@pytest.mark.asyncio
+async def test_cold_week_is_one_round_trip(monkeypatch, tmp_path, upstream):
+    monkeypatch.setattr(history, "_store", history.HistoryStore(str(tmp_path / "history.db")))
+
+    await history.get_week_matchups("L", 3)
+    assert sorted(upstream.calls) == ["/league/L", "/league/L/matchups/3", "/state/nfl"]
+    assert upstream.rounds == 1  # season lookup runs alongside the fetch
+
+    upstream.calls.clear()
+    await history.get_week_matchups("L", 3)  # closed and stored: no upstream call at all
+    assert upstream.calls == []
@@ -0,0 +1,42 @@
+import metrics
+
+
+def setup_function():
+    metrics.reset()
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    h = metrics.Histogram((0.1, 0.2, 0.4))
+    for v in (0.05, 0.15, 0.15, 0.3):
+        h.observe(v)
+    assert h.count == 4 and abs(h.sum - 0.65) < 1e-9
+    assert 0.1 <= h.quantile(0.5) <= 0.2
+    assert 0.2 <= h.quantile(0.95) <= 0.4
+
+
+def test_command_phases_and_exposition():
+    metrics.start_command("standings")
+    metrics.lap("defer")
+    metrics.lap("fetch")
+    metrics.finish_command("ok")
+    phases = {dict(labels)["phase"] for labels in metrics.histograms("command_phase_seconds")}
+    assert phases == {"defer", "fetch", "send"}
+    assert metrics.summarize("command_seconds", "command")[0][:2] == ("standings", 1)
+
+    metrics.inc("sleeper_responses_total", endpoint="/state/nfl", status="200")
+    text = metrics.render_prometheus()
+    assert "# TYPE command_seconds histogram" in text
+    assert 'command_seconds_bucket{command="standings",status="ok",le="+Inf"} 1' in text
+    assert 'sleeper_responses_total{endpoint="/state/nfl",status="200"} 1' in text
+
+
+def test_lap_without_trace_is_a_noop():
+    metrics.lap("fetch")
+    metrics.finish_command()
+    assert metrics.histograms("command_phase_seconds") == {}
+
+
+def test_endpoint_of_collapses_ids():
+    url = "https://api.sleeper.app/v1/league/1234/matchups/7"
+    assert metrics.endpoint_of(url) == "/league/{id}/matchups/{id}"
+    assert metrics.endpoint_of("https://api.sleeper.app/v1/state/nfl?x=1") == "/state/nfl"
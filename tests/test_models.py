@@ -0,0 +1,43 @@
+import json
+
+from models import DECODERS, League, Matchup, Roster, Transaction, User
+
+
+def _body(value) -> bytes:
+    return json.dumps(value).encode()
+
+
+def test_roster_points_combine_decimal_fields():
+    [r] = DECODERS["rosters"](_body([{
+        "roster_id": 3, "owner_id": "u3", "players": ["1", "2"], "starters": ["1"], "reserve": None,
+        "settings": {"wins": 4, "losses": 2, "ties": 1, "fpts": 812, "fpts_decimal": 7,
+                     "fpts_against": 790, "fpts_against_decimal": 45},
+    }]))
+    assert r == Roster(3, "u3", ["1", "2"], ["1"], [], [], 4, 2, 1, 812.07, 790.45)
+    assert r.record == "4-2-1"
+
+
+def test_league_users_matchups_and_transactions():
+    league = DECODERS["league"](_body({
+        "league_id": "9", "name": "L", "season": "2025", "total_rosters": 10,
+        "settings": {"playoff_week_start": 15},
+    }))
+    assert league == League("9", "L", "2025", "", 10, [], 15, 6)
+    assert DECODERS["league"](b"null") is None
+
+    [user] = DECODERS["users"](
+        _body([{"user_id": "1", "username": "sam", "metadata": {"team_name": "T"}}])
+    )
+    assert user == User("1", "sam", "T")
+
+    [bye] = DECODERS["matchups"](_body([{"roster_id": 2, "matchup_id": None, "points": None}]))
+    assert bye == Matchup(2, None, 0.0)
+
+    [t] = DECODERS["transactions"](
+        _body([{"transaction_id": 77, "created": 5, "status_updated": None}])
+    )
+    assert isinstance(t, Transaction) and t.transaction_id == "77" and t.when == 5
+
+
+def test_models_use_slots():
+    assert not hasattr(Roster(1), "__dict__")
@@ -0,0 +1,43 @@
+import asyncio
+
+import player_index
+from player_index import PlayerIndex, rebuild_index
+from players_store import PlayersStore, build_players_db
+
+PLAYERS = {
+    "4046": {"full_name": "Patrick Mahomes", "position": "QB", "team": "KC", "search_rank": 20},
+    "4034": {"full_name": "Christian McCaffrey", "position": "RB", "team": "SF", "search_rank": 1},
+    "6794": {
+        "first_name": "Justin", "last_name": "Jefferson", "position": "WR", "team": "MIN",
+        "search_rank": 3,
+    },
+    "9999": {"full_name": "Justin Fields", "position": "QB", "team": "NYJ", "search_rank": 90},
+    "1466": {"full_name": "Travis Kelce", "position": "TE", "team": "KC", "search_rank": 40},
+    "1": {"full_name": "Retired Coach", "position": None},
+}
+
+
+def test_prefix_search_orders_by_rank():
+    index = PlayerIndex(PLAYERS.items())
+    assert len(index) == 5
+    assert [pid for pid, _ in index.search("just")] == ["6794", "9999"]
+    assert index.search("justin qb") == [("9999", "Justin Fields (QB NYJ)")]
+    assert index.search("mahomes", k=1)[0][0] == "4046"
+    assert [pid for pid, _ in index.search("qb")] == ["4046", "9999"]
+    assert index.search("  ") == []
+
+
+def test_fuzzy_fallback_handles_typos():
+    index = PlayerIndex(PLAYERS.items())
+    assert index.search("mcaffrey")[0][0] == "4034"
+    assert index.search("kelse")[0][0] == "1466"  # last-name typos match too
+    assert index.search("mahomse")[0][0] == "4046"
+    assert index.search("jeferson")[0][0] == "6794"
+    assert index.search("zzzzzz") == []
+
+
+def test_rebuild_from_store(tmp_path):
+    path = str(tmp_path / "players.db")
+    build_players_db(path, PLAYERS)
+    asyncio.run(rebuild_index(PlayersStore(path)))
+    assert player_index.get_index().search("jeff")[0][0] == "6794"
@@ -0,0 +1,47 @@
+from players_store import PlayersStore, build_players_db, touch_players_db
+from sleeper import player_label
+
+
+def test_store_roundtrip_and_bulk_lookup(tmp_path):
+    path = str(tmp_path / "players.db")
+    players = {
+        "4046": {
+            "full_name": "Patrick Mahomes", "position": "QB", "team": "KC", "college": "Texas Tech"
+        },
+        "6794": {"first_name": "Justin", "last_name": "Jefferson", "position": "WR", "team": "MIN"},
+        "DEN": {"first_name": "Denver", "last_name": "Broncos", "position": "DEF", "team": "DEN"},
+    }
+    assert build_players_db(path, players) == 3
+
+    store = PlayersStore(path)
+    assert store.loaded and len(store) == 3
+    assert "4046" in store and "nope" not in store
+    assert player_label(store.get("4046")) == "Patrick Mahomes (QB KC)"
+    assert player_label(store["6794"]) == "Justin Jefferson (WR MIN)"
+    assert store.get("missing") is None
+
+    many = store.get_many(["6794", "DEN", "missing", "6794"])
+    assert set(many) == {"6794", "DEN"}
+    assert "college" not in store.get("4046")
+
+
+def test_store_without_file_is_empty(tmp_path):
+    store = PlayersStore(str(tmp_path / "absent.db"))
+    assert not store.loaded
+    assert len(store) == 0 and store.get("1") is None and store.get_many(["1"]) == {}
+
+
+def test_replace_with_swaps_open_store_and_touch_keeps_fetched_at(tmp_path):
+    path, staged = str(tmp_path / "players.db"), str(tmp_path / "players.db.new")
+    build_players_db(path, {"1": {"full_name": "Old Player"}}, {"fetched_at": "100"})
+    store = PlayersStore(path)
+    build_players_db(staged, {"1": {"full_name": "New Player"}, "2": {"full_name": "Rookie"}})
+
+    store.replace_with(staged)
+    assert store.loaded and len(store) == 2 and store["1"]["full_name"] == "New Player"
+
+    fetched_at = store.meta()["fetched_at"]
+    touch_players_db(path)
+    store.reopen()
+    assert store.meta()["fetched_at"] == fetched_at  # data unchanged: same cache key
+    assert store.age_seconds() < 5
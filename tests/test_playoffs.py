@@ -0,0 +1,45 @@
+import pytest
+
+import playoffs
+
+
+def test_simulation_is_seeded_and_respects_spots():
+    history = [
+        [150.0, 140.0, 160.0], [80.0, 90.0, 85.0], [110.0, 100.0, 120.0], [95.0, 105.0, 100.0]
+    ]
+    schedule = [[1, 0, 3, 2], [2, 3, 0, 1]]
+    args = (history, [3.0, 0.0, 2.0, 1.0], [450.0, 255.0, 330.0, 300.0], schedule, 2, 4000)
+
+    a = playoffs.simulate_odds(*args, seed=7)
+    b = playoffs.simulate_odds(*args, seed=7)
+    assert a == b
+    assert sum(a["playoffs"]) == pytest.approx(2.0)
+    assert sum(a["top_seed"]) == pytest.approx(1.0)
+    assert a["playoffs"][0] > 0.99 and a["playoffs"][1] < 0.01
+    # Two games left for everyone
+    assert sum(a["projected_wins"]) == pytest.approx(6.0 + 4.0)
+
+
+def test_no_games_left_uses_current_standings():
+    res = playoffs.simulate_odds([[100.0], [90.0]], [1.0, 0.0], [100.0, 90.0], [], 1, 500, seed=1)
+    assert res["playoffs"] == [1.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_cached_odds_pick_up_renamed_teams(monkeypatch):
+    runs = []
+
+    async def fake_simulate(roster_ids, *args):
+        runs.append(roster_ids)
+        return {"playoffs": [0.75, 0.25], "top_seed": [0.6, 0.4], "projected_wins": [9.0, 5.0]}
+
+    monkeypatch.setattr(playoffs, "_simulate", fake_simulate)
+    monkeypatch.setattr(playoffs, "_odds_cache", {})
+    args = ({1: [], 2: []}, {}, {1: 3.0, 2: 1.0}, {1: 300.0, 2: 250.0}, 1, 1000, None)
+
+    first = await playoffs.playoff_odds("L", [1, 2], {1: "Ann", 2: "Bo"}, *args)
+    renamed = await playoffs.playoff_odds("L", [1, 2], {1: "Ann's Army", 2: "Bo"}, *args)
+    assert len(runs) == 1  # same inputs: the simulation is not rerun
+    assert [o.name for o in first] == ["Ann", "Bo"]
+    assert [o.name for o in renamed] == ["Ann's Army", "Bo"]
+    assert renamed[0].playoffs == first[0].playoffs
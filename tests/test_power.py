@@ -0,0 +1,37 @@
+import numpy as np
+
+from models import Matchup, Roster
+from power import PowerTable, power_rankings
+
+
+def _week(scores, pairs):
+    mids = {rid: mid for mid, pair in enumerate(pairs, start=1) for rid in pair}
+    return [Matchup(rid, mids.get(rid), pts) for rid, pts in scores.items()]
+
+
+SEASON = {
+    1: _week({1: 120.0, 2: 100.0, 3: 90.0, 4: 80.0}, [(1, 2), (3, 4)]),
+    2: _week({1: 70.0, 2: 130.0, 3: 110.0, 4: 95.0}, [(1, 3), (2, 4)]),
+}
+ROSTERS = [Roster(rid) for rid in (1, 2, 3, 4)]
+
+
+def test_allplay_expected_wins_and_luck():
+    rows = {r.roster_id: r for r in power_rankings("L", ROSTERS, {}, SEASON)}
+    # Week 1: team 1 beats all 3; week 2: team 1 beats nobody
+    assert (rows[1].allplay_wins, rows[1].allplay_losses) == (3.0, 3.0)
+    assert rows[1].expected_wins == 1.0 and rows[1].actual_wins == 1.0
+    # Team 3 scored third-best in week 1, then second-best in week 2
+    assert rows[3].allplay_wins == 1 + 2 and rows[3].actual_wins == 2.0
+    assert rows[3].luck == 2.0 - 1.0
+    assert sum(r.allplay_wins for r in rows.values()) == 12  # 6 pairs per week
+
+
+def test_new_week_only_adds_a_column():
+    table = PowerTable([1, 2, 3, 4])
+    assert table.update({1: SEASON[1]}) == 1
+    first = table.allplay[:, 0].copy()
+    assert table.update(SEASON) == 1
+    assert table.scores.shape == (4, 2)
+    np.testing.assert_array_equal(table.allplay[:, 0], first)
+    assert table.update(SEASON) == 0
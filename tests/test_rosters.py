@@ -0,0 +1,46 @@
+from dataclasses import replace
+
+from models import Roster
+from rosters import group_roster, roster_fingerprint, roster_player_ids
+
+PLAYERS = {
+    "1": {"full_name": "Qb One", "position": "QB", "team": "KC", "search_rank": 5},
+    "2": {"full_name": "Rb Two", "position": "RB", "team": "SF", "search_rank": 2},
+    "3": {"full_name": "Wr Three", "position": "WR", "team": "MIN", "search_rank": 9},
+    "4": {"full_name": "Rb Four", "position": "RB", "team": "DAL", "search_rank": 40},
+    "5": {"full_name": "Rb Five", "position": "RB", "team": "NYG", "search_rank": 30},
+    "6": {"full_name": "Te Six", "position": "TE", "team": "BAL", "search_rank": 50},
+    "7": {"full_name": "Wr Seven", "position": "WR", "team": "LV", "search_rank": 80},
+}
+ROSTER = Roster(
+    roster_id=1,
+    starters=["1", "2", "0"],
+    players=["1", "2", "3", "4", "5", "6", "7"],
+    reserve=["6"],
+    taxi=["7"],
+)
+
+
+def test_ids_are_collected_once():
+    assert roster_player_ids(ROSTER) == ["1", "2", "3", "4", "5", "6", "7"]
+
+
+def test_group_by_slot_and_bench_position():
+    g = group_roster(ROSTER, PLAYERS, ["QB", "RB", "WR", "BN", "BN"])
+    assert g.starters == [("QB", "Qb One (QB KC)"), ("RB", "Rb Two (RB SF)"), ("WR", "— empty —")]
+    assert list(g.bench) == ["RB", "WR"]
+    assert g.bench["RB"] == ["Rb Five (RB NYG)", "Rb Four (RB DAL)"]
+    assert g.reserve == ["Te Six (TE BAL)"] and g.taxi == ["Wr Seven (WR LV)"]
+
+
+def test_unknown_players_still_render():
+    g = group_roster(Roster(2, starters=["99"], players=["99", "98"]), {}, None)
+    assert g.starters == [("FLEX", "Player 99")]
+    assert g.bench == {"?": ["Player 98"]}
+
+
+def test_fingerprint_ignores_bench_order_only():
+    shuffled = replace(ROSTER, players=list(reversed(ROSTER.players)))
+    assert roster_fingerprint(shuffled) == roster_fingerprint(ROSTER)
+    swapped = replace(ROSTER, starters=["1", "4", "0"])
+    assert roster_fingerprint(swapped) != roster_fingerprint(ROSTER)
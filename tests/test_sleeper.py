@@ -15,3 +15,73 @@ async def test_get_league_is_coroutine(monkeypatch):
     assert data["name"] == "Test League"
     assert data["season"] == "2025"
     assert data["total_rosters"] == 12
+
+
+class FakePlayersResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def raise_for_status(self):
+        assert self.status_code == 200
+
+    async def aiter_bytes(self):
+        for i in range(0, len(self._body), 16):
+            yield self._body[i : i + 16]
+
+
+@pytest.fixture
+def players_upstream(monkeypatch, tmp_path):
+    """refresh_players against a tmp players.db and a scripted /players/nfl."""
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import asynccontextmanager
+
+    import sleeper
+
+    sent, replies = [], []
+
+    @asynccontextmanager
+    async def fake_stream(method, url, headers=None, **kwargs):
+        sent.append(dict(headers or {}))
+        status, players, etag = replies.pop(0)
+        yield FakePlayersResponse(status, json.dumps(players).encode(), {"etag": etag})
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(sleeper, "stream", fake_stream)
+    monkeypatch.setattr(sleeper, "_get_players_pool", lambda: pool)
+    monkeypatch.setattr(sleeper, "_PLAYERS_DB_PATH", str(tmp_path / "players.db"))
+    monkeypatch.setattr(sleeper, "_players", None)
+    monkeypatch.setattr(sleeper, "_players_listeners", [])
+    yield sent, replies
+    sleeper._players_store().close()
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_refresh_players_swaps_in_place_and_revalidates_with_etag(players_upstream):
+    import os
+
+    import sleeper
+
+    sent, replies = players_upstream
+    replies.append((200, {"1": {"full_name": "Old Player", "position": "QB"}}, '"v1"'))
+    assert await sleeper.refresh_players() is True
+    store = sleeper._players_store()
+    assert sent == [{}] and store["1"]["full_name"] == "Old Player"
+
+    replies.append((200, {"1": {"full_name": "New Player"}, "2": {"full_name": "Rookie"}}, '"v2"'))
+    assert await sleeper.refresh_players(force=True) is True
+    assert sent[-1]["If-None-Match"] == '"v1"'
+    assert sleeper._players_store() is store  # same open handle, new table swapped under it
+    assert len(store) == 2 and store["1"]["full_name"] == "New Player"
+    assert sorted(os.listdir(os.path.dirname(store.path))) == ["players.db"]
+
+    fetched_at = store.meta()["fetched_at"]
+    replies.append((304, {}, '"v2"'))
+    assert await sleeper.refresh_players(force=True) is False
+    assert sent[-1]["If-None-Match"] == '"v2"'
+    assert store.meta()["fetched_at"] == fetched_at  # 304: same data, only the age moves
+    assert float(store.meta()["checked_at"]) >= float(fetched_at)
+    assert len(store) == 2
@@ -0,0 +1,69 @@
+from models import Matchup, Roster, settings_points
+from standings import cached_standings, compute_standings
+
+
+def _week(*games):
+    out = []
+    for mid, (a, pa), (b, pb) in games:
+        out += [
+            Matchup(a, mid, pa),
+            Matchup(b, mid, pb),
+        ]
+    return out
+
+
+ROSTERS = [Roster(rid, owner_id=f"u{rid}") for rid in (1, 2, 3, 4)]
+NAMES = {1: "Alpha", 2: "Bravo", 3: "Charlie", 4: "Delta"}
+
+
+def test_records_streaks_and_median():
+    season = {
+        1: _week((1, (1, 120.5), (2, 100.0)), (2, (3, 90.0), (4, 80.0))),
+        2: _week((1, (1, 110.0), (3, 95.0)), (2, (2, 130.0), (4, 70.0))),
+        3: _week((1, (1, 85.0), (4, 99.0)), (2, (2, 101.0), (3, 88.0))),
+    }
+    table = compute_standings(ROSTERS, NAMES, season)
+    by_id = {t.roster_id: t for t in table}
+
+    # Both 2-1: Alpha beat Bravo in week 1, which outranks Bravo's higher points for
+    assert [t.name for t in table][:2] == ["Alpha", "Bravo"]
+    alpha = by_id[1]
+    assert alpha.record == "2-1" and alpha.streak == "L1"
+    assert round(alpha.pf, 2) == 315.5 and round(alpha.pa, 2) == 294.0
+    assert alpha.median_record == "2-1"
+    assert by_id[2].streak == "W2"
+
+
+def test_head_to_head_breaks_exact_ties():
+    season = {
+        1: _week((1, (1, 100.0), (2, 90.0)), (2, (3, 50.0), (4, 40.0))),
+        2: _week((1, (2, 100.0), (3, 90.0)), (2, (1, 90.0), (4, 40.0))),
+    }
+    table = compute_standings(ROSTERS, NAMES, season)
+    # Alpha and Bravo are both 2-0 with 190 PF; Alpha won the head-to-head
+    assert [t.roster_id for t in table[:2]] == [1, 2]
+
+
+def test_head_to_head_outranks_points_for():
+    season = {
+        1: _week((1, (1, 101.0), (2, 100.0)), (2, (3, 90.0), (4, 80.0))),
+        2: _week((1, (1, 80.0), (3, 95.0)), (2, (2, 140.0), (4, 70.0))),
+    }
+    table = compute_standings(ROSTERS, NAMES, season)
+    by_id = {t.roster_id: t for t in table}
+    # Alpha and Bravo are both 1-1 and Bravo has far more PF, but Alpha won their game
+    assert by_id[1].record == by_id[2].record == "1-1" and by_id[2].pf > by_id[1].pf
+    assert [t.roster_id for t in table] == [3, 1, 2, 4]
+
+
+def test_falls_back_to_roster_settings_and_caches():
+    raw = [
+        {"roster_id": 1, "settings": {"wins": 1, "losses": 1, "fpts": 100, "fpts_decimal": 55}},
+        {"roster_id": 2, "settings": {"wins": 2, "fpts": 90, "fpts_decimal": 1}},
+    ]
+    assert settings_points(raw[0]["settings"], "fpts") == 100.55
+    rosters = [Roster.from_json(r) for r in raw]
+    assert rosters[0].fpts == 100.55 and rosters[1].fpts == 90.01
+    table = cached_standings("L", rosters, {}, {})
+    assert [t.roster_id for t in table] == [2, 1]
+    assert cached_standings("L", rosters, {}, {}) is table
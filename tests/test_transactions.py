@@ -0,0 +1,55 @@
+import pytest
+
+import history
+import transactions
+from models import Transaction
+
+
+def test_lookback_weeks():
+    assert transactions.lookback_weeks(7, 5) == [4, 5]
+    assert transactions.lookback_weeks(14, 5) == [3, 4, 5]
+    assert transactions.lookback_weeks(30, 1) == [1]
+
+
+def test_format_trade_and_waiver():
+    names = {1: "Alpha", 2: "Bravo"}
+    players = {"10": {"full_name": "Joe Burrow", "position": "QB", "team": "CIN"}}
+    trade = Transaction.from_json({
+        "type": "trade", "roster_ids": [1, 2], "adds": {"10": 2}, "drops": {"10": 1},
+        "draft_picks": [{"season": "2026", "round": 1, "owner_id": 1}],
+    })
+    line = transactions.format_transaction(trade, names, players)
+    assert "Bravo gets Joe Burrow (QB CIN)" in line and "Alpha gets 2026 R1 pick" in line
+
+    waiver = Transaction.from_json(
+        {"type": "waiver", "roster_ids": [1], "adds": {"10": 1}, "settings": {"waiver_bid": 12}}
+    )
+    line = transactions.format_transaction(waiver, names, players)
+    assert "**Alpha** (Waiver) ➕ Joe Burrow (QB CIN) ($12)" in line
+
+
+@pytest.mark.asyncio
+async def test_new_transactions_diff_against_seen(monkeypatch, tmp_path):
+    monkeypatch.setattr(history, "_store", history.HistoryStore(str(tmp_path / "history.db")))
+    feed = [
+        {"transaction_id": "1", "status": "complete", "status_updated": 200},
+        {"transaction_id": "2", "status": "failed", "status_updated": 100},
+    ]
+
+    async def fake_get_transactions(league_id, week):
+        return [Transaction.from_json(t) for t in feed]
+
+    monkeypatch.setattr(transactions, "get_transactions", fake_get_transactions)
+
+    assert await transactions.new_transactions("L", 3, "g") == []  # first poll only records
+    feed += [
+        {"transaction_id": "4", "status": "complete", "status_updated": 400},
+        {"transaction_id": "3", "status": "complete", "status_updated": 300},
+    ]
+    fresh = await transactions.new_transactions("L", 3, "g")
+    assert [t.transaction_id for t in fresh] == ["3", "4"]
+    # not posted yet (e.g. the send failed): still new on the next poll
+    again = await transactions.new_transactions("L", 3, "g")
+    assert [t.transaction_id for t in again] == ["3", "4"]
+    transactions.mark_posted("g", fresh)
+    assert await transactions.new_transactions("L", 3, "g") == []
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+from history import get_store, get_week_transactions
+from models import Transaction
+from sleeper import get_transactions, player_label
+
+SEEN_KEEP = 500  # transaction ids remembered per feed
+
+
+def lookback_weeks(days: int, current_week: int) -> list[int]:
+    """Weeks (legs) that can contain transactions from the last `days` days."""
+    first = max(1, current_week - math.ceil(days / 7))
+    return list(range(first, max(1, current_week) + 1))
+
+
+async def weeks_transactions(league_id: str, weeks: list[int]) -> list[Transaction]:
+    """Transactions for the given weeks, fetched concurrently. Closed weeks are served
+    from the season-history store, so repeat calls only fetch the current week."""
+    per_week = await asyncio.gather(*(get_week_transactions(league_id, w) for w in weeks))
+    return [t for txns in per_week for t in txns]
+
+
+async def recent_transactions(league_id: str, days: int, current_week: int) -> list[Transaction]:
+    """Completed transactions from the last `days` days, newest first."""
+    txns = await weeks_transactions(league_id, lookback_weeks(days, current_week))
+    cutoff_ms = (time.time() - days * 86400) * 1000
+    recent = [t for t in txns if t.status == "complete" and t.when >= cutoff_ms]
+    recent.sort(key=lambda t: t.when, reverse=True)
+    return recent
+
+
+async def new_transactions(league_id: str, week: int, scope: str) -> list[Transaction]:
+    """Completed transactions for `week` not yet seen by the feed `scope`, oldest first.
+
+    The first poll of a scope only records what is already there, so enabling
+    the feed mid-week doesn't replay the whole week. Later results stay unseen
+    until the caller has posted them and calls `mark_posted`.
+    """
+    txns = await get_transactions(league_id, week) or []
+    done = {t.transaction_id: t for t in txns if t.status == "complete" and t.transaction_id}
+    store = get_store()
+    seen = store.seen_ids(scope)
+    if seen is None:
+        store.mark_seen(scope, done, keep=SEEN_KEEP)
+        return []
+    fresh = [t for tid, t in done.items() if tid not in seen]
+    fresh.sort(key=lambda t: t.when)
+    return fresh
+
+
+def mark_posted(scope: str, txns: list[Transaction]) -> None:
+    """Record transactions as seen by the feed `scope` once they have been posted."""
+    if txns:
+        get_store().mark_seen(scope, [t.transaction_id for t in txns], keep=SEEN_KEEP)
+
+
+def transaction_player_ids(txns: list[Transaction]) -> set[str]:
+    ids: set[str] = set()
+    for t in txns:
+        ids.update(t.adds)
+        ids.update(t.drops)
+    return ids
+
+
+def format_transaction(t: Transaction, roster_name: dict, players: dict) -> str:
+    """One-line summary of a Sleeper transaction (players: {player_id: player_dict})."""
+    def team(rid) -> str:
+        return roster_name.get(rid, f"Roster {rid}")
+
+    def names(ids) -> str:
+        return ", ".join(player_label(players.get(pid)) for pid in ids)
+
+    ts = t.when // 1000
+    when = f"<t:{ts}:d>" if ts else ""
+    adds, drops, kind = t.adds, t.drops, t.type
+
+    if kind == "trade":
+        parts = []
+        for rid in t.roster_ids:
+            got = [pid for pid, to in adds.items() if to == rid]
+            items = [names(got)] if got else []
+            items += [
+                f"{p.get('season')} R{p.get('round')} pick"
+                for p in t.draft_picks if p.get("owner_id") == rid
+            ]
+            items += [
+                f"${b.get('amount')} FAAB"
+                for b in t.waiver_budget if b.get("receiver") == rid
+            ]
+            parts.append(f"{team(rid)} gets {', '.join(items) or 'nothing'}")
+        return f"{when} 🔁 **Trade** — " + "; ".join(parts)
+
+    rid = t.roster_ids[0] if t.roster_ids else None
+    bid = t.waiver_bid
+    bits = []
+    if adds:
+        bid_text = f" (${bid})" if kind == "waiver" and bid is not None else ""
+        bits.append(f"➕ {names(adds)}{bid_text}")
+    if drops:
+        bits.append(f"➖ {names(drops)}")
+    labels = {"waiver": "Waiver", "free_agent": "Free agent", "commissioner": "Commish"}
+    label = labels.get(kind, "Move")
+    return f"{when} **{team(rid)}** ({label}) " + " / ".join(bits or ["no players"])